@@ -0,0 +1,206 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from point import Point
+from point_locator import GridLocator, JumpAndWalkLocator, LastCellLocator
+from spatial_sort import spatial_sort
+from voronoi_diagram import VoronoiDiagram
+
+WORKLOADS = ("uniform", "clustered", "degenerate", "grid")
+LOCATORS = {"last": LastCellLocator, "grid": GridLocator, "jump": JumpAndWalkLocator}
+DEFAULT_SIZES = (100, 1000, 10000)
+
+def canvas_size(n: int) -> float:
+    """Ukuran boundary untuk n site: minimal 600 (ukuran canvas GUI), bertambah sesuai sqrt(n)."""
+    return max(600.0, math.sqrt(n) * 10)
+
+def generate_points(workload: str, n: int, size: float, rng: random.Random) -> list[Point]:
+    """Membuat n site untuk workload tertentu di dalam area [0, size] x [0, size]."""
+    if workload == "uniform":
+        return [Point(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(n)]
+
+    elif workload == "clustered":
+        # site menumpuk di sekitar beberapa pusat cluster (distribusi normal)
+        centers = [(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(max(1, int(math.sqrt(n) / 4)))]
+        spread = size / 50
+        points = []
+        while len(points) < n:
+            cx, cy = rng.choice(centers)
+            x, y = rng.gauss(cx, spread), rng.gauss(cy, spread)
+            if 0 <= x <= size and 0 <= y <= size:
+                points.append(Point(x, y))
+        return points
+
+    elif workload == "degenerate":
+        # seperti input/input_examples2.txt: site di sepanjang diagonal dan garis horizontal
+        half = n // 2
+        step = size / (half + 1)
+        points = [Point((i + 1) * step, (i + 1) * step) for i in range(half)]
+        step = size / (n - half + 1)
+        points += [Point((i + 1) * step, size / 2 + step / 2) for i in range(n - half)]
+        return points
+
+    elif workload == "grid":
+        # lattice persegi: banyak empat site cocircular
+        side = math.ceil(math.sqrt(n))
+        step = size / (side + 1)
+        return [Point((i % side + 1) * step, (i // side + 1) * step) for i in range(n)]
+
+    raise ValueError(f"Unknown workload: {workload}")
+
+def percentiles(values: list[float]) -> dict:
+    """Menghitung persentil latency (nearest rank) dalam mikrodetik."""
+    if not values:
+        return None
+    values = sorted(values)
+
+    def rank(q):
+        return values[min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))] * 1e6
+
+    return {"p50": rank(0.50), "p90": rank(0.90), "p99": rank(0.99), "max": values[-1] * 1e6,
+            "mean": sum(values) / len(values) * 1e6}
+
+def build(points: list[Point], size: float, args, latencies: list = None) -> tuple[VoronoiDiagram, int]:
+    """Membangun diagram dari points, mencatat latency tiap insert jika 'latencies' diberikan."""
+    diagram = VoronoiDiagram(size, locator=LOCATORS[args.locator](), backend=args.backend, storage=args.storage,
+                             workers=args.workers)
+    if args.backend != "incremental":
+        return diagram, diagram.add_points(points)
+
+    added = 0
+    clock = time.perf_counter
+    for p in spatial_sort(points, diagram.boundary, args.order, random.Random(args.seed)):
+        start = clock()
+        ok = diagram.add_point(p)
+        if latencies is not None:
+            latencies.append(clock() - start)
+        if ok:
+            added += 1
+    return diagram, added
+
+def peak_memory(points: list[Point], size: float, args) -> int:
+    """Mengukur puncak alokasi memori (byte) selama konstruksi, di run terpisah dari pengukuran waktu."""
+    tracemalloc.start()
+    try:
+        diagram, _ = build(points, size, args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_case(workload: str, n: int, args) -> dict:
+    """Menjalankan satu kombinasi workload dan ukuran, mengembalikan hasilnya sebagai dict."""
+    rng = random.Random(args.seed)
+    size = canvas_size(n)
+    points = generate_points(workload, n, size, rng)
+
+    # konstruksi
+    latencies = []
+    start = time.perf_counter()
+    diagram, added = build(points, size, args, latencies if args.backend == "incremental" else None)
+    elapsed = time.perf_counter() - start
+    result = {
+        "workload": workload,
+        "n": n,
+        "construction": {
+            "seconds": elapsed,
+            "inserted": added,
+            "rejected": n - added,
+            "throughput": n / elapsed if elapsed > 0 else None,
+            "latency_us": percentiles(latencies),
+            "mean_walk": diagram.locator.mean_walk_length(),
+        },
+    }
+
+    # point location: query acak di dalam boundary
+    queries = [Point(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(min(n, args.queries))]
+    diagram.locator.reset_counters()
+    latencies = []
+    clock = time.perf_counter
+    for q in queries:
+        t = clock()
+        diagram.find_cell(q)
+        latencies.append(clock() - t)
+    total = sum(latencies)
+    result["locate"] = {
+        "queries": len(queries),
+        "seconds": total,
+        "throughput": len(queries) / total if total > 0 else None,
+        "latency_us": percentiles(latencies),
+        "mean_walk": diagram.locator.mean_walk_length(),
+    }
+
+    # lingkaran kosong terbesar
+    start = time.perf_counter()
+    circles = diagram.largest_empty_circles()
+    result["empty_circles"] = {"seconds": time.perf_counter() - start, "found": len(circles)}
+
+    if not args.skip_memory:
+        result["construction"]["peak_memory_bytes"] = peak_memory(points, size, args)
+    return result
+
+def compare(baseline: dict, current: dict) -> list[dict]:
+    """Membandingkan dua hasil benchmark: rasio waktu current / baseline untuk setiap case."""
+    old = {(c["workload"], c["n"]): c for c in baseline["cases"]}
+    rows = []
+    for case in current["cases"]:
+        before = old.get((case["workload"], case["n"]))
+        if before is None:
+            continue
+        row = {"workload": case["workload"], "n": case["n"]}
+        for phase in ("construction", "locate", "empty_circles"):
+            if before[phase]["seconds"] > 0:
+                row[phase] = case[phase]["seconds"] / before[phase]["seconds"]
+        rows.append(row)
+    return rows
+
+def parse_args(argv=None):
+    """Membaca argumen command line."""
+    parser = argparse.ArgumentParser(description="Benchmark headless untuk diagram voronoi (output JSON).")
+    parser.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES),
+                        help="jumlah site per case, misal 100 1000 10000 100000 1000000")
+    parser.add_argument("--backend", choices=VoronoiDiagram.BACKENDS, default="incremental")
+    parser.add_argument("--storage", choices=("list", "compact"), default="list")
+    parser.add_argument("--workers", type=int, help="jumlah proses untuk backend parallel (default: jumlah CPU)")
+    parser.add_argument("--locator", choices=sorted(LOCATORS), default="grid")
+    parser.add_argument("--order", choices=("brio", "hilbert", "input"), default="brio")
+    parser.add_argument("--queries", type=int, default=10000, help="jumlah query find_cell maksimum per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-memory", action="store_true", help="lewati run tambahan untuk mengukur memori")
+    parser.add_argument("--baseline", help="file JSON hasil run sebelumnya untuk dibandingkan")
+    parser.add_argument("--output", help="tulis JSON ke file ini (default: stdout)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fungsi utama untuk menjalankan benchmark."""
+    args = parse_args(argv)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("baseline", "output")},
+        "cases": [],
+    }
+
+    for workload in args.workloads:
+        for n in args.sizes:
+            report["cases"].append(run_case(workload, n, args))
+            print(f"{workload} n={n} done", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            report["ratio_to_baseline"] = compare(json.load(file), report)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
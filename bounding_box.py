@@ -18,6 +18,62 @@ class BoundingBox:
         return ((p.x > self.x_min - self.EPSILON) and (p.x < self.x_max + self.EPSILON)
                 and (p.y > self.y_min - self.EPSILON) and (p.y < self.y_max + self.EPSILON))
 
+    def ray_exit(self, x: float, y: float, dx: float, dy: float):
+        """Mengembalikan titik di mana sinar dari (x, y) dengan arah (dx, dy) keluar dari bounding box."""
+        t = float('inf')
+        if dx > self.EPSILON:
+            t = min(t, (self.x_max - x) / dx)
+        elif dx < -self.EPSILON:
+            t = min(t, (self.x_min - x) / dx)
+        if dy > self.EPSILON:
+            t = min(t, (self.y_max - y) / dy)
+        elif dy < -self.EPSILON:
+            t = min(t, (self.y_min - y) / dy)
+        return Point(x + t * dx, y + t * dy)
+
+    def clip_polygon(self, vertices: list[tuple[float, float]]) -> list[tuple[float, float]]:
+        """Memotong poligon (list (x, y)) dengan bounding box (Sutherland-Hodgman)."""
+        edges = [(0, 1, self.x_min), (0, -1, -self.x_max), (1, 1, self.y_min), (1, -1, -self.y_max)]
+        for axis, sign, limit in edges:
+            if not vertices:
+                break
+            # titik di dalam jika sign * koordinat >= limit
+            result = []
+            previous = vertices[-1]
+            for current in vertices:
+                inside_previous = sign * previous[axis] >= limit
+                inside_current = sign * current[axis] >= limit
+                if inside_current != inside_previous:
+                    t = (limit - sign * previous[axis]) / (sign * (current[axis] - previous[axis]))
+                    result.append((previous[0] + t * (current[0] - previous[0]),
+                                   previous[1] + t * (current[1] - previous[1])))
+                if inside_current:
+                    result.append(current)
+                previous = current
+            vertices = result
+        return vertices
+
+    def clip_segments(self, segments):
+        """Memotong array segmen (k, 4) berisi (x0, y0, x1, y1) dengan bounding box (Liang-Barsky, NumPy).
+
+        Mengembalikan (segmen yang terpotong, mask segmen asal yang tidak seluruhnya di luar)."""
+        import numpy as np
+
+        x0, y0, x1, y1 = segments.T
+        dx, dy = x1 - x0, y1 - y0
+        t0 = np.zeros(len(segments))
+        t1 = np.ones(len(segments))
+        outside = np.zeros(len(segments), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for p, q in ((-dx, x0 - self.x_min), (dx, self.x_max - x0),
+                         (-dy, y0 - self.y_min), (dy, self.y_max - y0)):
+                r = q / p
+                t0 = np.where(p < 0, np.maximum(t0, r), t0)
+                t1 = np.where(p > 0, np.minimum(t1, r), t1)
+                outside |= (p == 0) & (q < 0)
+        keep = ~outside & (t0 < t1)
+        return np.column_stack((x0 + t0 * dx, y0 + t0 * dy, x0 + t1 * dx, y0 + t1 * dy))[keep], keep
+
     def __str__(self):
         """Mengembalikan representasi string dari bounding box."""
         return f"min=({self.x_min}, {self.y_min}), max=({self.x_max}, {self.y_max})"
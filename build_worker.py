@@ -0,0 +1,92 @@
+import queue
+import threading
+import time
+from point_io import read_points
+from spatial_sort import spatial_sort
+
+class BuildWorker(threading.Thread):
+    """Thread yang membangun diagram dan menghitung lingkaran kosong terbesar di luar main loop Tk.
+
+    Worker menulis langsung ke 'diagram'; selama worker berjalan, GUI tidak boleh membaca atau
+    mengubah diagram dan hanya memakai pesan dari 'messages' (queue.Queue):
+
+    - ("progress", done, total): jumlah titik yang sudah diproses.
+    - ("partial", cells): cell yang berubah sejak laporan terakhir, sebagai dict
+      id -> (segmen, site) atau id -> None untuk cell yang sudah dihapus. Segmen berupa
+      tuple (x0, y0, x1, y1) dan site tuple (x, y), sehingga aman dibaca dari thread GUI.
+    - ("done", circles, cancelled): konstruksi selesai (atau dibatalkan) beserta hasil
+      largest_empty_circles.
+    - ("error", message): konstruksi gagal.
+
+    Laporan "progress" dan "partial" dikirim paling sering sekali per FRAME_INTERVAL detik,
+    sehingga GUI cukup menggambar ulang sekali per frame. Pembatalan (cancel) diperiksa
+    setiap titik; titik yang sudah masuk tetap ada di diagram."""
+
+    FRAME_INTERVAL = 1 / 30
+
+    def __init__(self, diagram, points=None, file_path: str = None):
+        """Konstruktor worker untuk 'points' (list Point) atau semua titik di 'file_path'."""
+        super().__init__(daemon=True)
+        if (points is None) == (file_path is None):
+            raise ValueError("Give either points or file_path")
+        self.diagram = diagram
+        self.points = points
+        self.file_path = file_path
+        self.messages = queue.Queue()
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        """Meminta worker berhenti setelah titik yang sedang dimasukkan."""
+        self.cancelled.set()
+
+    def run(self):
+        """Menjalankan konstruksi; error dikirim sebagai pesan, bukan dilempar di thread worker."""
+        try:
+            self.build()
+        except Exception as e:
+            self.messages.put(("error", str(e)))
+
+    def build(self):
+        """Memasukkan semua titik dengan urutan spasial, lalu mencari lingkaran kosong terbesar."""
+        diagram = self.diagram
+        points = self.points if self.points is not None else read_points(self.file_path)
+        total = len(points)
+        self.messages.put(("progress", 0, total))
+
+        if diagram.backend != "incremental":
+            # backend "fortune" dan "parallel" membangun ulang seluruh diagram sekaligus
+            diagram.add_points(points)
+            self.report(total, total, {cell.id for cell in diagram.get_cells()})
+        else:
+            changed = set()
+            last = time.perf_counter()
+            done = 0
+            for p in spatial_sort(points, diagram.boundary, "brio"):
+                if self.cancelled.is_set():
+                    break
+                if diagram.add_point(p):
+                    changed |= diagram.changed_cells
+                done += 1
+                now = time.perf_counter()
+                if now - last >= self.FRAME_INTERVAL:
+                    self.report(done, total, changed)
+                    changed = set()
+                    last = now
+            self.report(done, total, changed)
+
+        circles = diagram.largest_empty_circles() if len(diagram.get_cells()) >= 3 else []
+        self.messages.put(("done", circles, self.cancelled.is_set()))
+
+    def report(self, done: int, total: int, cell_ids):
+        """Mengirim progres dan salinan geometri cell-cell di 'cell_ids' ke GUI."""
+        cells = {}
+        for cell_id in cell_ids:
+            cell = self.diagram.get_cell(cell_id)
+            if cell is None:
+                cells[cell_id] = None
+                continue
+            segments = [(line.start.x, line.start.y, line.end.x, line.end.y) for line in cell.borders]
+            cells[cell_id] = (segments, (cell.site.x, cell.site.y))
+        if cells:
+            self.messages.put(("partial", cells))
+        self.messages.put(("progress", done, total))
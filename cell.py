@@ -2,13 +2,24 @@ from line import Line
 from point import Point
 
 class Cell:
-    """Kelas ini merepresentasikan sebuah voronoi cell dengan ID unik, site, dan setiap bordersnya."""
+    """Kelas ini merepresentasikan sebuah voronoi cell dengan ID unik, site, dan setiap bordersnya.
+
+    Topologi cell disimpan di HalfEdgeMesh milik diagram; 'borders' dibentuk dari mesh tsb."""
+
+    __slots__ = ("id", "site", "mesh")
     
     def __init__(self, site: Point, id: int):
         """Konstruktor untuk inisialisasi voronoi cell dengan site dan ID unik."""
         self.id = id
         self.site = site # tengah dari voronoi cell
-        self.borders: list[Line] = []
+        self.mesh = None # HalfEdgeMesh tempat cell ini terdaftar
+
+    @property
+    def borders(self) -> list[Line]:
+        """Mengembalikan border cell sebagai list Line (neighbor None untuk edge frame)."""
+        if self.mesh is None:
+            return []
+        return self.mesh.borders(self.id)
 
     def __hash__(self):
         """Mengembalikan ID sebagai nilai hash agar objek Cell dapat
@@ -0,0 +1,160 @@
+import math
+
+class CellMetrics:
+    """Cache metrik per cell (luas, centroid, keliling, jumlah vertex, tetangga) untuk VoronoiDiagram.
+
+    Metrik dihitung dari ring cell di mesh (tanpa dipotong boundary) dan disimpan di array
+    NumPy yang diindeks dengan id cell. Diagram menandai cell yang berubah sebagai dirty
+    (lihat VoronoiDiagram.invalidate_caches), dan hanya cell dirty yang dihitung ulang
+    saat metrik dibaca, sehingga biaya setiap pembacaan sebanding dengan jumlah cell yang
+    berubah. Id kosong berisi NaN (jumlah vertex 0)."""
+
+    def __init__(self, diagram):
+        """Konstruktor cache untuk 'diagram'; semua cell dihitung saat pertama kali dibaca."""
+        import numpy as np
+
+        self.diagram = diagram
+        self.area = np.empty(0)
+        self.centroid = np.empty((0, 2))
+        self.perimeter = np.empty(0)
+        self.vertex_count = np.empty(0, dtype=np.int32)
+        self.neighbor_ids = []
+        self.csr = None # (indptr, indices) terakhir, None jika harus dibangun ulang seluruhnya
+        self.csr_dirty = set() # cell yang barisnya di csr sudah usang
+        self.reset()
+
+    def reset(self):
+        """Menandai semua cell sebagai dirty (misalnya setelah diagram dibangun ulang)."""
+        self.dirty = set(range(len(self.diagram.mesh.cells)))
+        self.all_dirty = True
+        self.csr = None
+        self.csr_dirty = set()
+
+    def mark_dirty(self, cell_ids):
+        """Menandai cell dengan id tertentu sebagai dirty."""
+        self.dirty.update(cell_ids)
+        self.csr_dirty.update(cell_ids)
+
+    def grow(self, size: int):
+        """Memperbesar array metrik sampai 'size' slot (slot baru berisi NaN)."""
+        import numpy as np
+
+        old = len(self.area)
+        if size <= old:
+            return
+        size = max(size, 2 * old)
+        self.area = np.concatenate((self.area, np.full(size - old, np.nan)))
+        self.centroid = np.concatenate((self.centroid, np.full((size - old, 2), np.nan)))
+        self.perimeter = np.concatenate((self.perimeter, np.full(size - old, np.nan)))
+        self.vertex_count = np.concatenate((self.vertex_count, np.zeros(size - old, dtype=np.int32)))
+        self.neighbor_ids.extend(() for _ in range(size - old))
+
+    def refresh(self):
+        """Menghitung ulang metrik semua cell dirty."""
+        if not self.dirty:
+            return
+        mesh = self.diagram.mesh
+        self.grow(len(mesh.cells))
+        if self.all_dirty:
+            # id yang sudah tidak ada setelah diagram dibangun ulang
+            self.dirty.update(range(len(mesh.cells), len(self.area)))
+            self.all_dirty = False
+
+        vertex_xy = mesh.vertex_xy
+        for cell_id in self.dirty:
+            if cell_id >= len(mesh.cells) or mesh.cells[cell_id] is None:
+                self.area[cell_id] = self.perimeter[cell_id] = math.nan
+                self.centroid[cell_id] = math.nan
+                self.vertex_count[cell_id] = 0
+                self.neighbor_ids[cell_id] = ()
+                continue
+
+            ring = mesh.ring(cell_id)
+            area = cx = cy = perimeter = 0.0
+            neighbors = []
+            for h in ring:
+                a, b = mesh.origin[h], mesh.origin[mesh.next[h]]
+                x0, y0 = vertex_xy[2 * a], vertex_xy[2 * a + 1]
+                x1, y1 = vertex_xy[2 * b], vertex_xy[2 * b + 1]
+                cross = x0 * y1 - x1 * y0
+                area += cross
+                cx += (x0 + x1) * cross
+                cy += (y0 + y1) * cross
+                perimeter += math.hypot(x1 - x0, y1 - y0)
+                if mesh.twin[h] >= 0:
+                    neighbors.append(mesh.face[mesh.twin[h]])
+
+            self.area[cell_id] = area / 2
+            self.centroid[cell_id] = (cx / (3 * area), cy / (3 * area)) if area else (math.nan, math.nan)
+            self.perimeter[cell_id] = perimeter
+            self.vertex_count[cell_id] = len(ring)
+            self.neighbor_ids[cell_id] = tuple(neighbors)
+        self.dirty = set()
+
+    def view(self, values):
+        """Mengembalikan view read-only dari array metrik sepanjang jumlah slot cell saat ini."""
+        result = values[:len(self.diagram.mesh.cells)].view()
+        result.flags.writeable = False
+        return result
+
+    def areas(self):
+        """Luas setiap cell sebagai array NumPy (n,), diindeks dengan id cell."""
+        self.refresh()
+        return self.view(self.area)
+
+    def centroids(self):
+        """Centroid setiap cell sebagai array NumPy (n, 2), diindeks dengan id cell."""
+        self.refresh()
+        return self.view(self.centroid)
+
+    def perimeters(self):
+        """Keliling setiap cell sebagai array NumPy (n,), diindeks dengan id cell."""
+        self.refresh()
+        return self.view(self.perimeter)
+
+    def vertex_counts(self):
+        """Jumlah vertex setiap cell sebagai array NumPy int32 (n,), diindeks dengan id cell."""
+        self.refresh()
+        return self.view(self.vertex_count)
+
+    def neighbors(self, cell_id: int) -> tuple[int, ...]:
+        """Id cell-cell tetangga dari satu cell (urut sesuai ring)."""
+        self.refresh()
+        return self.neighbor_ids[cell_id]
+
+    def neighbors_csr(self):
+        """Graf ketetanggaan dalam format CSR (indptr, indices), urut sesuai ring.
+
+        Setelah ada cell yang berubah hanya baris cell tsb (dan id baru) yang diganti; baris
+        lain disalin dari CSR sebelumnya."""
+        import numpy as np
+
+        self.refresh()
+        count = len(self.diagram.mesh.cells)
+        if self.csr is not None and len(self.csr[0]) - 1 > count:
+            self.csr = None
+        if self.csr is None:
+            lists = self.neighbor_ids[:count]
+            indptr = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum([len(ids) for ids in lists], out=indptr[1:])
+            indices = np.fromiter((n for ids in lists for n in ids), dtype=np.int32, count=int(indptr[-1]))
+            self.csr = (indptr, indices)
+        elif self.csr_dirty or len(self.csr[0]) - 1 < count:
+            indptr, indices = self.csr
+            old = len(indptr) - 1
+            lengths = np.zeros(count, dtype=np.int64)
+            lengths[:old] = np.diff(indptr)
+            pieces = []
+            start = 0
+            for cell_id in sorted({c for c in self.csr_dirty if c < count} | set(range(old, count))):
+                ids = self.neighbor_ids[cell_id]
+                lengths[cell_id] = len(ids)
+                pieces.append(indices[indptr[min(start, old)]:indptr[min(cell_id, old)]])
+                pieces.append(np.array(ids, dtype=np.int32))
+                start = cell_id + 1
+            pieces.append(indices[indptr[min(start, old)]:])
+            indptr = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            self.csr = (indptr, np.concatenate(pieces))
+        self.csr_dirty = set()
+        return self.csr
@@ -0,0 +1,347 @@
+import math
+from array import array
+from bounding_box import BoundingBox
+from geometry import Geometry
+from line import Line
+from point import Point
+
+class HalfEdgeMesh:
+    """Doubly-connected edge list (DCEL) untuk topologi diagram voronoi.
+
+    Setiap edge voronoi disimpan sekali sebagai sepasang half-edge (twin) dan
+    setiap vertex disimpan sekali lalu dipakai bersama oleh semua cell yang
+    bertemu di vertex tersebut. Semua record disimpan di list paralel dengan
+    indeks integer:
+
+    - vertex v   : vertex_xy[2v], vertex_xy[2v + 1]
+    - half-edge h: origin[h] (vertex awal), twin[h] (-1 untuk edge frame),
+                   next[h] (half-edge berikutnya searah putaran cell), face[h] (id cell, -1 jika sudah dihapus)
+    - cell c     : cells[c] (objek Cell), site_xy[2c], site_xy[2c + 1],
+                   cell_edge[c] (salah satu half-edge di ring cell c, -1 jika tidak ada)
+
+    Ring setiap cell berorientasi positif terhadap site-nya (cross product > 0).
+    Cell yang tidak tertutup oleh cell lain ditutup dengan edge di sepanjang 'frame'.
+
+    Dengan storage "compact", setiap kolom disimpan sebagai array float64/int32 yang
+    bersebelahan di memori sehingga bisa dibaca sebagai view NumPy tanpa copy
+    (lihat 'arrays'). Storage "list" memakai list Python biasa (akses lebih cepat)."""
+
+    STORAGES = ("list", "compact")
+    COLUMNS = ("vertex_xy", "origin", "twin", "next", "face", "site_xy", "cell_edge")
+
+    def __init__(self, frame: BoundingBox, storage: str = "list"):
+        """Konstruktor mesh kosong yang dibatasi oleh bounding box 'frame'."""
+        if storage not in self.STORAGES:
+            raise ValueError(f"Unknown storage: {storage}")
+        self.frame = frame
+        self.storage = storage
+        self.exported = False # True jika ada view NumPy yang memakai memori kolom
+        self.source = None # mmap snapshot jika kolom masih berupa memoryview read-only (lihat VoronoiDiagram.load)
+
+        # record vertex
+        self.vertex_xy = self.column("d")
+
+        # record half-edge
+        self.origin = self.column("i")
+        self.twin = self.column("i")
+        self.next = self.column("i")
+        self.face = self.column("i")
+
+        # record cell, diindeks dengan id cell
+        self.cells = []
+        self.site_xy = self.column("d")
+        self.cell_edge = self.column("i")
+
+        # slot yang sudah dihapus dan bisa dipakai ulang
+        self.free_vertices = []
+        self.free_edges = []
+
+    def column(self, typecode: str, values=()):
+        """Membuat satu kolom record sesuai storage ("d" float64, "i" int32)."""
+        if self.storage == "compact":
+            return array(typecode, values)
+        return list(values)
+
+    def unshare(self):
+        """Menyalin semua kolom compact supaya view NumPy lama (atau mmap snapshot) tidak menghalangi perubahan."""
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            typecode = column.format if isinstance(column, memoryview) else column.typecode
+            setattr(self, name, array(typecode, column))
+        self.exported = False
+        self.source = None
+
+    def make_writable(self):
+        """Menyalin kolom yang masih dibaca langsung dari snapshot mmap sebelum mesh diubah."""
+        if self.source is not None:
+            self.unshare()
+
+    def add_vertex(self, x: float, y: float) -> int:
+        """Menambahkan vertex baru dan mengembalikan indeksnya."""
+        if self.free_vertices:
+            v = self.free_vertices.pop()
+            self.vertex_xy[2 * v] = x
+            self.vertex_xy[2 * v + 1] = y
+            return v
+
+        if self.exported:
+            self.unshare()
+        self.vertex_xy.append(x)
+        self.vertex_xy.append(y)
+        return len(self.vertex_xy) // 2 - 1
+
+    def remove_vertex(self, v: int):
+        """Menandai vertex v sebagai tidak terpakai."""
+        self.free_vertices.append(v)
+
+    def add_edge(self, origin: int, face: int) -> int:
+        """Menambahkan half-edge baru dari vertex 'origin' milik cell 'face'."""
+        if self.free_edges:
+            h = self.free_edges.pop()
+            self.origin[h] = origin
+            self.twin[h] = -1
+            self.next[h] = -1
+            self.face[h] = face
+            return h
+
+        if self.exported:
+            self.unshare()
+        self.origin.append(origin)
+        self.twin.append(-1)
+        self.next.append(-1)
+        self.face.append(face)
+        return len(self.origin) - 1
+
+    def remove_edge(self, h: int):
+        """Menandai half-edge h sebagai tidak terpakai."""
+        self.face[h] = -1
+        self.free_edges.append(h)
+
+    def add_cell(self, cell):
+        """Mendaftarkan cell ke mesh (ring-nya diisi kemudian)."""
+        if len(self.cells) <= cell.id and self.exported:
+            self.unshare()
+
+        # id yang tidak terpakai (insert gagal) diisi NaN
+        while len(self.cells) <= cell.id:
+            self.cells.append(None)
+            self.site_xy.append(float("nan"))
+            self.site_xy.append(float("nan"))
+            self.cell_edge.append(-1)
+        self.cells[cell.id] = cell
+        self.site_xy[2 * cell.id] = cell.site.x
+        self.site_xy[2 * cell.id + 1] = cell.site.y
+        self.cell_edge[cell.id] = -1
+        cell.mesh = self
+
+    def remove_cell(self, cell_id: int):
+        """Menghapus cell dari mesh (half-edge ring-nya harus sudah dihapus)."""
+        self.cells[cell_id].mesh = None
+        self.cells[cell_id] = None
+        self.site_xy[2 * cell_id] = float("nan")
+        self.site_xy[2 * cell_id + 1] = float("nan")
+        self.cell_edge[cell_id] = -1
+
+    def end(self, h: int) -> int:
+        """Mengembalikan vertex akhir dari half-edge h."""
+        return self.origin[self.next[h]]
+
+    def ring(self, cell_id: int) -> list[int]:
+        """Mengembalikan semua half-edge di ring cell, berurutan."""
+        start = self.cell_edge[cell_id]
+        if start < 0:
+            return []
+
+        result = [start]
+        h = self.next[start]
+        while h != start:
+            result.append(h)
+            h = self.next[h]
+        return result
+
+    def neighbors(self, cell_id: int) -> list:
+        """Mengembalikan cell-cell tetangga (edge frame dilewati)."""
+        result = []
+        for h in self.ring(cell_id):
+            t = self.twin[h]
+            if t >= 0:
+                result.append(self.cells[self.face[t]])
+        return result
+
+    def vertex_point(self, v: int) -> Point:
+        """Mengembalikan vertex v sebagai objek Point."""
+        return Point(self.vertex_xy[2 * v], self.vertex_xy[2 * v + 1])
+
+    def borders(self, cell_id: int) -> list[Line]:
+        """Tampilan kompatibilitas: ring cell sebagai list Line dengan neighbor-nya (None untuk frame)."""
+        result = []
+        for h in self.ring(cell_id):
+            t = self.twin[h]
+            neighbor = self.cells[self.face[t]] if t >= 0 else None
+            result.append(Line(self.vertex_point(self.origin[h]), self.vertex_point(self.end(h)), neighbor))
+        return result
+
+    def build(self, segments: list[tuple[int, int, int, int]]):
+        """Membentuk ring semua cell dari daftar segmen (va, vb, cell_a, cell_b).
+
+        va dan vb adalah indeks vertex, cell_a dan cell_b adalah id cell di kedua sisi
+        segmen. Ring yang terbuka (cell di tepi) ditutup dengan edge di sepanjang frame.
+        Vertex yang dimiliki lebih dari tiga cell dipecah (lihat split_vertices)."""
+        starts = {} # id cell -> {vertex awal: half-edge}
+        ends = {} # half-edge -> vertex akhir
+
+        oriented = []
+        for va, vb, ca, cb in segments:
+            # orientasikan half-edge supaya site cell_a berada di sisi positif
+            site = self.cells[ca].site
+            if Geometry.cross_product(site, self.vertex_point(va), self.vertex_point(vb)) < 0:
+                va, vb = vb, va
+            oriented.append((va, vb, ca, cb))
+
+        for va, vb, ca, cb in self.split_vertices(oriented):
+            ha = self.add_edge(va, ca)
+            hb = self.add_edge(vb, cb)
+            self.twin[ha] = hb
+            self.twin[hb] = ha
+            ends[ha] = vb
+            ends[hb] = va
+            starts.setdefault(ca, {})[va] = ha
+            starts.setdefault(cb, {})[vb] = hb
+
+        for cell_id, cell in enumerate(self.cells):
+            if cell is None:
+                continue
+
+            by_origin = starts.get(cell_id, {})
+            if not by_origin:
+                # cell tanpa tetangga: seluruh frame menjadi ring-nya
+                self.cell_edge[cell_id] = self.close_frame(cell_id, None, None, -1)
+                continue
+
+            # sambungkan half-edge berurutan, catat ujung chain yang terbuka
+            chain_end = None
+            end_vertices = set()
+            for h in by_origin.values():
+                end_vertices.add(ends[h])
+                successor = by_origin.get(ends[h])
+                if successor is None:
+                    chain_end = h
+                else:
+                    self.next[h] = successor
+
+            if chain_end is not None:
+                chain_start = next(h for v, h in by_origin.items() if v not in end_vertices)
+                self.close_frame(cell_id, ends[chain_end], self.origin[chain_start], chain_start)
+                self.next[chain_end] = self.cell_edge[cell_id]
+            else:
+                self.cell_edge[cell_id] = next(iter(by_origin.values()))
+
+    def split_vertices(self, segments: list[tuple[int, int, int, int]]) -> list[tuple[int, int, int, int]]:
+        """Memecah vertex yang dimiliki k > 3 cell (site cocircular yang digabung sweep line)
+        menjadi k - 2 vertex di posisi yang sama, dihubungkan edge panjang nol.
+
+        'segments' sudah berorientasi (cell_a di sisi positif). Cell di sekitar vertex
+        diurutkan berdasarkan sudut site-nya, lalu dibagi menjadi kipas segitiga dari cell
+        dengan id terkecil, sama seperti jalur incremental yang menyimpan edge panjang nol,
+        sehingga setiap vertex dimiliki tepat tiga cell. Mengembalikan list segmen baru."""
+        segments = list(segments)
+        incident = {} # vertex -> indeks segmen yang berujung di sana
+        for k, (va, vb, ca, cb) in enumerate(segments):
+            incident.setdefault(va, []).append(k)
+            incident.setdefault(vb, []).append(k)
+
+        for v, ks in incident.items():
+            if len(ks) <= 3:
+                continue
+            between = {frozenset(segments[k][2:]): k for k in ks}
+            cells = {c for k in ks for c in segments[k][2:]}
+            if len(cells) != len(ks):
+                continue # bukan vertex tertutup (tidak terjadi untuk hasil sweep line)
+
+            x, y = self.vertex_xy[2 * v], self.vertex_xy[2 * v + 1]
+            order = sorted(cells, key=lambda c: math.atan2(self.site_xy[2 * c + 1] - y, self.site_xy[2 * c] - x))
+            first = order.index(min(order))
+            order = order[first:] + order[:first]
+            n = len(order)
+            if any(frozenset((order[i - 1], order[i])) not in between for i in range(n)):
+                continue
+
+            # vertex w[i] (1 <= i <= n - 2) adalah segitiga (order[0], order[i], order[i + 1])
+            w = [None, v] + [self.add_vertex(x, y) for _ in range(n - 3)]
+            for i in range(n):
+                k = between[frozenset((order[i - 1], order[i]))]
+                target = w[n - 2] if i == 0 else w[max(i - 1, 1)]
+                va, vb, ca, cb = segments[k]
+                segments[k] = (target if va == v else va, target if vb == v else vb, ca, cb)
+            # diagonal kipas (order[0], order[i]), searah ring order[0] dari w[i - 1] ke w[i]
+            for i in range(2, n - 1):
+                segments.append((w[i - 1], w[i], order[0], order[i]))
+        return segments
+
+    def close_frame(self, cell_id: int, start: int, end: int, successor: int) -> int:
+        """Membuat chain edge frame dari vertex 'start' ke vertex 'end' searah ring.
+
+        Chain disambungkan ke half-edge 'successor'. Jika start dan end None, dibuat ring
+        frame penuh. Mengembalikan half-edge pertama dari chain."""
+        frame = self.frame
+        corners = [(frame.x_min, frame.y_min), (frame.x_max, frame.y_min),
+                   (frame.x_max, frame.y_max), (frame.x_min, frame.y_max)]
+
+        if start is None:
+            vertices = [self.add_vertex(x, y) for x, y in corners]
+        else:
+            # pojok frame yang dilewati dari start ke end (posisi keliling 0..4)
+            t_start = self.frame_position(start)
+            t_end = self.frame_position(end)
+            if t_end <= t_start:
+                t_end += 4
+            vertices = [start]
+            for k in range(int(t_start) + 1, 9):
+                if k >= t_end:
+                    break
+                x, y = corners[k % 4]
+                vertices.append(self.add_vertex(x, y))
+
+        edges = [self.add_edge(v, cell_id) for v in vertices]
+        for h, h_next in zip(edges, edges[1:]):
+            self.next[h] = h_next
+        self.next[edges[-1]] = successor if successor >= 0 else edges[0]
+        self.cell_edge[cell_id] = edges[0]
+        return edges[0]
+
+    def frame_position(self, v: int) -> float:
+        """Posisi vertex v di keliling frame (0..4), searah ring positif mulai dari (x_min, y_min)."""
+        frame = self.frame
+        x, y = self.vertex_xy[2 * v], self.vertex_xy[2 * v + 1]
+        u = (x - frame.x_min) / (frame.x_max - frame.x_min)
+        w = (y - frame.y_min) / (frame.y_max - frame.y_min)
+
+        # sisi frame terdekat dengan vertex
+        sides = [(w, u), (1 - u, 1 + w), (1 - w, 3 - u), (u, 4 - w)]
+        distance, position = min(sides)
+        return position % 4
+
+    def arrays(self) -> dict:
+        """Mengembalikan semua kolom record sebagai array NumPy.
+
+        Untuk storage "compact" hasilnya adalah view tanpa copy yang langsung membaca
+        memori mesh; view tsb tidak lagi mengikuti mesh setelah mesh bertambah besar.
+        Untuk storage "list" hasilnya adalah salinan. Slot yang sudah dihapus tetap ada
+        (face -1 untuk half-edge, NaN untuk site)."""
+        import numpy as np
+
+        result = {}
+        for name in ("vertex_xy", "site_xy"):
+            result[name] = self.as_numpy(getattr(self, name), np.float64).reshape(-1, 2)
+        for name in ("origin", "twin", "next", "face", "cell_edge"):
+            result[name] = self.as_numpy(getattr(self, name), np.int32)
+        return result
+
+    def as_numpy(self, column, dtype):
+        """Mengubah satu kolom menjadi array NumPy (view untuk storage compact)."""
+        import numpy as np
+
+        if self.storage == "compact":
+            self.exported = True
+            return np.frombuffer(column, dtype=dtype)
+        return np.asarray(column, dtype=dtype)
@@ -0,0 +1,177 @@
+from geometry import Geometry
+
+class DelaunayCache:
+    """Cache triangulasi Delaunay (dual diagram Voronoi) yang diturunkan dari ring cell di mesh.
+
+    Setiap vertex voronoi adalah satu segitiga Delaunay dari site-site cell yang bertemu di
+    vertex tsb. Segitiga "dimiliki" cell dengan id terkecil di vertex itu dan disimpan per
+    cell, sehingga saat diagram berubah cukup cell dirty (lihat VoronoiDiagram.invalidate_caches)
+    yang ring-nya dibaca ulang. Vertex tempat lebih dari tiga cell bertemu (site cocircular)
+    dipecah menjadi fan dari cell pemiliknya. Segitiga dan edge yang menyentuh tiga cell
+    super triangle (id 0-2) tidak pernah dihasilkan, karena id-nya selalu terkecil.
+
+    Segitiga site asli di dekat convex hull yang lingkaran luarnya memuat site super triangle
+    tidak muncul sebagai vertex voronoi; segitiga tsb dihitung ulang dari tetangga cell super
+    triangle (lihat refresh_hull) setiap kali salah satu dari cell tsb berubah."""
+
+    def __init__(self, diagram):
+        """Konstruktor cache untuk 'diagram'; semua cell dihitung saat pertama kali dibaca."""
+        self.diagram = diagram
+        self.cell_triangles = [] # id cell -> tuple segitiga (i, a, b) yang dimiliki cell tsb
+        self.cell_edges = [] # id cell -> tuple tetangga n > i (edge Delaunay (i, n))
+        self.triangles = None # array gabungan terakhir, None jika ada cell yang berubah
+        self.edges = None
+        self.outer = set() # site asli yang bertetangga dengan cell super triangle
+        self.hull_triangles = None # segitiga di antara 'outer', None jika harus dihitung ulang
+        self.hull_edges = ()
+        self.reset()
+
+    def reset(self):
+        """Menandai semua cell sebagai dirty (misalnya setelah diagram dibangun ulang)."""
+        self.dirty = set(range(max(len(self.diagram.mesh.cells), len(self.cell_triangles))))
+        self.triangles = self.edges = self.hull_triangles = None
+
+    def mark_dirty(self, cell_ids):
+        """Menandai cell dengan id tertentu sebagai dirty."""
+        self.dirty.update(cell_ids)
+        self.triangles = self.edges = None
+
+    def refresh(self):
+        """Membaca ulang ring semua cell dirty."""
+        if not self.dirty:
+            return
+        if min(self.dirty) < 3 or not self.dirty.isdisjoint(self.outer):
+            self.hull_triangles = None
+        mesh = self.diagram.mesh
+        size = max(len(mesh.cells), max(self.dirty) + 1)
+        if len(self.cell_triangles) < size:
+            self.cell_triangles.extend(() for _ in range(size - len(self.cell_triangles)))
+            self.cell_edges.extend(() for _ in range(size - len(self.cell_edges)))
+
+        origin, twin, next_edge, face = mesh.origin, mesh.twin, mesh.next, mesh.face
+        for cell_id in self.dirty:
+            if cell_id < 3 or cell_id >= len(mesh.cells) or mesh.cells[cell_id] is None:
+                self.cell_triangles[cell_id] = self.cell_edges[cell_id] = ()
+                continue
+
+            triangles = []
+            edges = set()
+            for h in mesh.ring(cell_id):
+                t = twin[h]
+                if t >= 0 and face[t] > cell_id:
+                    edges.add(face[t])
+
+                # cell di sekitar vertex akhir h, diputar dari cell ini (searah jarum jam)
+                around = []
+                g = next_edge[h]
+                while True:
+                    t = twin[g]
+                    if t < 0:
+                        around = None # vertex frame hanya dimiliki cell super triangle
+                        break
+                    g = next_edge[t]
+                    if g == next_edge[h]:
+                        break
+                    around.append(face[g])
+                if around is None or min(around) < cell_id:
+                    continue
+
+                # fan dari cell ini; urutan dibalik supaya segitiga berorientasi CCW
+                for j in range(len(around) - 1):
+                    triangles.append((cell_id, around[j + 1], around[j]))
+                edges.update(around[1:-1]) # diagonal fan pada vertex dengan lebih dari tiga cell
+            self.cell_triangles[cell_id] = tuple(triangles)
+            self.cell_edges[cell_id] = tuple(sorted(edges))
+        self.dirty = set()
+        if self.hull_triangles is None:
+            self.refresh_hull()
+
+    def refresh_hull(self):
+        """Menghitung segitiga Delaunay site asli yang tidak punya vertex voronoi di mesh.
+
+        Segitiga tsb mengisi kantong di antara convex hull site asli dan segitiga dari ring
+        cell, dan semua titik sudutnya bertetangga dengan cell super triangle. Mulai dari
+        setiap sisi hull yang sisi kirinya belum tertutup, titik ketiga dipilih dari tetangga
+        tsb dengan Geometry.incircle (lingkaran luar yang tidak memuat tetangga lain), lalu
+        kedua sisi barunya diproses dengan cara yang sama."""
+        mesh = self.diagram.mesh
+        self.outer = {n.id for s in range(3) if mesh.cells[s] is not None for n in mesh.neighbors(s) if n.id >= 3}
+        site = lambda i: mesh.cells[i].site
+        hull = self.convex_hull(sorted(self.outer, key=lambda i: (site(i).x, site(i).y)))
+
+        triangles = []
+        edges = set()
+        pending = [(hull[i], hull[(i + 1) % len(hull)]) for i in range(len(hull))] if len(hull) >= 3 else []
+        while pending:
+            u, v = pending.pop()
+            if self.covered(u, v):
+                continue
+            apex = None
+            for d in self.outer:
+                if Geometry.orientation(site(u), site(v), site(d)) > 0 and (
+                        apex is None or Geometry.incircle(site(u), site(v), site(apex), site(d)) > 0):
+                    apex = d
+            if apex is None:
+                continue
+            triangles.append((u, v, apex))
+            edges.update((min(a, b), max(a, b)) for a, b in ((u, v), (v, apex), (apex, u)))
+            pending.extend(((u, apex), (apex, v)))
+        self.hull_triangles = tuple(triangles)
+        self.hull_edges = tuple(sorted(edges))
+
+    def covered(self, u: int, v: int) -> bool:
+        """Mengecek apakah sisi kiri edge berarah u -> v sudah berupa segitiga dari ring cell (tanpa cell super)."""
+        mesh = self.diagram.mesh
+        twin, face = mesh.twin, mesh.face
+        for h in mesh.ring(u):
+            if twin[h] >= 0 and face[twin[h]] == v:
+                # vertex akhir h adalah segitiga (u, v, tetangga berikutnya) yang berorientasi CCW
+                t = twin[mesh.next[h]]
+                return t >= 0 and face[t] >= 3
+        return False
+
+    def convex_hull(self, order: list[int]) -> list[int]:
+        """Monotone chain dengan Geometry.orientation: convex hull CCW dari id cell yang sudah
+        diurutkan (x, y), termasuk site yang sebaris di sisi hull."""
+        site = lambda i: self.diagram.mesh.cells[i].site
+
+        def chain(sequence):
+            result = []
+            for i in sequence:
+                while len(result) >= 2 and Geometry.orientation(site(result[-2]), site(result[-1]), site(i)) < 0:
+                    result.pop()
+                result.append(i)
+            return result
+
+        if len(order) < 3:
+            return order
+        return chain(order)[:-1] + chain(reversed(order))[:-1]
+
+    def delaunay_triangles(self):
+        """Segitiga Delaunay sebagai array NumPy int32 (t, 3) berisi id cell, berorientasi CCW."""
+        import numpy as np
+
+        self.refresh()
+        if self.triangles is None:
+            groups = self.cell_triangles + [self.hull_triangles]
+            count = sum(len(triangles) for triangles in groups)
+            flat = (i for triangles in groups for triangle in triangles for i in triangle)
+            self.triangles = np.fromiter(flat, dtype=np.int32, count=3 * count).reshape(count, 3)
+            self.triangles.flags.writeable = False
+        return self.triangles
+
+    def delaunay_edges(self):
+        """Edge Delaunay sebagai array NumPy int32 (e, 2) berisi pasangan id cell (i < j), masing-masing sekali."""
+        import numpy as np
+
+        self.refresh()
+        if self.edges is None:
+            count = sum(len(neighbors) for neighbors in self.cell_edges)
+            flat = (i for cell_id, neighbors in enumerate(self.cell_edges) for n in neighbors for i in (cell_id, n))
+            edges = np.fromiter(flat, dtype=np.int32, count=2 * count).reshape(count, 2)
+            if self.hull_edges:
+                # edge hull yang sudah ada di ring cell dibuang oleh np.unique (urutan tetap (i, j))
+                edges = np.unique(np.concatenate((edges, np.array(self.hull_edges, dtype=np.int32))), axis=0)
+            self.edges = edges
+            self.edges.flags.writeable = False
+        return self.edges
@@ -0,0 +1,78 @@
+class DiagramStats:
+    """Counter dan timer opsional untuk jalur insert VoronoiDiagram.
+
+    Jika diagram dibuat tanpa stats (default), add_point dan find_cell hanya melakukan
+    satu pengecekan None sehingga tidak ada overhead yang berarti. Setiap insert
+    (berhasil maupun gagal) juga dilaporkan ke 'callback' sebagai dict, misalnya untuk
+    dikirim ke pipeline metrik."""
+
+    # alasan insert gagal ("frame": cell baru mencapai frame mesh, hanya untuk site di luar boundary;
+    # "degenerate_circumcenter": titik baru sebaris dengan site dan tetangganya; lihat VoronoiDiagram.add_point)
+    REASONS = ("duplicate", "intersections", "revisit", "degenerate_circumcenter", "topology", "frame")
+
+    def __init__(self, callback=None):
+        """Konstruktor dengan callback opsional callback(event: dict) untuk setiap insert."""
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        """Mengembalikan semua counter dan timer ke nol."""
+        self.inserts = 0 # insert yang berhasil
+        self.rejected = {reason: 0 for reason in self.REASONS} # insert gagal per alasan
+        self.locate_queries = 0
+        self.walk_steps = 0
+        self.last_walk_steps = 0
+        self.cells_visited = 0
+        self.clip_steps = 0 # jumlah ring cell yang dipotong half-plane titik baru
+        self.bisector_time = 0.0 # detik di tahap bisector (mencari cell yang terpotong)
+        self.rebuild_time = 0.0 # detik di tahap membangun ulang border
+
+    @property
+    def rollbacks(self) -> int:
+        """Jumlah insert yang dibatalkan setelah pemeriksaan cell dimulai (selain duplikat)."""
+        return sum(count for reason, count in self.rejected.items() if reason != "duplicate")
+
+    def record_walk(self, steps: int):
+        """Mencatat panjang walk dari satu query find_cell."""
+        self.locate_queries += 1
+        self.walk_steps += steps
+        self.last_walk_steps = steps
+
+    def record_insert(self, site, reason: str, cells_visited: int, clip_steps: int,
+                      bisector_time: float, rebuild_time: float = 0.0):
+        """Mencatat satu insert; 'reason' None berarti insert berhasil."""
+        if reason is None:
+            self.inserts += 1
+        else:
+            self.rejected[reason] += 1
+        self.cells_visited += cells_visited
+        self.clip_steps += clip_steps
+        self.bisector_time += bisector_time
+        self.rebuild_time += rebuild_time
+
+        if self.callback is not None:
+            self.callback({
+                "x": site.x,
+                "y": site.y,
+                "inserted": reason is None,
+                "reason": reason,
+                "walk_steps": self.last_walk_steps,
+                "cells_visited": cells_visited,
+                "clip_steps": clip_steps,
+                "bisector_seconds": bisector_time,
+                "rebuild_seconds": rebuild_time,
+            })
+
+    def as_dict(self) -> dict:
+        """Mengembalikan semua counter sebagai dict (siap diekspor sebagai JSON)."""
+        return {
+            "inserts": self.inserts,
+            "rejected": dict(self.rejected),
+            "rollbacks": self.rollbacks,
+            "locate_queries": self.locate_queries,
+            "walk_steps": self.walk_steps,
+            "cells_visited": self.cells_visited,
+            "clip_steps": self.clip_steps,
+            "bisector_seconds": self.bisector_time,
+            "rebuild_seconds": self.rebuild_time,
+        }
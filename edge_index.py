@@ -0,0 +1,313 @@
+class EdgeIndex:
+    """Indeks spasial (uniform bucket grid) atas edge voronoi yang sudah dipotong ke boundary diagram.
+
+    Setiap edge disimpan sekali oleh cell pemiliknya (cell dengan id terkecil di kedua sisinya,
+    atau satu-satunya cell untuk edge frame), dipotong ke boundary, lalu dipecah menjadi potongan
+    yang tidak lebih panjang dari satu bucket. Setiap potongan masuk ke bucket tempat titik
+    tengahnya berada, sehingga potongan tidak pernah keluar lebih dari setengah bucket dari
+    bucket-nya. Site masuk ke bucket tempat site berada (cell super triangle tidak disertakan).
+
+    Indeks dibangun sekaligus dengan NumPy ke array yang diurutkan per bucket (format CSR).
+    Seperti CellMetrics, diagram menandai cell yang berubah sebagai dirty (lihat
+    VoronoiDiagram.invalidate_caches); saat refresh baris lama milik cell dirty dimatikan dan
+    potongan barunya disimpan terpisah per cell, sampai jumlahnya cukup besar untuk membangun
+    ulang semuanya. Resolusi grid dipilih supaya rata-rata isi bucket paling banyak 'max_load'."""
+
+    def __init__(self, diagram, resolution: int = 16, max_load: int = 64):
+        """Konstruktor indeks untuk 'diagram' dengan resolusi minimum (bucket per sisi) dan batas isi bucket."""
+        self.diagram = diagram
+        self.min_resolution = resolution
+        self.max_load = max_load
+        self.rebuild()
+
+    def reset(self):
+        """Menandai seluruh indeks untuk dibangun ulang (misalnya setelah diagram dibangun ulang)."""
+        self.stale = True
+
+    def mark_dirty(self, cell_ids):
+        """Menandai cell dengan id tertentu sebagai dirty."""
+        self.dirty.update(cell_ids)
+
+    def bucket_size(self) -> tuple[float, float]:
+        """Mengembalikan lebar dan tinggi satu bucket."""
+        boundary = self.diagram.boundary
+        return ((boundary.x_max - boundary.x_min) / self.resolution,
+                (boundary.y_max - boundary.y_min) / self.resolution)
+
+    def bucket_keys(self, xs, ys):
+        """Mengembalikan indeks bucket (array NumPy) untuk koordinat xs, ys, dijepit ke grid."""
+        import numpy as np
+
+        boundary = self.diagram.boundary
+        n = self.resolution
+        width, height = self.bucket_size()
+        i = np.clip(((np.asarray(xs) - boundary.x_min) / width).astype(np.int64), 0, n - 1)
+        j = np.clip(((np.asarray(ys) - boundary.y_min) / height).astype(np.int64), 0, n - 1)
+        return j * n + i
+
+    def clip_segments(self, segments):
+        """Memotong segmen (k, 4) dengan boundary diagram (lihat BoundingBox.clip_segments)."""
+        return self.diagram.boundary.clip_segments(segments)
+
+    def split_segments(self, segments):
+        """Memecah segmen (k, 4) menjadi potongan yang tidak lebih panjang dari satu bucket.
+
+        Mengembalikan (potongan, indeks segmen asal setiap potongan)."""
+        import numpy as np
+
+        width, height = self.bucket_size()
+        dx = segments[:, 2] - segments[:, 0]
+        dy = segments[:, 3] - segments[:, 1]
+        count = np.maximum(1, np.ceil(np.maximum(np.abs(dx) / width, np.abs(dy) / height))).astype(np.int64)
+        source = np.repeat(np.arange(len(segments)), count)
+        step = np.arange(len(source)) - np.repeat(np.cumsum(count) - count, count)
+        t0 = step / count[source]
+        t1 = (step + 1) / count[source]
+        x0, y0 = segments[source, 0], segments[source, 1]
+        pieces = np.column_stack((x0 + t0 * dx[source], y0 + t0 * dy[source],
+                                  x0 + t1 * dx[source], y0 + t1 * dy[source]))
+        return pieces, source
+
+    def piece_keys(self, pieces):
+        """Mengembalikan bucket setiap potongan (bucket titik tengahnya)."""
+        return self.bucket_keys((pieces[:, 0] + pieces[:, 2]) / 2, (pieces[:, 1] + pieces[:, 3]) / 2)
+
+    def rebuild(self):
+        """Membangun ulang seluruh indeks dari mesh diagram dengan operasi NumPy."""
+        import numpy as np
+
+        arrays = self.diagram.mesh.arrays()
+        origin, twin, next_edge, face = arrays["origin"], arrays["twin"], arrays["next"], arrays["face"]
+        vertex_xy, site_xy = arrays["vertex_xy"], arrays["site_xy"]
+        cell_count = len(arrays["cell_edge"])
+
+        # satu half-edge per edge: milik cell dengan id terkecil (edge frame selalu diambil)
+        h = np.flatnonzero((face >= 0) & ((twin < 0) | (face[np.maximum(twin, 0)] > face)))
+        segments = np.column_stack((vertex_xy[origin[h]], vertex_xy[origin[next_edge[h]]]))
+        segments, keep = self.clip_segments(segments.reshape(-1, 4))
+        owners = face[h][keep]
+
+        n = self.min_resolution
+        while len(segments) > self.max_load * n * n:
+            n *= 2
+        self.resolution = n
+        buckets = n * n
+
+        pieces, source = self.split_segments(segments)
+        keys = self.piece_keys(pieces)
+        order = np.argsort(keys, kind="stable")
+        self.segments = pieces[order]
+        self.keys = keys[order]
+        self.owners = owners[source][order]
+        self.alive = np.ones(len(self.segments), dtype=bool)
+        self.starts = np.zeros(buckets + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.keys, minlength=buckets), out=self.starts[1:])
+        self.owner_order = np.argsort(self.owners, kind="stable")
+        self.owner_starts = np.zeros(cell_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.owners, minlength=cell_count), out=self.owner_starts[1:])
+
+        # site cell selain super triangle; id kosong berisi NaN
+        ids = np.flatnonzero(~np.isnan(site_xy[:, 0]))
+        ids = ids[ids >= 3]
+        site_keys = self.bucket_keys(site_xy[ids, 0], site_xy[ids, 1])
+        order = np.argsort(site_keys, kind="stable")
+        self.sites = site_xy[ids[order]]
+        self.site_keys = site_keys[order]
+        self.site_alive = np.ones(len(self.sites), dtype=bool)
+        self.site_starts = np.zeros(buckets + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.site_keys, minlength=buckets), out=self.site_starts[1:])
+        self.site_rows = np.full(cell_count, -1, dtype=np.int64)
+        self.site_rows[ids[order]] = np.arange(len(ids))
+
+        self.extra = {} # id cell -> (potongan, bucket potongan, site atau None, bucket site)
+        self.extra_buckets = {} # bucket -> set id cell di extra
+        self.count = len(self.segments)
+        self.arrays = {} # cache (potongan, site) per bucket
+        self.dirty = set()
+        self.stale = False
+
+    def refresh(self) -> set:
+        """Memperbarui indeks untuk cell dirty.
+
+        Mengembalikan indeks bucket yang isinya berubah, atau None jika seluruh indeks
+        dibangun ulang (semua bucket dianggap berubah)."""
+        import numpy as np
+
+        if not self.dirty and not self.stale:
+            return set()
+        limit = max(1024, len(self.site_rows) // 8) # batas jumlah cell yang diperbarui satu per satu
+        if self.stale or len(self.dirty) > limit:
+            self.rebuild()
+            return None
+
+        mesh = self.diagram.mesh
+        vertex_xy, origin, twin, next_edge, face = mesh.vertex_xy, mesh.origin, mesh.twin, mesh.next, mesh.face
+        changed = set()
+        for cell_id in self.dirty:
+            # buang potongan lama milik cell ini
+            if cell_id < len(self.site_rows):
+                rows = self.owner_order[self.owner_starts[cell_id]:self.owner_starts[cell_id + 1]]
+                rows = rows[self.alive[rows]]
+                changed.update(self.keys[rows].tolist())
+                self.alive[rows] = False
+                self.count -= len(rows)
+                row = self.site_rows[cell_id]
+                if row >= 0 and self.site_alive[row]:
+                    self.site_alive[row] = False
+                    changed.add(int(self.site_keys[row]))
+            old = self.extra.pop(cell_id, None)
+            if old is not None:
+                keys = set(old[1].tolist())
+                if old[2] is not None:
+                    keys.add(old[3])
+                for key in keys:
+                    self.extra_buckets[key].discard(cell_id)
+                changed.update(keys)
+                self.count -= len(old[0])
+
+            if cell_id >= len(mesh.cells) or mesh.cells[cell_id] is None:
+                continue
+
+            segments = []
+            for h in mesh.ring(cell_id):
+                t = twin[h]
+                if t >= 0 and face[t] < cell_id:
+                    continue # edge ini milik tetangga dengan id lebih kecil
+                a, b = origin[h], origin[next_edge[h]]
+                segments.append((vertex_xy[2 * a], vertex_xy[2 * a + 1], vertex_xy[2 * b], vertex_xy[2 * b + 1]))
+            segments, _ = self.clip_segments(np.array(segments, dtype=np.float64).reshape(-1, 4))
+            pieces, _ = self.split_segments(segments)
+            keys = self.piece_keys(pieces)
+            site = site_key = None
+            if cell_id >= 3:
+                site = (mesh.site_xy[2 * cell_id], mesh.site_xy[2 * cell_id + 1])
+                site_key = int(self.bucket_keys(site[0], site[1]))
+
+            self.extra[cell_id] = (pieces, keys, site, site_key)
+            new_keys = set(keys.tolist())
+            if site is not None:
+                new_keys.add(site_key)
+            for key in new_keys:
+                self.extra_buckets.setdefault(key, set()).add(cell_id)
+            changed.update(new_keys)
+            self.count += len(pieces)
+        self.dirty = set()
+
+        # bangun ulang jika potongan terpisah sudah banyak atau bucket sudah terlalu padat
+        if (len(self.extra) > limit
+                or self.count > 2 * self.max_load * self.resolution * self.resolution):
+            self.rebuild()
+            return None
+        for key in changed:
+            self.arrays.pop(key, None)
+        return changed
+
+    def bucket_arrays(self, key: int):
+        """Mengembalikan (potongan (k, 4), site (m, 2)) di bucket 'key' sebagai array NumPy."""
+        import numpy as np
+
+        if key not in self.arrays:
+            start, end = self.starts[key], self.starts[key + 1]
+            segments = [self.segments[start:end][self.alive[start:end]]]
+            start, end = self.site_starts[key], self.site_starts[key + 1]
+            sites = [self.sites[start:end][self.site_alive[start:end]]]
+            for cell_id in self.extra_buckets.get(key, ()):
+                pieces, keys, site, site_key = self.extra[cell_id]
+                segments.append(pieces[keys == key])
+                if site_key == key:
+                    sites.append(np.array([site]))
+            self.arrays[key] = (np.concatenate(segments), np.concatenate(sites))
+        return self.arrays[key]
+
+    def visible_buckets(self, x0: float, y0: float, x1: float, y1: float) -> list[int]:
+        """Mengembalikan indeks bucket yang potongannya mungkin beririsan dengan kotak (x0, y0) - (x1, y1)."""
+        boundary = self.diagram.boundary
+        if x1 < boundary.x_min or x0 > boundary.x_max or y1 < boundary.y_min or y0 > boundary.y_max:
+            return []
+        self.refresh()
+
+        # potongan keluar paling jauh setengah bucket dari bucket-nya
+        width, height = self.bucket_size()
+        low = int(self.bucket_keys(x0 - width / 2, y0 - height / 2))
+        high = int(self.bucket_keys(x1 + width / 2, y1 + height / 2))
+        n = self.resolution
+        return [j * n + i for j in range(low // n, high // n + 1) for i in range(low % n, high % n + 1)]
+
+    def visible_count(self, x0: float, y0: float, x1: float, y1: float) -> int:
+        """Perkiraan cepat jumlah potongan di bucket-bucket yang terlihat (tanpa membaca isinya)."""
+        keys = self.visible_buckets(x0, y0, x1, y1)
+        if not keys:
+            return 0
+        n = self.resolution
+        counts = (self.starts[1:] - self.starts[:-1]).reshape(n, n)
+        return int(counts[keys[0] // n:keys[-1] // n + 1, keys[0] % n:keys[-1] % n + 1].sum())
+
+    def bucket_segments(self, key: int, box: tuple[float, float, float, float], pixel: float = None):
+        """Potongan di bucket 'key' yang bounding box-nya beririsan dengan 'box' (x0, y0, x1, y1).
+
+        Jika 'pixel' diberikan, ujung potongan dibulatkan ke grid pixel dan potongan yang sama digabung."""
+        segments, _ = self.bucket_arrays(key)
+        x0, y0, x1, y1 = box
+        keep = ((segments[:, [0, 2]].max(axis=1) >= x0) & (segments[:, [0, 2]].min(axis=1) <= x1)
+                & (segments[:, [1, 3]].max(axis=1) >= y0) & (segments[:, [1, 3]].min(axis=1) <= y1))
+        segments = segments[keep]
+        if pixel is not None:
+            segments = self.simplify_segments(segments, pixel)
+        return segments
+
+    def bucket_sites(self, key: int, box: tuple[float, float, float, float], pixel: float = None):
+        """Site di bucket 'key' yang berada di dalam 'box'; jika 'pixel' diberikan, site di pixel yang sama digabung."""
+        import numpy as np
+
+        _, sites = self.bucket_arrays(key)
+        x0, y0, x1, y1 = box
+        sites = sites[(sites[:, 0] >= x0) & (sites[:, 0] <= x1) & (sites[:, 1] >= y0) & (sites[:, 1] <= y1)]
+        if pixel is not None and len(sites):
+            sites = np.unique(np.round(sites / pixel), axis=0) * pixel
+        return sites
+
+    @staticmethod
+    def simplify_segments(segments, pixel: float):
+        """Membulatkan ujung segmen ke grid 'pixel', membuang segmen yang menjadi titik, dan menggabungkan duplikat."""
+        import numpy as np
+
+        if not len(segments):
+            return segments
+        snapped = np.round(segments / pixel)
+        # arah segmen diseragamkan supaya segmen yang sama dengan arah berlawanan ikut tergabung
+        flip = (snapped[:, 0] > snapped[:, 2]) | ((snapped[:, 0] == snapped[:, 2]) & (snapped[:, 1] > snapped[:, 3]))
+        snapped[flip] = snapped[flip][:, [2, 3, 0, 1]]
+        snapped = snapped[(snapped[:, 0] != snapped[:, 2]) | (snapped[:, 1] != snapped[:, 3])]
+        return np.unique(snapped, axis=0) * pixel
+
+    def query(self, x0: float, y0: float, x1: float, y1: float, pixel: float = None):
+        """Mengembalikan (potongan (k, 4), site (m, 2)) yang terlihat di kotak (x0, y0) - (x1, y1)."""
+        import numpy as np
+
+        box = (x0, y0, x1, y1)
+        keys = self.visible_buckets(*box)
+        segments = np.concatenate([self.bucket_segments(key, box) for key in keys] or [np.empty((0, 4))])
+        sites = np.concatenate([self.bucket_sites(key, box) for key in keys] or [np.empty((0, 2))])
+        if pixel is not None:
+            segments = self.simplify_segments(segments, pixel)
+            if len(sites):
+                sites = np.unique(np.round(sites / pixel), axis=0) * pixel
+        return segments, sites
+
+    def density(self, x0: float, y0: float, x1: float, y1: float, columns: int, rows: int):
+        """Total panjang edge per sel grid rows x columns di atas kotak (x0, y0) - (x1, y1).
+
+        Dipakai sebagai level-of-detail paling kasar: setiap potongan dihitung di sel tempat
+        titik tengahnya berada, sehingga biayanya tidak bergantung pada jumlah item yang digambar."""
+        import numpy as np
+
+        self.refresh()
+        segments = [self.segments[self.alive]] + [pieces for pieces, _, _, _ in self.extra.values()]
+        segments = np.concatenate(segments)
+        mx = (segments[:, 0] + segments[:, 2]) / 2
+        my = (segments[:, 1] + segments[:, 3]) / 2
+        length = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        inside = (mx >= x0) & (mx < x1) & (my >= y0) & (my < y1)
+        result, _, _ = np.histogram2d(my[inside], mx[inside], bins=(rows, columns), range=((y0, y1), (x0, x1)),
+                                      weights=length[inside])
+        return result
@@ -0,0 +1,351 @@
+import heapq
+import math
+import random
+from geometry import Geometry
+from point import Point
+
+class Arc:
+    """Satu arc parabola pada beach line, sekaligus node dari treap beach line."""
+
+    __slots__ = ("site", "prev", "next", "left", "right", "parent", "priority", "event", "edge", "slot")
+
+    def __init__(self, site: int, priority: float):
+        """Konstruktor arc untuk site dengan indeks 'site'."""
+        self.site = site
+        self.prev = None # arc tetangga kiri/kanan pada beach line
+        self.next = None
+        self.left = None # anak kiri/kanan dan parent pada treap
+        self.right = None
+        self.parent = None
+        self.priority = priority
+        self.event = None # circle event yang akan menghapus arc ini
+        self.edge = None # edge yang ditelusuri breakpoint kanan arc ini
+        self.slot = 0 # ujung edge (0 atau 1) yang sedang ditelusuri breakpoint tsb
+
+
+class Edge:
+    """Edge voronoi antara dua site hasil sweep line.
+
+    'ends' berisi kedua ujung edge (None jika menuju tak hingga) dan 'directions'
+    berisi arah ujung yang tak hingga tersebut."""
+
+    __slots__ = ("a", "b", "ends", "directions")
+
+    def __init__(self, a: int, b: int):
+        """Konstruktor edge antara site dengan indeks a dan b."""
+        self.a = a
+        self.b = b
+        self.ends = [None, None]
+        self.directions = [None, None]
+
+
+class CircleEvent:
+    """Circle event: arc 'arc' hilang dan vertex voronoi terbentuk di 'center'."""
+
+    __slots__ = ("arc", "center", "valid")
+
+    def __init__(self, arc: Arc, center: Point):
+        """Konstruktor circle event untuk arc dengan pusat lingkaran 'center'."""
+        self.arc = arc
+        self.center = center
+        self.valid = True
+
+
+class FortuneSweep:
+    """Konstruksi diagram voronoi dengan algoritma sweep line Fortune dalam O(n log n).
+
+    Sweep line bergerak ke arah y membesar. Beach line disimpan sebagai treap
+    (urutan in-order = urutan arc dari kiri ke kanan) dan event disimpan di heap."""
+
+    EPSILON = 1e-10 # toleransi relatif terhadap ukuran kotak semua site
+
+    def __init__(self, sites: list[Point], seed: int = 0):
+        """Konstruktor dengan daftar site (tanpa duplikat).
+
+        Toleransi absolut 'epsilon' diskalakan dengan ukuran kotak semua site, sehingga
+        hasil sweep tidak bergantung pada satuan koordinat."""
+        self.sites = sites
+        xs = [p.x for p in sites]
+        ys = [p.y for p in sites]
+        extent = max(max(xs) - min(xs), max(ys) - min(ys)) if sites else 0.0
+        self.epsilon = self.EPSILON * (extent or 1.0)
+        self.random = random.Random(seed)
+        self.root = None
+        self.events = []
+        self.counter = 0 # tie breaker untuk heap
+        self.edges = []
+
+    def run(self) -> list[Edge]:
+        """Menjalankan sweep line dan mengembalikan semua edge voronoi."""
+        order = sorted(range(len(self.sites)), key=lambda i: (self.sites[i].y, self.sites[i].x))
+        first_y = self.sites[order[0]].y if order else 0.0
+        k = 0
+
+        while k < len(order) or self.events:
+            # proses circle event dulu jika posisinya tidak setelah site event berikutnya
+            if self.events and (k == len(order) or self.events[0][0] <= self.sites[order[k]].y):
+                _, _, event = heapq.heappop(self.events)
+                if event.valid:
+                    self.circle_event(event)
+            else:
+                site = order[k]
+                k += 1
+                if abs(self.sites[site].y - first_y) < self.epsilon:
+                    self.first_row_event(site)
+                else:
+                    self.site_event(site)
+
+        self.finish()
+        return self.edges
+
+    def breakpoint(self, left: int, right: int, directrix: float) -> float:
+        """Menghitung koordinat x breakpoint antara arc site 'left' dan arc site 'right'."""
+        p = self.sites[left]
+        q = self.sites[right]
+        dp = 2 * (directrix - p.y)
+        dq = 2 * (directrix - q.y)
+
+        # site yang tepat berada di sweep line memiliki parabola degenerate (garis vertikal)
+        if abs(dp) < self.epsilon and abs(dq) < self.epsilon:
+            return (p.x + q.x) / 2
+        elif abs(dp) < self.epsilon:
+            return p.x
+        elif abs(dq) < self.epsilon:
+            return q.x
+
+        # akar persamaan kuadrat perpotongan kedua parabola (bentuk yang stabil secara numerik)
+        a = dp - dq
+        b = -2 * (q.x * dp - p.x * dq)
+        c = q.x * q.x * dp - p.x * p.x * dq + (p.y - q.y) * dp * dq / 2
+        s = math.sqrt(max(b * b - 4 * a * c, 0.0))
+        if b < 0:
+            return 2 * c / (s - b)
+        elif abs(a) < self.epsilon:
+            return -c / b
+        return (-b - s) / (2 * a)
+
+    def find_arc(self, x: float, directrix: float) -> Arc:
+        """Mencari arc pada beach line yang berada tepat di atas posisi x."""
+        node = self.root
+        while True:
+            if node.prev is not None and x < self.breakpoint(node.prev.site, node.site, directrix):
+                if node.left is None:
+                    return node
+                node = node.left
+            elif node.next is not None and x > self.breakpoint(node.site, node.next.site, directrix):
+                if node.right is None:
+                    return node
+                node = node.right
+            else:
+                return node
+
+    def new_arc(self, site: int) -> Arc:
+        """Membuat arc baru dengan prioritas treap acak."""
+        return Arc(site, self.random.random())
+
+    def insert_after(self, node: Arc, new: Arc):
+        """Menyisipkan arc 'new' tepat setelah 'node' pada beach line."""
+        # sambungkan linked list kiri-kanan
+        new.prev = node
+        new.next = node.next
+        if node.next is not None:
+            node.next.prev = new
+        node.next = new
+
+        # posisi in-order setelah node: anak kanan node atau paling kiri dari subtree kanan
+        if node.right is None:
+            node.right = new
+            new.parent = node
+        else:
+            parent = node.right
+            while parent.left is not None:
+                parent = parent.left
+            parent.left = new
+            new.parent = parent
+
+        # kembalikan sifat heap treap
+        while new.parent is not None and new.parent.priority > new.priority:
+            self.rotate_up(new)
+
+    def remove(self, node: Arc):
+        """Menghapus arc dari beach line."""
+        if node.prev is not None:
+            node.prev.next = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+
+        # turunkan node sampai menjadi leaf, lalu lepaskan dari parent
+        while node.left is not None or node.right is not None:
+            if node.right is None or (node.left is not None and node.left.priority < node.right.priority):
+                self.rotate_up(node.left)
+            else:
+                self.rotate_up(node.right)
+
+        if node.parent is None:
+            self.root = None
+        elif node.parent.left is node:
+            node.parent.left = None
+        else:
+            node.parent.right = None
+
+    def rotate_up(self, x: Arc):
+        """Rotasi treap yang menaikkan x satu level ke atas parent-nya."""
+        p = x.parent
+        g = p.parent
+        if p.left is x:
+            p.left = x.right
+            if x.right is not None:
+                x.right.parent = p
+            x.right = p
+        else:
+            p.right = x.left
+            if x.left is not None:
+                x.left.parent = p
+            x.left = p
+        p.parent = x
+        x.parent = g
+
+        if g is None:
+            self.root = x
+        elif g.left is p:
+            g.left = x
+        else:
+            g.right = x
+
+    def first_row_event(self, site: int):
+        """Menangani site-site pertama yang memiliki y sama (parabola degenerate)."""
+        arc = self.new_arc(site)
+        if self.root is None:
+            self.root = arc
+            return
+
+        # site berurutan berdasarkan x, jadi arc baru selalu paling kanan
+        last = self.root
+        while last.right is not None:
+            last = last.right
+        self.insert_after(last, arc)
+
+        # edge vertikal di antara kedua site, berawal dari tak hingga (y = -inf)
+        edge = Edge(last.site, site)
+        edge.directions[0] = (0.0, -1.0)
+        self.edges.append(edge)
+        last.edge, last.slot = edge, 1
+
+    def site_event(self, site: int):
+        """Menangani site event: arc di atas site dipecah menjadi tiga arc."""
+        p = self.sites[site]
+        arc = self.find_arc(p.x, p.y)
+        if arc.event is not None:
+            arc.event.valid = False
+
+        # arc baru untuk site dan salinan arc lama di sebelah kanannya
+        middle = self.new_arc(site)
+        right = self.new_arc(arc.site)
+        self.insert_after(arc, middle)
+        self.insert_after(middle, right)
+
+        # kedua breakpoint baru menelusuri edge yang sama ke dua arah berlawanan
+        edge = Edge(arc.site, site)
+        self.edges.append(edge)
+        right.edge, right.slot = arc.edge, arc.slot
+        arc.edge, arc.slot = edge, 0
+        middle.edge, middle.slot = edge, 1
+
+        self.check_circle(arc)
+        self.check_circle(right)
+
+    def circle_event(self, event: CircleEvent):
+        """Menangani circle event: arc hilang dan vertex voronoi terbentuk."""
+        arc = event.arc
+        left, right = arc.prev, arc.next
+        center = event.center
+
+        # breakpoint kiri dan kanan arc berakhir di vertex baru
+        left.edge.ends[left.slot] = center
+        arc.edge.ends[arc.slot] = center
+        if left.event is not None:
+            left.event.valid = False
+        if right.event is not None:
+            right.event.valid = False
+
+        # breakpoint baru antara left dan right berawal dari vertex tsb
+        edge = Edge(left.site, right.site)
+        edge.ends[0] = center
+        self.edges.append(edge)
+        left.edge, left.slot = edge, 1
+        self.remove(arc)
+
+        self.check_circle(left)
+        self.check_circle(right)
+
+    def check_circle(self, arc: Arc):
+        """Menjadwalkan circle event untuk arc jika kedua breakpoint-nya konvergen."""
+        arc.event = None
+        left, right = arc.prev, arc.next
+        if left is None or right is None or left.site == right.site:
+            return
+
+        # predikat eksak: breakpoint hanya konvergen jika left, arc, right berbelok ke kiri
+        a, b, c = self.sites[left.site], self.sites[arc.site], self.sites[right.site]
+        if Geometry.orientation(a, b, c) <= 0:
+            return
+
+        center = Point(*Geometry.circumcenter(a, b, c))
+        event = CircleEvent(arc, center)
+        arc.event = event
+        self.counter += 1
+        heapq.heappush(self.events, (center.y + Geometry.distance(center, b), self.counter, event))
+
+    def finish(self):
+        """Mencatat arah breakpoint yang masih tersisa (edge menuju tak hingga)."""
+        node = self.root
+        while node is not None and node.left is not None:
+            node = node.left
+
+        while node is not None and node.next is not None:
+            p, q = self.sites[node.site], self.sites[node.next.site]
+            dx, dy = p.y - q.y, q.x - p.x
+            length = math.hypot(dx, dy)
+            node.edge.directions[node.slot] = (dx / length, dy / length)
+            node = node.next
+
+    def segments(self, bounding_box) -> list[tuple[int, int, Point, Point]]:
+        """Mengembalikan edge sebagai segmen (a, b, start, end), edge tak hingga dipotong bounding box.
+
+        Ujung segmen yang bertemu di vertex yang sama adalah objek Point yang sama. Edge
+        dengan panjang nol (site cocircular) dibuang dan kedua ujungnya digabung."""
+        alias = {} # id(Point) -> Point pengganti untuk ujung edge yang digabung
+
+        def resolve(p):
+            while id(p) in alias:
+                p = alias[id(p)]
+            return p
+
+        clipped = []
+        for edge in self.edges:
+            ends = list(edge.ends)
+            for slot in (0, 1):
+                if ends[slot] is not None:
+                    continue
+
+                # titik acuan: ujung yang lain jika ada, atau titik tengah kedua site
+                origin = ends[1 - slot]
+                if origin is None:
+                    p, q = self.sites[edge.a], self.sites[edge.b]
+                    origin = Point((p.x + q.x) / 2, (p.y + q.y) / 2)
+                dx, dy = edge.directions[slot]
+                ends[slot] = bounding_box.ray_exit(origin.x, origin.y, dx, dy)
+            clipped.append((edge.a, edge.b, ends[0], ends[1]))
+
+        result = []
+        for a, b, start, end in clipped:
+            start, end = resolve(start), resolve(end)
+            if start is end:
+                continue
+            elif Geometry.distance(start, end) < self.epsilon:
+                alias[id(end)] = start
+                continue
+            result.append((a, b, start, end))
+
+        # ujung segmen yang sudah disimpan bisa saja digabung oleh edge setelahnya
+        return [(a, b, resolve(start), resolve(end)) for a, b, start, end in result]
@@ -6,6 +6,12 @@ class Geometry:
 
     EPSILON = 1e-7  # toleransi untuk floating point
 
+    # batas error relatif filter floating point untuk orientation dan incircle (Shewchuk,
+    # "Adaptive Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates");
+    # jika determinan lebih kecil dari batas ini, tandanya dihitung ulang secara eksak
+    ORIENT_BOUND = 3.3306690738754716e-16
+    INCIRCLE_BOUND = 1.1102230246251577e-15
+
     @staticmethod
     def closer_to(to: Point, p1: Point, p2: Point) -> Point:
         """Mengembalikan titik yang lebih dekat ke 'to' antara p1 dan p2."""
@@ -26,4 +32,166 @@ class Geometry:
     @staticmethod
     def dist_squared(p1: Point, p2: Point) -> float:
         """Menghitung jarak squared antara p1 dan p2."""
-        return (p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2
\ No newline at end of file
+        return (p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2
+
+    @staticmethod
+    def orientation(a: Point, b: Point, c: Point) -> int:
+        """Tanda eksak dari cross product (a -> b) x (a -> c): 1 jika a, b, c berlawanan arah jarum jam
+        (positif), -1 jika searah, 0 jika sebaris.
+
+        Dihitung dengan floating point biasa; hanya jika hasilnya di bawah batas error
+        (ORIENT_BOUND) determinan dihitung ulang secara eksak dengan integer (lihat exact_integers)."""
+        left = (a.x - c.x) * (b.y - c.y)
+        right = (a.y - c.y) * (b.x - c.x)
+        det = left - right
+        bound = Geometry.ORIENT_BOUND * (abs(left) + abs(right))
+        if det > bound:
+            return 1
+        elif -det > bound:
+            return -1
+
+        ax, ay, bx, by, cx, cy = Geometry.exact_integers(a.x, a.y, b.x, b.y, c.x, c.y)
+        det = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+        return (det > 0) - (det < 0)
+
+    @staticmethod
+    def incircle(a: Point, b: Point, c: Point, d: Point) -> int:
+        """Tanda eksak dari uji incircle: untuk a, b, c berorientasi positif, 1 jika d berada di dalam
+        lingkaran luar a, b, c, -1 jika di luar, dan 0 jika tepat di lingkaran.
+
+        Seperti orientation, filter floating point dipakai lebih dulu dan perhitungan eksak
+        hanya dipakai jika determinan di bawah batas error (INCIRCLE_BOUND)."""
+        adx, ady = a.x - d.x, a.y - d.y
+        bdx, bdy = b.x - d.x, b.y - d.y
+        cdx, cdy = c.x - d.x, c.y - d.y
+
+        bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+        cdxady, adxcdy = cdx * ady, adx * cdy
+        adxbdy, bdxady = adx * bdy, bdx * ady
+        alift = adx * adx + ady * ady
+        blift = bdx * bdx + bdy * bdy
+        clift = cdx * cdx + cdy * cdy
+
+        det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+        permanent = ((abs(bdxcdy) + abs(cdxbdy)) * alift + (abs(cdxady) + abs(adxcdy)) * blift
+                     + (abs(adxbdy) + abs(bdxady)) * clift)
+        bound = Geometry.INCIRCLE_BOUND * permanent
+        if det > bound:
+            return 1
+        elif -det > bound:
+            return -1
+
+        ax, ay, bx, by, cx, cy, dx, dy = Geometry.exact_integers(a.x, a.y, b.x, b.y, c.x, c.y, d.x, d.y)
+        adx, ady = ax - dx, ay - dy
+        bdx, bdy = bx - dx, by - dy
+        cdx, cdy = cx - dx, cy - dy
+        det = ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+               + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+               + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+        return (det > 0) - (det < 0)
+
+    @staticmethod
+    def orientation_many(ax, ay, bx, by, cx, cy):
+        """Versi vektor dari orientation untuk array NumPy koordinat; mengembalikan array tanda int8.
+
+        Elemen yang lolos filter floating point langsung dipakai, sisanya dihitung dengan orientation."""
+        import numpy as np
+
+        left = (ax - cx) * (by - cy)
+        right = (ay - cy) * (bx - cx)
+        det = left - right
+        bound = Geometry.ORIENT_BOUND * (np.abs(left) + np.abs(right))
+        signs = np.where(det > bound, 1, np.where(-det > bound, -1, 0)).astype(np.int8)
+        for k in np.flatnonzero(np.abs(det) <= bound).tolist():
+            signs[k] = Geometry.orientation(Point(ax[k], ay[k]), Point(bx[k], by[k]), Point(cx[k], cy[k]))
+        return signs
+
+    @staticmethod
+    def incircle_many(ax, ay, bx, by, cx, cy, dx, dy):
+        """Versi vektor dari incircle untuk array NumPy koordinat; mengembalikan array tanda int8."""
+        import numpy as np
+
+        adx, ady = ax - dx, ay - dy
+        bdx, bdy = bx - dx, by - dy
+        cdx, cdy = cx - dx, cy - dy
+        bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+        cdxady, adxcdy = cdx * ady, adx * cdy
+        adxbdy, bdxady = adx * bdy, bdx * ady
+        alift = adx * adx + ady * ady
+        blift = bdx * bdx + bdy * bdy
+        clift = cdx * cdx + cdy * cdy
+
+        det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+        permanent = ((np.abs(bdxcdy) + np.abs(cdxbdy)) * alift + (np.abs(cdxady) + np.abs(adxcdy)) * blift
+                     + (np.abs(adxbdy) + np.abs(bdxady)) * clift)
+        bound = Geometry.INCIRCLE_BOUND * permanent
+        signs = np.where(det > bound, 1, np.where(-det > bound, -1, 0)).astype(np.int8)
+        for k in np.flatnonzero(np.abs(det) <= bound).tolist():
+            signs[k] = Geometry.incircle(Point(ax[k], ay[k]), Point(bx[k], by[k]),
+                                         Point(cx[k], cy[k]), Point(dx[k], dy[k]))
+        return signs
+
+    @staticmethod
+    def exact_integers(*values: float) -> list[int]:
+        """Mengubah float menjadi integer dengan skala 2^k yang sama untuk semua nilai.
+
+        Setiap float adalah pecahan dyadic, jadi hasil determinan dengan integer ini sama
+        persis (dikali 2^k positif) dengan determinan eksak dari float aslinya."""
+        parts = []
+        for value in values:
+            mantissa, exponent = math.frexp(value)
+            parts.append((int(mantissa * 9007199254740992), exponent - 53)) # 2^53
+        lowest = min(exponent for _, exponent in parts)
+        return [mantissa << (exponent - lowest) for mantissa, exponent in parts]
+
+    @staticmethod
+    def circumcenter(a: Point, b: Point, c: Point):
+        """Menghitung pusat lingkaran luar a, b, c sebagai tuple (x, y), relatif terhadap a supaya
+        lebih akurat. Mengembalikan None hanya jika ketiga titik benar-benar sebaris."""
+        bx, by = b.x - a.x, b.y - a.y
+        cx, cy = c.x - a.x, c.y - a.y
+        d = 2 * (bx * cy - by * cx)
+        if d == 0:
+            return None
+        b2 = bx * bx + by * by
+        c2 = cx * cx + cy * cy
+        return a.x + (cy * b2 - by * c2) / d, a.y + (bx * c2 - cx * b2) / d
+
+    @staticmethod
+    def polygon_centroid(vertices: list[tuple[float, float]]) -> tuple[float, float]:
+        """Menghitung centroid poligon (list (x, y)) dengan rumus shoelace; (NaN, NaN) jika area-nya nol."""
+        area = cx = cy = 0.0
+        for (x0, y0), (x1, y1) in zip(vertices, vertices[1:] + vertices[:1]):
+            cross = x0 * y1 - x1 * y0
+            area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+        if area == 0:
+            return float("nan"), float("nan")
+        return cx / (3 * area), cy / (3 * area)
+
+    @staticmethod
+    def circumcircle(a: Point, b: Point, c: Point):
+        """Menghitung lingkaran luar dari tiga titik."""
+        det = a.x * (b.y - c.y) + b.x * (c.y - a.y) + c.x * (a.y - b.y)
+
+        # jika determinan (mendekati) 0, berarti sebaris (tidak membentuk lingkaran)
+        if abs(det) < Geometry.EPSILON:
+            return None
+
+        ax, ay = a.x, a.y
+        bx, by = b.x, b.y
+        cx, cy = c.x, c.y
+
+        # hitung pusat lingkaran (ux, uy) dan radius lingkaran
+        d = 2 * det
+        ux = ((ax*ax + ay*ay) * (by - cy) + (bx*bx + by*by) * (cy - ay) + (cx*cx + cy*cy) * (ay - by)) / d
+        uy = ((ax*ax + ay*ay) * (cx - bx) + (bx*bx + by*by) * (ax - cx) + (cx*cx + cy*cy) * (bx - ax)) / d
+        center = Point(ux, uy)
+        radius = math.sqrt((ux - ax)**2 + (uy - ay)**2)
+
+        return {
+            'center': center, # pusat lingkaran
+            'radius': radius,
+            'points': (a, b, c) # 3 titik yang membentuk lingkaran
+        }
@@ -0,0 +1,127 @@
+import math
+from geometry import Geometry
+
+class LabelRaster:
+    """Citra label H x W berisi id site terdekat untuk setiap pixel di dalam boundary diagram.
+
+    Pixel (baris r, kolom c) mewakili titik tengah
+    (x_min + (c + 0.5) * sx, y_min + (r + 0.5) * sy), sehingga baris 0 berada di y_min
+    (sama dengan orientasi canvas). Pixel milik cell super triangle diberi label -1.
+
+    Setiap cell diisi dengan scan-fill: hanya pixel di bounding box ring cell yang diuji,
+    dan sebuah pixel milik cell jika berada di sisi site untuk semua bisector dengan
+    tetangganya. Setelah diagram berubah, cukup cell di 'changed_cells' yang diisi ulang
+    (lihat update), karena pixel yang berganti pemilik selalu berada di cell yang berubah."""
+
+    def __init__(self, diagram, width: int, height: int = None):
+        """Konstruktor raster berukuran width x height (default persegi) untuk 'diagram'."""
+        import numpy as np
+
+        if height is None:
+            height = width
+        if width <= 0 or height <= 0:
+            raise ValueError("Raster size must be positive")
+        self.diagram = diagram
+        self.width = width
+        self.height = height
+        self.labels = np.full((height, width), -1, dtype=np.int32)
+        self.rebuild()
+
+    def rebuild(self):
+        """Mengisi ulang seluruh raster dari semua cell diagram."""
+        boundary = self.diagram.boundary
+        self.x_min, self.y_min = boundary.x_min, boundary.y_min
+        self.sx = (boundary.x_max - boundary.x_min) / self.width
+        self.sy = (boundary.y_max - boundary.y_min) / self.height
+        self.labels.fill(-1)
+        for cell in self.diagram.get_cells():
+            self.fill_cell(cell.id)
+
+    def update(self, cell_ids=None) -> tuple[int, int, int, int]:
+        """Mengisi ulang cell dengan id tertentu (default: diagram.changed_cells).
+
+        Cell yang sudah dihapus dilewati: daerahnya sudah tertutup oleh tetangganya, yang
+        juga ada di changed_cells. Mengembalikan bounding box pixel yang diisi ulang sebagai
+        (row0, row1, col0, col1) dengan batas akhir eksklusif, atau None jika tidak ada."""
+        if cell_ids is None:
+            cell_ids = self.diagram.changed_cells
+
+        bounds = None
+        for cell_id in cell_ids:
+            if self.diagram.get_cell(cell_id) is None:
+                continue
+            box = self.fill_cell(cell_id)
+            if box is None:
+                continue
+            if bounds is None:
+                bounds = box
+            else:
+                bounds = (min(bounds[0], box[0]), max(bounds[1], box[1]),
+                          min(bounds[2], box[2]), max(bounds[3], box[3]))
+        return bounds
+
+    def pixel_box(self, cell_id: int) -> tuple[int, int, int, int]:
+        """Mengembalikan bounding box pixel (row0, row1, col0, col1) dari ring cell, atau None."""
+        mesh = self.diagram.mesh
+        ring = mesh.ring(cell_id)
+        if not ring:
+            return None
+        xs = [mesh.vertex_xy[2 * mesh.origin[h]] for h in ring]
+        ys = [mesh.vertex_xy[2 * mesh.origin[h] + 1] for h in ring]
+
+        # satu pixel ekstra di setiap sisi; pixel di luar cell tetap disaring oleh uji bisector
+        col0 = max(0, math.floor((min(xs) - self.x_min) / self.sx - 0.5))
+        col1 = min(self.width, math.ceil((max(xs) - self.x_min) / self.sx - 0.5) + 1)
+        row0 = max(0, math.floor((min(ys) - self.y_min) / self.sy - 0.5))
+        row1 = min(self.height, math.ceil((max(ys) - self.y_min) / self.sy - 0.5) + 1)
+        if col0 >= col1 or row0 >= row1:
+            return None
+        return row0, row1, col0, col1
+
+    def fill_cell(self, cell_id: int) -> tuple[int, int, int, int]:
+        """Menulis label cell ke semua pixel di dalam cell; mengembalikan bounding box pixelnya."""
+        import numpy as np
+
+        box = self.pixel_box(cell_id)
+        if box is None:
+            return None
+        row0, row1, col0, col1 = box
+
+        mesh = self.diagram.mesh
+        sx, sy = mesh.site_xy[2 * cell_id], mesh.site_xy[2 * cell_id + 1]
+        px = self.x_min + (np.arange(col0, col1) + 0.5) * self.sx - sx
+        py = self.y_min + (np.arange(row0, row1) + 0.5) * self.sy - sy
+
+        # relatif terhadap site s, pixel p ada di sisi s untuk tetangga n jika 2 p.(n - s) <= |n - s|^2
+        inside = np.ones((row1 - row0, col1 - col0), dtype=bool)
+        for h in mesh.ring(cell_id):
+            t = mesh.twin[h]
+            if t < 0:
+                continue
+            n = mesh.face[t]
+            dx = mesh.site_xy[2 * n] - sx
+            dy = mesh.site_xy[2 * n + 1] - sy
+            limit = (dx * dx + dy * dy) * (0.5 + Geometry.EPSILON)
+            inside &= (py[:, None] * dy + px[None, :] * dx) <= limit
+
+        self.labels[row0:row1, col0:col1][inside] = cell_id if cell_id >= 3 else -1
+        return box
+
+    def label_at(self, x: float, y: float) -> int:
+        """Mengembalikan label pixel yang memuat titik (x, y), atau -1 jika di luar raster."""
+        col = math.floor((x - self.x_min) / self.sx)
+        row = math.floor((y - self.y_min) / self.sy)
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return int(self.labels[row, col])
+        return -1
+
+    def to_ppm(self, colors, box: tuple[int, int, int, int] = None) -> bytes:
+        """Mengubah raster (atau sebagian, 'box' = (row0, row1, col0, col1)) menjadi gambar PPM biner.
+
+        'colors' adalah array uint8 (n, 3) yang diindeks dengan label + 1 (baris 0 untuk label -1)."""
+        import numpy as np
+
+        row0, row1, col0, col1 = box if box is not None else (0, self.height, 0, self.width)
+        pixels = np.asarray(colors, dtype=np.uint8)[self.labels[row0:row1, col0:col1] + 1]
+        header = f"P6 {col1 - col0} {row1 - row0} 255\n".encode("ascii")
+        return header + pixels.tobytes()
@@ -6,6 +6,8 @@ class Line:
 
     EPSILON = 1e-7 # untuk toleransi floating point
 
+    __slots__ = ("start", "end", "neighbor")
+
     def __init__(self, start: Point, end: Point, neighbor = None):
         """Konstruktor untuk kelas Line."""
         self.start = start
@@ -1,17 +1,43 @@
-import itertools
-import math
+import queue
 import random
 import tkinter as tk
-from tkinter import filedialog
+from tkinter import filedialog, ttk
+from build_worker import BuildWorker
+from label_raster import LabelRaster
 from point import Point
 from voronoi_diagram import VoronoiDiagram
 
 class MainGUI:
+    POLL_INTERVAL = 33 # milidetik antar pembacaan queue worker (~30 frame per detik)
+    PARTIAL_LIMIT = 5000 # jumlah maksimum cell parsial yang digambar selama worker berjalan
+    EDGE_BUDGET = 20000 # di atas jumlah potongan edge terlihat ini, edge digambar sebagai citra kepadatan
+    SITE_PIXELS = 8 # site yang jatuh di kotak SITE_PIXELS x SITE_PIXELS pixel yang sama digabung
+    ZOOM_STEP = 1.25
+    MIN_SCALE = 0.5
+    MAX_SCALE = 1000.0
+
     def __init__(self, master: tk.Tk, diagram: VoronoiDiagram):
         """Inisialisasi GUI utama dengan komponen tkinter."""
         self.master = master
         self.diagram = diagram
         self.canvas_size = diagram.get_size()
+        try:
+            self.index = diagram.enable_edge_index()
+        except ImportError:
+            self.index = None # tanpa NumPy semua cell digambar langsung (tanpa EdgeIndex)
+        self.raster = None # LabelRaster saat mode "Fill Cells" aktif
+        self.raster_image = None
+        self.density_image = None # citra kepadatan edge saat viewport terlalu padat
+        self.density_mode = False
+        self.worker = None # BuildWorker yang sedang berjalan
+        self.partial_count = 0
+        self.largest_empty_circles = []
+
+        # viewport: koordinat dunia di pojok kiri atas canvas dan pixel per satuan dunia
+        self.origin_x = 0.0
+        self.origin_y = 0.0
+        self.scale = 1.0
+        self.pan_anchor = None
 
         # set judul utama
         self.master.title("Voronoi Diagram")
@@ -50,30 +76,116 @@ class MainGUI:
         self.add_point_button = tk.Button(self.button_frame, text="Add Point", command=self.add_manual_point, bg="blue", fg="white", font=("Helvetica", 12, "bold"))
         self.add_point_button.pack(side=tk.LEFT, padx=10)
 
+        # toggle pewarnaan cell dengan label raster
+        self.fill_var = tk.BooleanVar(value=False)
+        self.fill_check = tk.Checkbutton(self.button_frame, text="Fill Cells", variable=self.fill_var, command=self.toggle_fill, bg="lightblue", font=("Helvetica", 12))
+        self.fill_check.pack(side=tk.LEFT, padx=5)
+
+        # kembali ke viewport awal setelah zoom/pan
+        self.reset_view_button = tk.Button(self.button_frame, text="Reset View", command=self.reset_view, font=("Helvetica", 12))
+        self.reset_view_button.pack(side=tk.LEFT, padx=5)
+
+        # progres konstruksi di background dan tombol batal
+        self.progress_frame = tk.Frame(self.main_frame, bg="lightblue")
+        self.progress_frame.pack(pady=5)
+        self.progress_bar = ttk.Progressbar(self.progress_frame, orient=tk.HORIZONTAL, length=400, mode="determinate")
+        self.progress_bar.pack(side=tk.LEFT, padx=10)
+        self.cancel_button = tk.Button(self.progress_frame, text="Cancel", command=self.cancel_build, state=tk.DISABLED, font=("Helvetica", 12, "bold"))
+        self.cancel_button.pack(side=tk.LEFT, padx=10)
+
         # footer
-        self.footer_label = tk.Label(self.main_frame, text="Click on the canvas to add points manually.", font=("Helvetica", 10, "italic"), bg="lightblue")
+        self.footer_label = tk.Label(self.main_frame, text="Click on the canvas to add points manually. Scroll to zoom, right-drag to pan.", font=("Helvetica", 10, "italic"), bg="lightblue")
         self.footer_label.pack(pady=5)
 
         # bind mouse click event to canvas
         self.canvas.bind("<Button-1>", self.on_canvas_click)
 
+        # zoom dengan scroll (Windows/macOS: <MouseWheel>, X11: tombol 4 dan 5), pan dengan drag tombol kanan
+        self.canvas.bind("<MouseWheel>", self.on_zoom)
+        self.canvas.bind("<Button-4>", self.on_zoom)
+        self.canvas.bind("<Button-5>", self.on_zoom)
+        self.canvas.bind("<ButtonPress-3>", self.start_pan)
+        self.canvas.bind("<B3-Motion>", self.on_pan)
+        self.canvas.bind("<ButtonRelease-3>", self.end_pan)
+
+    def to_canvas(self, x: float, y: float) -> tuple[float, float]:
+        """Mengubah koordinat dunia (diagram) menjadi koordinat canvas sesuai viewport."""
+        return (x - self.origin_x) * self.scale, (y - self.origin_y) * self.scale
+
+    def to_world(self, x: float, y: float) -> tuple[float, float]:
+        """Mengubah koordinat canvas menjadi koordinat dunia (diagram)."""
+        return self.origin_x + x / self.scale, self.origin_y + y / self.scale
+
+    def view_box(self) -> tuple[float, float, float, float]:
+        """Mengembalikan kotak dunia (x0, y0, x1, y1) yang terlihat di canvas."""
+        x1, y1 = self.to_world(self.canvas_size, self.canvas_size)
+        return self.origin_x, self.origin_y, x1, y1
+
+    def on_zoom(self, event):
+        """Memperbesar/memperkecil viewport di sekitar posisi mouse."""
+        if self.worker is not None:
+            return
+        zoom_in = event.num == 4 or getattr(event, "delta", 0) > 0
+        scale = self.scale * self.ZOOM_STEP if zoom_in else self.scale / self.ZOOM_STEP
+        scale = min(max(scale, self.MIN_SCALE), self.MAX_SCALE)
+
+        # titik dunia di bawah mouse tetap di posisi canvas yang sama
+        x, y = self.to_world(event.x, event.y)
+        self.scale = scale
+        self.origin_x = x - event.x / scale
+        self.origin_y = y - event.y / scale
+        self.draw_view()
+
+    def start_pan(self, event):
+        """Mulai menggeser viewport."""
+        if self.worker is None:
+            self.pan_anchor = (event.x, event.y)
+
+    def on_pan(self, event):
+        """Menggeser item yang sudah ada selama drag; query ulang dilakukan saat drag selesai."""
+        if self.pan_anchor is None:
+            return
+        dx, dy = event.x - self.pan_anchor[0], event.y - self.pan_anchor[1]
+        self.canvas.move("all", dx, dy)
+        self.origin_x -= dx / self.scale
+        self.origin_y -= dy / self.scale
+        self.pan_anchor = (event.x, event.y)
+
+    def end_pan(self, event):
+        """Selesai menggeser: menggambar ulang isi viewport yang baru."""
+        if self.pan_anchor is not None:
+            self.pan_anchor = None
+            self.draw_view()
+
+    def reset_view(self):
+        """Mengembalikan viewport ke seluruh boundary diagram."""
+        if self.worker is not None:
+            return
+        self.origin_x = self.origin_y = 0.0
+        self.scale = 1.0
+        self.draw_view()
+
     def on_canvas_click(self, event):
         """Menambahkan titik saat canvas diklik."""
-        new_point = Point(event.x, event.y)
+        if self.worker is not None:
+            return
+        new_point = Point(*self.to_world(event.x, event.y))
 
         # tambahkan point ke diagram dan perbarui gambar
         if self.diagram.add_point(new_point):
-            self.draw_cells()
+            self.redraw_cells(self.diagram.changed_cells)
             self.find_and_draw_empty_circles()
 
     def add_manual_point(self):
         """Menambahkan titik berdasarkan input manual dengan klik mouse."""
+        if self.worker is not None:
+            return
         try:
             coords = self.manual_input.get().strip().split(",")
-            x, y = int(coords[0]), int(coords[1])
+            x, y = float(coords[0]), float(coords[1])
             new_point = Point(x, y)
             if self.diagram.add_point(new_point):
-                self.draw_cells()
+                self.redraw_cells(self.diagram.changed_cells)
                 self.find_and_draw_empty_circles()
         except (ValueError, IndexError):
             print("Invalid input! Please enter coordinates in the format 'x, y'.")
@@ -84,156 +196,286 @@ class MainGUI:
 
         # generate titik
         num_points = random.randint(5, 15)
+        points = []
         for _ in range(num_points):
             x = random.randint(0, self.canvas_size - 1)
             y = random.randint(0, self.canvas_size - 1)
-            new_point = Point(x, y)
-            self.diagram.add_point(new_point)
+            points.append(Point(x, y))
+
+        # bangun diagram dan cari lingkaran kosong terbesar di background
+        self.start_build(points=points)
+
+    def start_build(self, points=None, file_path=None):
+        """Menjalankan BuildWorker untuk 'points' atau isi 'file_path' dan mulai memantau queue-nya."""
+        self.worker = BuildWorker(self.diagram, points, file_path)
+        self.set_busy(True)
+        self.progress_bar["value"] = 0
+        self.partial_count = 0
+        self.footer_label.config(text="Building diagram...")
+        self.worker.start()
+        self.master.after(self.POLL_INTERVAL, self.poll_worker)
+
+    def poll_worker(self):
+        """Membaca semua pesan worker yang tersedia lalu menggambar hasilnya sekali untuk frame ini.
+
+        Selama worker berjalan diagram tidak dibaca dari thread GUI; cell parsial digambar
+        dari salinan geometri di pesan "partial"."""
+        cells = {}
+        finished = None
+        while True:
+            try:
+                message = self.worker.messages.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                _, done, total = message
+                self.progress_bar["maximum"] = max(total, 1)
+                self.progress_bar["value"] = done
+                self.footer_label.config(text=f"Building diagram... {done}/{total} points")
+            elif message[0] == "partial":
+                cells.update(message[1])
+            else:
+                finished = message
+
+        # setelah PARTIAL_LIMIT cell, hanya progres yang ditampilkan sampai worker selesai
+        for cell_id, cell in cells.items():
+            if self.partial_count >= self.PARTIAL_LIMIT:
+                break
+            self.canvas.delete(f"cell{cell_id}")
+            if cell is not None:
+                self.draw_cell_segments(cell_id, *cell)
+                self.partial_count += 1
+
+        if finished is None:
+            self.master.after(self.POLL_INTERVAL, self.poll_worker)
+            return
 
-        # gambar voronoi dan lingkaran kosong terbesar
+        # worker sudah selesai: diagram boleh dibaca lagi
+        self.worker = None
+        self.set_busy(False)
         self.draw_cells()
-        self.find_and_draw_empty_circles()
+        self.footer_label.config(text="Click on the canvas to add points manually.")
+        if finished[0] == "error":
+            print(f"Error loading points: {finished[1]}")
+            return
+
+        _, circles, cancelled = finished
+        self.draw_empty_circles(circles)
+        if cancelled:
+            self.footer_label.config(text="Build cancelled.")
+
+    def cancel_build(self):
+        """Membatalkan konstruksi yang sedang berjalan; titik yang sudah masuk tetap digambar."""
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def set_busy(self, busy: bool):
+        """Menonaktifkan kontrol yang mengubah diagram selama worker berjalan."""
+        state = tk.DISABLED if busy else tk.NORMAL
+        for widget in (self.clear_button, self.load_button, self.random_button, self.add_point_button, self.fill_check, self.reset_view_button):
+            widget.config(state=state)
+        self.cancel_button.config(state=tk.NORMAL if busy else tk.DISABLED)
 
     def draw_cells(self):
-        """Menggambar semua voronoi cell pada canvas."""
-        self.canvas.delete("all")
-        for cell in self.diagram.get_cells():
-            for line in cell.borders:
-                self.draw_line(line)
-            self.draw_point(cell.site)
-
-    def find_circumcircle(self, a, b, c):
-        """Menghitung lingkaran luar dari tiga titik."""
-        det = a.x * (b.y - c.y) + b.x * (c.y - a.y) + c.x * (a.y - b.y)
-
-        # jika determinan (mendekati) 0, berarti sebaris (tidak membentuk lingkaran)
-        if abs(det) < Point.EPSILON:
-            return None
-
-        ax, ay = a.x, a.y
-        bx, by = b.x, b.y
-        cx, cy = c.x, c.y
-        
-        # hitung pusat lingkaran (ux, uy) dan radius lingkaran
-        d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
-        ux = ((ax*ax + ay*ay) * (by - cy) + (bx*bx + by*by) * (cy - ay) + (cx*cx + cy*cy) * (ay - by)) / d
-        uy = ((ax*ax + ay*ay) * (cx - bx) + (bx*bx + by*by) * (ax - cx) + (cx*cx + cy*cy) * (bx - ax)) / d
-        center = Point(ux, uy)
-        radius = math.sqrt((ux - ax)**2 + (uy - ay)**2)
-        
-        return {
-            'center': center, # pusat lingkaran
-            'radius': radius, 
-            'points': (a, b, c) # 3 titik yang membentuk lingkaran
-        }
+        """Menggambar ulang semua voronoi cell yang terlihat setelah diagram berubah."""
+        if self.raster is not None:
+            self.raster.rebuild()
+        self.draw_view()
+
+    def draw_view(self):
+        """Menggambar ulang isi viewport dari EdgeIndex.
+
+        Hanya bucket yang beririsan dengan viewport yang dibaca. Jika potongan edge yang
+        terlihat lebih dari EDGE_BUDGET, edge digambar sebagai satu citra kepadatan.
+        Tanpa EdgeIndex (NumPy tidak tersedia) semua cell digambar satu per satu."""
+        self.canvas.delete("cell")
+        box = self.view_box()
+        if self.index is None:
+            for cell in self.diagram.get_cells():
+                self.draw_cell(cell)
+        elif self.index.visible_count(*box) > self.EDGE_BUDGET:
+            self.density_mode = True
+            self.draw_density(box)
+        else:
+            self.density_mode = False
+            for key in self.index.visible_buckets(*box):
+                self.draw_bucket(key, box)
+        if self.raster is not None:
+            self.draw_raster()
+        self.draw_empty_circles(self.largest_empty_circles)
+
+    def redraw_cells(self, cell_ids):
+        """Menggambar ulang hanya bucket EdgeIndex yang berisi cell dengan id tertentu
+        (tanpa EdgeIndex: hanya cell tsb, cell yang sudah dihapus cukup dihapus dari canvas)."""
+        if self.index is None:
+            for cell_id in cell_ids:
+                self.canvas.delete(f"cell{cell_id}")
+                cell = self.diagram.get_cell(cell_id)
+                if cell is not None:
+                    self.draw_cell(cell)
+        else:
+            changed = self.index.refresh()
+            box = self.view_box()
+            if changed is None or self.density_mode or self.index.visible_count(*box) > self.EDGE_BUDGET:
+                self.draw_view()
+            else:
+                for key in changed.intersection(self.index.visible_buckets(*box)):
+                    self.canvas.delete(f"bucket{key}")
+                    self.draw_bucket(key, box)
+        if self.raster is not None:
+            self.draw_raster(self.raster.update(cell_ids))
+        self.canvas.tag_raise("circles")
+
+    def draw_cell(self, cell):
+        """Menggambar satu voronoi cell sesuai viewport, semua item-nya diberi tag "cell" dan "cell<id>"."""
+        tags = ("cell", f"cell{cell.id}")
+        for line in cell.borders:
+            self.canvas.create_line(*self.to_canvas(line.start.x, line.start.y), *self.to_canvas(line.end.x, line.end.y),
+                                    fill="blue", width=2, tags=tags)
+        self.draw_point(Point(*self.to_canvas(cell.site.x, cell.site.y)), tags=tags)
+
+    def draw_bucket(self, key, box):
+        """Menggambar edge dan site di satu bucket EdgeIndex, semua item-nya diberi tag "cell" dan "bucket<key>".
+
+        Ujung edge dibulatkan ke pixel layar sehingga edge yang lebih pendek dari satu pixel
+        hilang; site yang berdekatan di layar digabung dan digambar sebagai titik kecil."""
+        tags = ("cell", f"bucket{key}")
+        pixel = 1 / self.scale
+        width = 2 if self.scale >= 1 else 1
+        for x0, y0, x1, y1 in self.index.bucket_segments(key, box, pixel):
+            self.canvas.create_line(*self.to_canvas(x0, y0), *self.to_canvas(x1, y1), fill="blue", width=width, tags=tags)
+
+        sites = self.index.bucket_sites(key, box, pixel * self.SITE_PIXELS)
+        radius = 4 if len(sites) == len(self.index.bucket_sites(key, box)) else 1
+        for x, y in sites:
+            self.draw_point(Point(*self.to_canvas(x, y)), tags=tags, radius=radius)
+
+    def draw_density(self, box):
+        """Menggambar edge di viewport sebagai citra: setiap pixel diwarnai sesuai panjang edge di dalamnya."""
+        import numpy as np
+
+        size = int(self.canvas_size)
+        length = self.index.density(*box, size, size)
+
+        # panjang edge dalam pixel layar ~ jumlah pixel yang tertutup garis selebar 1 pixel
+        coverage = np.clip(length * self.scale, 0, 1)
+        pixels = np.empty((size, size, 3), dtype=np.uint8)
+        pixels[..., 0] = pixels[..., 1] = (255 * (1 - coverage)).astype(np.uint8)
+        pixels[..., 2] = 255
+        header = f"P6 {size} {size} 255\n".encode("ascii")
+        self.density_image = tk.PhotoImage(data=header + pixels.tobytes())
+        self.canvas.create_image(0, 0, image=self.density_image, anchor=tk.NW, tags=("cell", "density"))
+
+    def draw_cell_segments(self, cell_id, segments, site):
+        """Menggambar cell dari salinan geometri (segmen dan site) yang dikirim BuildWorker."""
+        tags = ("cell", f"cell{cell_id}")
+        for x0, y0, x1, y1 in segments:
+            self.canvas.create_line(*self.to_canvas(x0, y0), *self.to_canvas(x1, y1), fill="blue", width=2, tags=tags)
+        self.draw_point(Point(*self.to_canvas(*site)), tags=tags)
+
+    def toggle_fill(self):
+        """Menyalakan/mematikan pewarnaan cell dengan label raster di belakang garis cell."""
+        if self.fill_var.get():
+            self.raster = LabelRaster(self.diagram, int(self.canvas_size))
+            self.draw_raster()
+        else:
+            self.raster = None
+            self.raster_image = None
+            self.canvas.delete("raster")
 
-    def find_largest_empty_circles(self):
-        """Mencari lingkaran terbesar yang kosong (tidak mengandung titik lain)."""
-        sites = [cell.site for cell in self.diagram.get_cells()[3:]] # exclude super triangle (3 cell pertama)
-        empty_circles = []
+    def draw_raster(self, box=None):
+        """Menampilkan label raster sebagai satu gambar; jika 'box' diberikan hanya bagian itu yang diganti.
 
-        # loop melalui kombinasi semua titik site dengan memilih 3 titik pada satu waktu
-        for a, b, c in itertools.combinations(sites, 3):
-            circle = self.find_circumcircle(a, b, c) # circumcircle dari ketiga titik
-            
-            # jika tidak membentuk circumcircle, lanjutkan
-            if circle is None:
-                continue
-            
-            is_empty = True
-            for point in sites:
-                if point in circle['points']:
-                    continue
-                
-                # cek apakah point berada di dalam lingkaran
-                dist = math.sqrt((point.x - circle['center'].x)**2 + (point.y - circle['center'].y)**2)
-                if dist <= circle['radius'] + Point.EPSILON:
-                    is_empty = False
-                    break
-            
-            # jika lingkaran kosong, simpan ke list
-            if is_empty:
-                empty_circles.append(circle)
-
-        # cari lingkaran terbesar (jika ada)
-        if empty_circles:
-            max_radius = max(circle['radius'] for circle in empty_circles)
-            # ambil semua circle dengan radius tersebut
-            return [circle for circle in empty_circles if abs(circle['radius'] - max_radius) < Point.EPSILON]
+        Raster berukuran satu pixel per satuan dunia, jadi hanya ditampilkan tanpa zoom (pan tetap bisa)."""
+        import numpy as np
+
+        if self.scale != 1:
+            self.canvas.delete("raster")
+            self.raster_image = None
+            return
+
+        # warna pucat yang tetap untuk setiap id cell, putih untuk label -1
+        ids = np.arange(len(self.diagram.mesh.cells), dtype=np.int64)
+        colors = np.vstack([[255, 255, 255], 160 + ids[:, None] * np.array([37, 59, 83]) % 96])
+
+        if box is None or self.raster_image is None or not self.canvas.find_withtag("raster"):
+            self.canvas.delete("raster")
+            self.raster_image = tk.PhotoImage(data=self.raster.to_ppm(colors))
+            x, y = self.to_canvas(self.diagram.boundary.x_min, self.diagram.boundary.y_min)
+            self.canvas.create_image(x, y, image=self.raster_image, anchor=tk.NW, tags="raster")
+            self.canvas.tag_lower("raster")
         else:
-            return []
+            row0, row1, col0, col1 = box
+            block = tk.PhotoImage(data=self.raster.to_ppm(colors, box))
+            self.raster_image.tk.call(self.raster_image, "copy", block, "-to", col0, row0)
+
+    def find_largest_empty_circles(self):
+        """Mencari lingkaran terbesar yang kosong (tidak mengandung titik lain)."""
+        return self.diagram.largest_empty_circles()
 
     def find_and_draw_empty_circles(self):
         """Mencari lingkaran kosong terbesar (tidak mengandung titik lain)."""
         if len(self.diagram.get_cells()) < 3:
             return
 
-        self.largest_empty_circles = self.find_largest_empty_circles()
+        self.draw_empty_circles(self.find_largest_empty_circles())
 
-        self.draw_cells()
+    def draw_empty_circles(self, circles):
+        """Menggambar lingkaran kosong terbesar hasil largest_empty_circles (koordinat dunia) sesuai viewport."""
+        self.largest_empty_circles = circles
+
+        # overlay lingkaran berada di tag "circles" sehingga bisa diganti tanpa menggambar ulang cell
+        self.canvas.delete("circles")
 
         # gambar semua circumcircle kosong terbesar yang ditemukan (jika ada)
         for circle in self.largest_empty_circles:
-            center = circle['center']
-            radius = circle['radius']
+            center = Point(*self.to_canvas(circle['center'].x, circle['center'].y))
+            radius = circle['radius'] * self.scale
             
             # gambar lingkaran
             self.canvas.create_oval(
                 center.x - radius, center.y - radius,
                 center.x + radius, center.y + radius,
-                outline="red", width=2
+                outline="red", width=2, tags="circles"
             )
             
             self.canvas.create_oval(
                 center.x - 3, center.y - 3,
                 center.x + 3, center.y + 3,
-                fill="red"
+                fill="red", tags="circles"
             )
             
-            for point in circle['points']:
+            for site in circle['points']:
+                point = Point(*self.to_canvas(site.x, site.y))
                 self.canvas.create_oval(
                     point.x - 5, point.y - 5,
                     point.x + 5, point.y + 5,
-                    fill="green"
+                    fill="green", tags="circles"
                 )
 
-    def draw_line(self, line):
-        """Menggambar garis pada canvas."""
-        self.canvas.create_line(line.start.x, line.start.y, line.end.x, line.end.y, fill="blue", width=2)
-
-    def draw_point(self, point, color="black"):
+    def draw_point(self, point, color="black", tags=(), radius=4):
         """Menggambar titik pada canvas."""
-        radius = 4
-        self.canvas.create_oval(point.x - radius, point.y - radius, point.x + radius, point.y + radius, fill=color)
+        self.canvas.create_oval(point.x - radius, point.y - radius, point.x + radius, point.y + radius, fill=color, tags=tags)
 
     def clear_canvas(self):
         """Menghapus semua titik dan sel dari diagram dan canvas."""
         self.diagram.clear()
         self.canvas.delete("all")
+        self.largest_empty_circles = []
+        self.density_mode = False
+        if self.raster is not None:
+            self.raster.rebuild()
+            self.draw_raster()
 
     def load_points_from_file(self):
         """Memuat titik dari file eksternal dan menggambar diagram voronoinya."""
-        file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
+        file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt"), ("Binary Point Files", "*.npy *.bin *.raw *.f64")])
         if not file_path:
             return
 
-        try:
-            self.clear_canvas()
-            
-            # membaca dan menambahkan sites
-            with open(file_path, "r") as file:
-                for line in file:
-                    line = line.strip()
-                    if line:
-                        x, y = map(int, line.strip("()").split(","))
-                        point = Point(x, y)
-                        self.diagram.add_point(point)
-
-            # menggambar diagram
-            self.draw_cells()
-            self.find_and_draw_empty_circles()
-        except Exception as e:
-            print(f"Error loading points: {e}")
+        # membaca dan menambahkan sites di background; error dilaporkan oleh poll_worker
+        self.clear_canvas()
+        self.start_build(file_path=file_path)
 
 def main():
     """Fungsi utama untuk menjalankan GUI."""
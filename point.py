@@ -3,6 +3,8 @@ class Point:
 
     EPSILON = 1e-7 # toleransi untuk floating point
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         """Inisialisasi objek Point dengan koordinat x dan y."""
         self.x = x
@@ -0,0 +1,83 @@
+import mmap
+import os
+from point import Point
+
+CHUNK_SIZE = 65536 # jumlah titik per chunk
+TEXT_TABLE = str.maketrans("(),", "   ") # kurung dan koma diganti spasi sebelum split
+RAW_EXTENSIONS = (".bin", ".raw", ".f64")
+
+def parse_point(line: str) -> Point:
+    """Membaca satu baris dengan format "(x, y)" atau "x, y" menjadi Point (koordinat boleh float)."""
+    x, y = map(float, line.strip().strip("()").split(","))
+    return Point(x, y)
+
+def pairs_to_points(values) -> list[Point]:
+    """Mengubah deretan angka datar x0, y0, x1, y1, ... menjadi list Point."""
+    it = iter(values)
+    return [Point(x, y) for x, y in zip(it, it)]
+
+def iter_text_chunks(file_path: str, chunk_size: int = CHUNK_SIZE):
+    """Membaca file teks per chunk dan menghasilkan list Point untuk setiap chunk.
+
+    Satu chunk dibaca sekaligus lalu di-parse dengan satu translate + split (bukan per
+    baris), sehingga memori yang dipakai hanya sebesar satu chunk."""
+    with open(file_path, "r") as file:
+        while True:
+            # readlines dengan hint: kira-kira chunk_size baris (~16 karakter per baris)
+            lines = file.readlines(chunk_size * 16)
+            if not lines:
+                return
+            values = "".join(lines).translate(TEXT_TABLE).split()
+            if len(values) % 2:
+                raise ValueError(f"Odd number of coordinates in {file_path}")
+            yield pairs_to_points(map(float, values))
+
+def iter_raw_chunks(file_path: str, chunk_size: int = CHUNK_SIZE):
+    """Membaca file biner float64 (x, y) berpasangan lewat memory map, per chunk."""
+    if os.path.getsize(file_path) == 0:
+        return
+    with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        view = memoryview(data)
+        try:
+            if len(view) % 16:
+                raise ValueError(f"{file_path} is not a sequence of float64 pairs")
+            values = view.cast("d")
+            try:
+                for start in range(0, len(values), 2 * chunk_size):
+                    yield pairs_to_points(values[start:start + 2 * chunk_size].tolist())
+            finally:
+                values.release()
+        finally:
+            view.release()
+
+def iter_npy_chunks(file_path: str, chunk_size: int = CHUNK_SIZE):
+    """Membaca array NumPy (n, 2) dari file .npy lewat memory map, per chunk."""
+    import numpy as np
+
+    values = np.load(file_path, mmap_mode="r")
+    if values.ndim != 2 or values.shape[1] != 2:
+        raise ValueError(f"{file_path} must contain an (n, 2) array")
+    for start in range(0, len(values), chunk_size):
+        chunk = np.asarray(values[start:start + chunk_size], dtype=np.float64)
+        yield pairs_to_points(chunk.ravel().tolist())
+
+def iter_point_chunks(file_path: str, chunk_size: int = CHUNK_SIZE):
+    """Menghasilkan titik dari file per chunk sesuai ekstensinya (.npy, biner float64, atau teks)."""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".npy":
+        return iter_npy_chunks(file_path, chunk_size)
+    elif extension in RAW_EXTENSIONS:
+        return iter_raw_chunks(file_path, chunk_size)
+    return iter_text_chunks(file_path, chunk_size)
+
+def iter_points(file_path: str, chunk_size: int = CHUNK_SIZE):
+    """Generator yang menghasilkan titik dari file satu per satu (dibaca per chunk)."""
+    for chunk in iter_point_chunks(file_path, chunk_size):
+        yield from chunk
+
+def read_points(file_path: str) -> list[Point]:
+    """Membaca semua titik dari file (teks, .npy, atau biner float64)."""
+    points = []
+    for chunk in iter_point_chunks(file_path):
+        points.extend(chunk)
+    return points
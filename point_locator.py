@@ -0,0 +1,214 @@
+import math
+import random
+from collections import OrderedDict
+from geometry import Geometry
+
+class PointLocator:
+    """Kelas dasar untuk memilih cell awal dari greedy walk pada find_cell.
+
+    Setiap locator juga menyimpan counter jumlah query dan jumlah langkah walk
+    sehingga pengurangan panjang walk antar locator bisa dibandingkan."""
+
+    def __init__(self):
+        """Konstruktor untuk inisialisasi counter locator."""
+        self.diagram = None
+        self.queries = 0
+        self.walk_steps = 0
+
+    def attach(self, diagram):
+        """Menghubungkan locator dengan diagram dan membangun ulang indeksnya."""
+        self.diagram = diagram
+        self.rebuild()
+
+    def rebuild(self):
+        """Membangun ulang indeks dari semua cell yang ada di diagram."""
+        for cell in self.diagram.get_cells():
+            self.insert(cell)
+
+    def insert(self, cell):
+        """Memperbarui indeks setelah cell baru ditambahkan ke diagram."""
+        pass
+
+    def remove(self, cell):
+        """Memperbarui indeks setelah cell dihapus dari diagram."""
+        pass
+
+    def start_cell(self, p):
+        """Mengembalikan cell awal untuk greedy walk menuju titik p."""
+        return self.diagram.cells[-1]
+
+    def record(self, steps: int):
+        """Mencatat panjang walk dari satu query find_cell."""
+        self.queries += 1
+        self.walk_steps += steps
+
+    def mean_walk_length(self) -> float:
+        """Mengembalikan rata-rata langkah walk per query."""
+        return self.walk_steps / self.queries if self.queries else 0.0
+
+    def reset_counters(self):
+        """Mengembalikan semua counter ke nol."""
+        self.queries = 0
+        self.walk_steps = 0
+
+
+class LastCellLocator(PointLocator):
+    """Locator default: walk selalu dimulai dari cell yang terakhir ditambahkan."""
+
+
+class GridLocator(PointLocator):
+    """Locator berbasis uniform bucket grid di atas boundary diagram.
+
+    Setiap bucket menyimpan satu cell yang site-nya berada di bucket tersebut.
+    Resolusi grid digandakan otomatis ketika rata-rata isi bucket melebihi
+    'max_load' sehingga walk tetap pendek saat jumlah site bertambah."""
+
+    def __init__(self, resolution: int = 16, max_load: int = 4):
+        """Konstruktor dengan resolusi awal (bucket per sisi) dan batas isi bucket."""
+        super().__init__()
+        self.resolution = resolution
+        self.max_load = max_load
+        self.buckets = []
+        self.count = 0
+
+    def rebuild(self):
+        """Membangun ulang grid dari semua cell yang ada di diagram."""
+        self.buckets = [None] * (self.resolution * self.resolution)
+        self.count = 0
+        super().rebuild()
+
+    def bucket_index(self, p) -> int:
+        """Mengembalikan indeks bucket untuk titik p (dijepit ke dalam boundary)."""
+        boundary = self.diagram.boundary
+        n = self.resolution
+        i = int((p.x - boundary.x_min) * n / (boundary.x_max - boundary.x_min))
+        j = int((p.y - boundary.y_min) * n / (boundary.y_max - boundary.y_min))
+        i = min(max(i, 0), n - 1)
+        j = min(max(j, 0), n - 1)
+        return j * n + i
+
+    def insert(self, cell):
+        """Menyimpan cell pada bucket tempat site-nya berada."""
+        # cell super triangle berada jauh di luar boundary, tidak perlu diindeks
+        if not self.diagram.boundary.contains(cell.site):
+            return
+
+        self.buckets[self.bucket_index(cell.site)] = cell
+        self.count += 1
+
+        # perbesar grid kalau bucket sudah terlalu padat
+        if self.count > self.max_load * len(self.buckets):
+            self.resolution *= 2
+            self.rebuild()
+
+    def remove(self, cell):
+        """Mengosongkan bucket yang menunjuk ke cell yang dihapus."""
+        if not self.diagram.boundary.contains(cell.site):
+            return
+
+        index = self.bucket_index(cell.site)
+        if self.buckets[index] is cell:
+            self.buckets[index] = None
+        self.count -= 1
+
+    def start_cell(self, p):
+        """Mengembalikan cell dari bucket terdekat yang tidak kosong."""
+        n = self.resolution
+        index = self.bucket_index(p)
+        i, j = index % n, index // n
+
+        # cari ring bucket di sekitar (i, j) yang tidak kosong
+        for radius in range(n):
+            for jj in range(max(j - radius, 0), min(j + radius, n - 1) + 1):
+                for ii in range(max(i - radius, 0), min(i + radius, n - 1) + 1):
+                    if max(abs(ii - i), abs(jj - j)) != radius:
+                        continue
+                    cell = self.buckets[jj * n + ii]
+                    if cell is not None:
+                        return cell
+
+        return self.diagram.cells[-1]
+
+
+class JumpAndWalkLocator(PointLocator):
+    """Locator jump-and-walk: ambil sampel acak cell, mulai dari site sampel terdekat.
+
+    Ukuran sampel default mengikuti n^(1/3) sehingga ekspektasi panjang walk
+    turun dari O(sqrt n) menjadi O(n^(1/6))."""
+
+    def __init__(self, sample_size: int = None, seed: int = None):
+        """Konstruktor dengan ukuran sampel (opsional) dan seed random."""
+        super().__init__()
+        self.sample_size = sample_size
+        self.random = random.Random(seed)
+
+    def start_cell(self, p):
+        """Mengembalikan cell sampel yang site-nya paling dekat dengan p."""
+        cells = self.diagram.cells
+        k = self.sample_size or max(1, round(len(cells) ** (1 / 3)))
+        best = cells[-1]
+        best_dist = Geometry.dist_squared(best.site, p)
+
+        for _ in range(k):
+            cell = cells[self.random.randrange(len(cells))]
+            dist = Geometry.dist_squared(cell.site, p)
+            if dist < best_dist:
+                best = cell
+                best_dist = dist
+
+        return best
+
+
+class LocateCache:
+    """Cache LRU berukuran tetap untuk query lokasi yang sering berulang.
+
+    Key-nya adalah koordinat query yang dikuantisasi ke grid berukuran 'quantum', isinya
+    id cell jawaban terakhir untuk key tsb. Isi cache hanya dipakai sebagai cell awal walk
+    sehingga jawaban tetap tepat walaupun dua query di key yang sama berada di cell berbeda.
+    Entry milik cell yang berubah dibuang lewat 'invalidate'."""
+
+    def __init__(self, capacity: int = 65536, quantum: float = 1.0):
+        """Konstruktor dengan jumlah entry maksimum dan ukuran grid kuantisasi."""
+        self.capacity = capacity
+        self.quantum = quantum
+        self.entries = OrderedDict() # key -> id cell, urutan dari yang paling lama tidak dipakai
+        self.keys_of = {} # id cell -> set key yang menunjuk ke cell tsb
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, x: float, y: float) -> tuple[int, int]:
+        """Mengembalikan key kuantisasi untuk koordinat (x, y)."""
+        return (math.floor(x / self.quantum), math.floor(y / self.quantum))
+
+    def get(self, key):
+        """Mengembalikan id cell untuk key (dan menandainya baru dipakai), atau None."""
+        cell_id = self.entries.get(key)
+        if cell_id is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return cell_id
+
+    def put(self, key, cell_id: int):
+        """Menyimpan id cell untuk key, membuang entry paling lama jika cache penuh."""
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.keys_of[old].discard(key)
+        self.entries[key] = cell_id
+        self.keys_of.setdefault(cell_id, set()).add(key)
+
+        if len(self.entries) > self.capacity:
+            evicted, evicted_id = self.entries.popitem(last=False)
+            self.keys_of[evicted_id].discard(evicted)
+
+    def invalidate(self, cell_ids):
+        """Membuang semua entry yang menunjuk ke cell dengan id di 'cell_ids'."""
+        for cell_id in cell_ids:
+            for key in self.keys_of.pop(cell_id, ()):
+                del self.entries[key]
+
+    def clear(self):
+        """Membuang semua entry."""
+        self.entries.clear()
+        self.keys_of.clear()
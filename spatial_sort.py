@@ -0,0 +1,67 @@
+import random
+from bounding_box import BoundingBox
+from point import Point
+
+HILBERT_ORDER = 16 # grid hilbert 2^16 x 2^16
+
+def hilbert_index(x: int, y: int, order: int = HILBERT_ORDER) -> int:
+    """Menghitung posisi sel (x, y) di sepanjang kurva hilbert pada grid 2^order."""
+    d = 0
+    s = 1 << (order - 1)
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+
+        # rotasi kuadran supaya kurva tetap kontinu
+        if ry == 0:
+            if rx == 1:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+def hilbert_sort(points: list[Point], boundary: BoundingBox) -> list[Point]:
+    """Mengurutkan titik di sepanjang kurva hilbert di atas boundary."""
+    n = (1 << HILBERT_ORDER) - 1
+    x_scale = n / ((boundary.x_max - boundary.x_min) or 1)
+    y_scale = n / ((boundary.y_max - boundary.y_min) or 1)
+
+    def key(p):
+        # titik di luar boundary dijepit ke tepi grid
+        x = min(max(int((p.x - boundary.x_min) * x_scale), 0), n)
+        y = min(max(int((p.y - boundary.y_min) * y_scale), 0), n)
+        return hilbert_index(x, y)
+
+    return sorted(points, key=key)
+
+def brio_sort(points: list[Point], boundary: BoundingBox, rng: random.Random = None, min_round: int = 64) -> list[Point]:
+    """Biased randomized insertion order: titik diacak ke ronde berukuran n/2, n/4, ...
+    lalu setiap ronde diurutkan dengan kurva hilbert."""
+    rng = rng or random.Random()
+    rest = list(points)
+    rng.shuffle(rest)
+
+    # ronde terakhir berisi setengah titik, ronde sebelumnya setengah sisanya, dst.
+    rounds = []
+    while len(rest) > min_round:
+        half = len(rest) // 2
+        rounds.append(rest[half:])
+        rest = rest[:half]
+    rounds.append(rest)
+
+    result = []
+    for batch in reversed(rounds):
+        result.extend(hilbert_sort(batch, boundary))
+    return result
+
+def spatial_sort(points: list[Point], boundary: BoundingBox, order: str = "hilbert", rng: random.Random = None) -> list[Point]:
+    """Mengurutkan titik sesuai strategi 'order' ("hilbert", "brio", atau "input")."""
+    if order == "hilbert":
+        return hilbert_sort(points, boundary)
+    elif order == "brio":
+        return brio_sort(points, boundary, rng)
+    elif order == "input":
+        return list(points)
+    raise ValueError(f"Unknown insertion order: {order}")
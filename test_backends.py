@@ -0,0 +1,99 @@
+import glob
+import math
+import os
+import random
+import pytest
+from diagram_stats import DiagramStats
+from point import Point
+from point_io import read_points
+from voronoi_diagram import VoronoiDiagram
+
+INPUT_FILES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "input", "input_examples*")))
+
+# jumlah pasangan tetangga yang berbeda antara backend "incremental" dan sweep line.
+# input_examples5 adalah grid 2x15 cocircular: setiap empat site sebuah persegi panjang bertemu
+# di satu vertex yang dipecah menjadi dua vertex dengan edge panjang nol, dan kedua backend
+# memilih diagonal yang berbeda untuk 8 dari persegi panjang tsb (57 tetangga di kedua backend)
+KNOWN_DIFFERENCES = {"input_examples5.txt": 8}
+
+def adjacency(diagram, zero_length=True):
+    """Himpunan pasangan site tetangga (tanpa cell super triangle), opsional tanpa edge panjang nol."""
+    mesh = diagram.mesh
+    result = set()
+    for cell in diagram.get_cells()[3:]:
+        for h in mesh.ring(cell.id):
+            t = mesh.twin[h]
+            if t < 0 or mesh.face[t] < 3:
+                continue
+            if not zero_length and mesh.vertex_point(mesh.origin[h]) == mesh.vertex_point(mesh.end(h)):
+                continue
+            other = mesh.cells[mesh.face[t]].site
+            result.add(tuple(sorted(((cell.site.x, cell.site.y), (other.x, other.y)))))
+    return result
+
+def build(path, backend):
+    """Membangun diagram dari file input dengan backend tertentu."""
+    diagram = VoronoiDiagram(600, backend=backend, workers=2)
+    diagram.add_points(read_points(path))
+    return diagram
+
+@pytest.mark.parametrize("backend", ["fortune", "parallel"])
+@pytest.mark.parametrize("path", INPUT_FILES, ids=os.path.basename)
+def test_sweep_line_matches_incremental(path, backend):
+    expected = build(path, "incremental")
+    actual = build(path, backend)
+    assert len(actual.get_cells()) == len(expected.get_cells())
+
+    # edge dengan panjang positif selalu sama; hanya diagonal site cocircular yang boleh berbeda
+    assert adjacency(actual, zero_length=False) == adjacency(expected, zero_length=False)
+    known = KNOWN_DIFFERENCES.get(os.path.basename(path), 0)
+    assert len(adjacency(actual)) == len(adjacency(expected))
+    assert len(adjacency(actual) - adjacency(expected)) == known
+
+@pytest.mark.parametrize("backend", ["fortune", "parallel"])
+@pytest.mark.parametrize("scale", [0.001, 0.01, 600, 1e6])
+def test_sweep_line_is_scale_invariant(scale, backend):
+    rng = random.Random(3)
+    points = [Point(rng.uniform(0, scale), rng.uniform(0, scale)) for _ in range(300)]
+    diagrams = {}
+    for name in ("incremental", backend):
+        diagrams[name] = VoronoiDiagram(scale, backend=name, workers=2)
+        diagrams[name].add_points(points)
+    assert adjacency(diagrams[backend]) == adjacency(diagrams["incremental"])
+
+@pytest.mark.parametrize("backend", ["incremental", "fortune", "parallel"])
+def test_remove_cell_on_lattice(backend):
+    # site cocircular: vertex sweep line yang digabung harus tetap bisa dihapus
+    diagram = VoronoiDiagram(600, backend=backend, workers=2)
+    diagram.add_points([Point(10 + i * 20, 10 + j * 20) for i in range(20) for j in range(10)])
+    for cell in list(diagram.get_cells()[3:]):
+        assert diagram.remove_cell(cell.id)
+    assert len(diagram.get_cells()) == 3
+
+@pytest.mark.parametrize("layout", ["lattice", "collinear", "cocircular", "cluster"])
+def test_insert_rejects_only_duplicates_inside_boundary(layout):
+    # predikat eksak: site sebaris/cocircular di dalam boundary tidak pernah ditolak
+    rng = random.Random(11)
+    if layout == "lattice":
+        points = [Point(rng.randrange(0, 60) * 10, rng.randrange(0, 60) * 10) for _ in range(2000)]
+    elif layout == "collinear":
+        points = [Point(i * 3, i * 2) for i in range(200)] + [Point(i * 3, 300) for i in range(200)]
+    elif layout == "cocircular":
+        points = [Point(300 + 250 * math.cos(k * math.pi / 180), 300 + 250 * math.sin(k * math.pi / 180))
+                  for k in range(360)] + [Point(300, 300)]
+    else:
+        points = [Point(300 + rng.uniform(0, 1e-6), 300 + rng.uniform(0, 1e-6)) for _ in range(300)]
+    stats = DiagramStats()
+    diagram = VoronoiDiagram(600, stats=stats)
+    for p in points:
+        diagram.add_point(p)
+    assert stats.rollbacks == 0
+    assert stats.inserts == len(diagram.get_cells()) - 3 == len(points) - stats.rejected["duplicate"]
+
+def test_insert_outside_boundary_is_rejected_by_frame():
+    rng = random.Random(12)
+    stats = DiagramStats()
+    diagram = VoronoiDiagram(600, stats=stats)
+    for _ in range(300):
+        diagram.add_point(Point(rng.uniform(-20000, 20000), rng.uniform(-20000, 20000)))
+    assert stats.rollbacks == stats.rejected["frame"] + stats.rejected["intersections"] > 0
@@ -0,0 +1,41 @@
+import itertools
+import random
+import pytest
+from geometry import Geometry
+from point import Point
+from voronoi_diagram import VoronoiDiagram
+
+def brute_force_triangles(diagram):
+    """Semua segitiga CCW dari site asli yang lingkaran luarnya tidak memuat site lain (diputar ke id terkecil)."""
+    cells = diagram.get_cells()[3:]
+    result = set()
+    for a, b, c in itertools.combinations(cells, 3):
+        orientation = Geometry.orientation(a.site, b.site, c.site)
+        if orientation == 0:
+            continue
+        if orientation < 0:
+            b, c = c, b
+        if all(Geometry.incircle(a.site, b.site, c.site, x.site) <= 0 for x in cells if x not in (a, b, c)):
+            result.add(rotated((a.id, b.id, c.id)))
+    return result
+
+def rotated(triangle):
+    """Memutar segitiga supaya id terkecil berada di depan (orientasi tetap)."""
+    k = triangle.index(min(triangle))
+    return tuple(triangle[k:] + triangle[:k])
+
+@pytest.mark.parametrize("backend", ["incremental", "fortune"])
+@pytest.mark.parametrize("layout", range(10))
+def test_triangles_include_convex_hull(layout, backend):
+    # segitiga tipis di tepi hull punya lingkaran luar yang memuat site super triangle
+    rng = random.Random(layout)
+    diagram = VoronoiDiagram(600, backend=backend)
+    diagram.add_points([Point(rng.uniform(0, 600), rng.uniform(0, 600)) for _ in range(40)])
+    for step in range(3):
+        expected = brute_force_triangles(diagram)
+        assert {rotated(t) for t in diagram.delaunay_triangles().tolist()} == expected
+        edges = {(min(a, b), max(a, b)) for t in expected for a, b in zip(t, t[1:] + t[:1])}
+        assert {tuple(e) for e in diagram.delaunay_edges().tolist()} == edges
+
+        diagram.add_point(Point(rng.uniform(0, 600), rng.uniform(0, 600)))
+        diagram.remove_cell(rng.choice([cell.id for cell in diagram.get_cells()[3:]]))
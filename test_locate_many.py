@@ -0,0 +1,45 @@
+import random
+import numpy as np
+import pytest
+from cell_metrics import CellMetrics
+from point import Point
+from voronoi_diagram import VoronoiDiagram
+
+def nearest(diagram, x, y):
+    """Id cell dengan site terdekat ke (x, y), dicari satu per satu (tanpa cell super triangle)."""
+    return min(diagram.get_cells()[3:], key=lambda cell: (cell.site.x - x) ** 2 + (cell.site.y - y) ** 2).id
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_locate_many_matches_brute_force(cached):
+    rng = random.Random(5)
+    diagram = VoronoiDiagram(600)
+    # separuh site menggerombol supaya banyak bucket grid yang kosong
+    diagram.add_points([Point(rng.uniform(0, 600), rng.uniform(0, 600)) for _ in range(300)]
+                       + [Point(rng.gauss(100, 5), rng.gauss(500, 5)) for _ in range(300)])
+    if cached:
+        diagram.enable_locate_cache(quantum=20)
+
+    xs = np.array([rng.uniform(-200, 800) for _ in range(2000)])
+    ys = np.array([rng.uniform(-200, 800) for _ in range(2000)])
+    for _ in range(2):
+        assert diagram.locate_many(xs, ys).tolist() == [nearest(diagram, x, y) for x, y in zip(xs, ys)]
+        for _ in range(20):
+            diagram.add_point(Point(rng.uniform(0, 600), rng.uniform(0, 600)))
+            diagram.remove_cell(rng.choice(diagram.get_cells()[3:]).id)
+
+    assert diagram.locate_many(xs.reshape(40, 50), ys.reshape(40, 50)).shape == (40, 50)
+
+def test_neighbors_csr_after_edits():
+    # CSR yang diperbarui per cell harus sama dengan CSR yang dibangun ulang dari awal
+    rng = random.Random(7)
+    diagram = VoronoiDiagram(600)
+    diagram.add_points([Point(rng.uniform(0, 600), rng.uniform(0, 600)) for _ in range(200)])
+    diagram.neighbors_csr()
+    for _ in range(30):
+        diagram.add_point(Point(rng.uniform(0, 600), rng.uniform(0, 600)))
+        diagram.remove_cell(rng.choice(diagram.get_cells()[3:]).id)
+        diagram.move_cell(rng.choice(diagram.get_cells()[3:]).id, Point(rng.uniform(0, 600), rng.uniform(0, 600)))
+        indptr, indices = diagram.neighbors_csr()
+        expected = CellMetrics(diagram).neighbors_csr()
+        assert indptr.tolist() == expected[0].tolist()
+        assert indices.tolist() == expected[1].tolist()
@@ -0,0 +1,300 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from bounding_box import BoundingBox
+from fortune import FortuneSweep
+from geometry import Geometry
+from point import Point
+
+EPSILON = 1e-7 # toleransi untuk floating point
+
+def circle_hits_rect(cx: float, cy: float, r: float, rect: tuple) -> bool:
+    """Mengecek apakah lingkaran (cx, cy, r) beririsan dengan persegi panjang (x0, y0, x1, y1)."""
+    x0, y0, x1, y1 = rect
+    if x0 > x1 or y0 > y1:
+        return False
+    dx = cx - min(max(cx, x0), x1)
+    dy = cy - min(max(cy, y0), y1)
+    return dx * dx + dy * dy <= r * r
+
+def unknown_region(extent: tuple, region: tuple) -> list[tuple]:
+    """Bagian dari 'extent' (kotak semua site) di luar 'region', sebagai paling banyak 4 persegi panjang."""
+    ex0, ey0, ex1, ey1 = extent
+    rx0, ry0, rx1, ry1 = region
+    return [(ex0, ey0, rx0, ey1), (rx1, ey0, ex1, ey1),
+            (max(ex0, rx0), ey0, min(ex1, rx1), ry0), (max(ex0, rx0), ry1, min(ex1, rx1), ey1)]
+
+def convex_hull(points: list[Point], indices: list[int]) -> list[int]:
+    """Monotone chain: indeks titik di convex hull, termasuk titik collinear di sisi hull."""
+    order = sorted(indices, key=lambda i: (points[i].x, points[i].y))
+    if len(order) <= 2:
+        return order
+
+    def chain(sequence):
+        result = []
+        for i in sequence:
+            while len(result) >= 2 and Geometry.cross_product(points[result[-2]], points[result[-1]], points[i]) < 0:
+                result.pop()
+            result.append(i)
+        return result
+
+    lower = chain(order)
+    upper = chain(reversed(order))
+    return list(dict.fromkeys(lower + upper)) # semua titik collinear: lower dan upper sama
+
+def build_tile(task: dict) -> dict:
+    """Worker: membangun diagram voronoi satu tile (site milik tile + halo + site super triangle).
+
+    Untuk setiap vertex dari cell milik tile, lingkaran kosongnya dianggap pasti benar jika
+    tidak menyentuh area di luar region yang site-nya diketahui tile ini. Vertex yang tidak
+    pasti dikembalikan bersama lingkarannya untuk diverifikasi oleh proses utama. Hasil
+    dengan 'valid' False berarti tile harus dibangun ulang dengan margin lebih besar."""
+    ids = task["ids"]
+    sites = [Point(x, y) for x, y in task["sites"]]
+    owned = set(range(task["owned"])) # site milik tile berada di awal list
+    outside = unknown_region(task["extent"], task["region"])
+
+    sweep = FortuneSweep(sites)
+    sweep.run()
+    segments = sweep.segments(BoundingBox(*task["frame"]))
+
+    # site yang bertemu di setiap vertex (vertex cocircular sudah digabung oleh segments)
+    incident = {}
+    for a, b, start, end in segments:
+        incident.setdefault(id(start), set()).update((a, b))
+        incident.setdefault(id(end), set()).update((a, b))
+
+    def key(p):
+        return tuple(sorted(ids[i] for i in incident[id(p)]))
+
+    edges = []
+    uncertain = {}
+    for a, b, start, end in segments:
+        if a in owned or b in owned:
+            pass
+        elif ids[a] < 3 and ids[b] < 3 and (incident[id(start)] | incident[id(end)]) & owned:
+            pass # edge antara dua cell super yang berawal di vertex milik tile ini
+        else:
+            continue
+
+        for p in (start, end):
+            sites_at = incident[id(p)]
+            if len(sites_at) < 3:
+                # hanya edge antar cell super yang boleh berujung di frame; selain itu hasil
+                # sweep lokal tidak konsisten (misalnya site collinear yang terpotong margin)
+                if ids[a] >= 3 or ids[b] >= 3:
+                    return {"tile": task["tile"], "edges": [], "uncertain": {}, "valid": False}
+                continue
+            r = Geometry.distance(p, sites[next(iter(sites_at))])
+            r_check = r * (1 + EPSILON) + EPSILON
+            if any(circle_hits_rect(p.x, p.y, r_check, rect) for rect in outside):
+                uncertain[key(p)] = (p.x, p.y, r)
+        edges.append((ids[a], ids[b], key(start), (start.x, start.y), key(end), (end.x, end.y)))
+
+    return {"tile": task["tile"], "edges": edges, "uncertain": uncertain, "valid": True}
+
+
+class SiteGrid:
+    """Bucket grid semua site untuk memverifikasi bahwa sebuah lingkaran benar-benar kosong."""
+
+    def __init__(self, sites: list[Point], extent: tuple):
+        """Konstruktor grid dengan sekitar dua site per bucket di atas 'extent'."""
+        self.sites = sites
+        self.x0, self.y0, x1, y1 = extent
+        self.n = max(1, int(math.sqrt(len(sites) / 2)))
+        self.w = max(x1 - self.x0, EPSILON) / self.n
+        self.h = max(y1 - self.y0, EPSILON) / self.n
+        self.buckets = [[] for _ in range(self.n * self.n)]
+        for i, p in enumerate(sites):
+            if i >= 3: # site super triangle tidak pernah berada di dalam lingkaran kosong
+                self.buckets[self.row(p.y) * self.n + self.column(p.x)].append(i)
+
+    def column(self, x: float) -> int:
+        """Indeks kolom bucket untuk koordinat x (dijepit ke dalam grid)."""
+        return min(max(int((x - self.x0) / self.w), 0), self.n - 1)
+
+    def row(self, y: float) -> int:
+        """Indeks baris bucket untuk koordinat y (dijepit ke dalam grid)."""
+        return min(max(int((y - self.y0) / self.h), 0), self.n - 1)
+
+    def conflicts(self, cx: float, cy: float, r: float, allowed: tuple) -> list[int]:
+        """Mengembalikan site selain 'allowed' yang berada di dalam atau tepat di lingkaran."""
+        r_check = r * (1 + EPSILON) + EPSILON
+        allowed = set(allowed)
+        result = []
+        for j in range(self.row(cy - r_check), self.row(cy + r_check) + 1):
+            # rentang kolom yang beririsan dengan lingkaran pada baris j
+            y_near = min(max(cy, self.y0 + j * self.h), self.y0 + (j + 1) * self.h)
+            half = math.sqrt(max(r_check * r_check - (y_near - cy) ** 2, 0.0))
+            for i in range(self.column(cx - half), self.column(cx + half) + 1):
+                for s in self.buckets[j * self.n + i]:
+                    p = self.sites[s]
+                    if s not in allowed and (p.x - cx) ** 2 + (p.y - cy) ** 2 <= r_check * r_check:
+                        result.append(s)
+        return result
+
+
+class TileBuilder:
+    """Konstruksi diagram voronoi paralel per tile dengan penyambungan di sepanjang seam.
+
+    Kotak semua site dibagi menjadi tile. Setiap tile dibangun di proses terpisah dengan
+    FortuneSweep dari site miliknya ditambah site di sekitar tile (margin), site di convex
+    hull, dan tiga site super triangle. Edge dari cell milik tile diambil dan disambung di proses utama: vertex
+    yang sama dikenali dari himpunan site yang bertemu di sana. Vertex yang lingkaran
+    kosongnya tidak bisa dipastikan di dalam tile diverifikasi dengan SiteGrid; jika ada site
+    di dalam lingkaran tsb, tile dibangun ulang dengan site tsb ikut dimasukkan. Tile yang hasil
+    sweep-nya tidak konsisten dibangun ulang dengan margin dua kali lipat."""
+
+    def __init__(self, workers: int = None, tiles: int = None, margin: float = 4.0):
+        """Konstruktor dengan jumlah proses, jumlah tile (default 2 per proses, atau 1 tile
+        jika hanya ada satu proses), dan margin awal dalam satuan jarak rata-rata antar site."""
+        self.workers = workers or os.cpu_count() or 1
+        self.tiles = tiles or (2 * self.workers if self.workers > 1 else 1)
+        self.sites = []
+        self.margin = margin
+        self.rebuilt_tiles = 0 # jumlah tile yang harus dibangun ulang
+
+    def build(self, sites: list[Point], frame: BoundingBox) -> tuple[list, list]:
+        """Membangun diagram dari 'sites' (tiga site pertama adalah super triangle, tanpa duplikat).
+
+        Mengembalikan (vertices, segments): vertices berupa list (x, y) dan segments berupa
+        list (vertex awal, vertex akhir, indeks site a, indeks site b) untuk HalfEdgeMesh.build."""
+        self.sites = sites
+        real = sites[3:]
+        if not real:
+            sweep = FortuneSweep(sites)
+            sweep.run()
+            return self.collect([{"edges": self.plain_edges(sweep.segments(frame))}])
+
+        xs = [p.x for p in real]
+        ys = [p.y for p in real]
+        extent = (min(xs), min(ys), max(xs), max(ys))
+        width = max(extent[2] - extent[0], EPSILON)
+        height = max(extent[3] - extent[1], EPSILON)
+
+        # grid tile mendekati persegi
+        nx = max(1, round(math.sqrt(self.tiles * width / height)))
+        ny = max(1, math.ceil(self.tiles / nx))
+        tile_w, tile_h = width / nx, height / ny
+        spacing = math.sqrt(width * height / len(real))
+
+        owned = [[] for _ in range(nx * ny)]
+        for i in range(3, len(sites)):
+            p = sites[i]
+            tx = min(int((p.x - extent[0]) / tile_w), nx - 1)
+            ty = min(int((p.y - extent[1]) / tile_h), ny - 1)
+            owned[ty * nx + tx].append(i)
+
+        frame_box = (frame.x_min, frame.y_min, frame.x_max, frame.y_max)
+        grid = SiteGrid(sites, extent)
+
+        # site di convex hull global ikut di setiap tile sehingga hull lokal sama dengan hull global
+        hull = convex_hull(sites, list(range(3, len(sites))))
+        extra = {t: [] for t in range(nx * ny)} # site tambahan per tile di luar region-nya
+
+        # lingkaran lewat site super triangle sangat besar dan menyapu pita tipis di sepanjang tepi,
+        # jadi tile di tepi langsung diberi semua site di pita selebar 'spacing'
+        band = [i for i in range(3, len(sites))
+                if min(sites[i].x - extent[0], extent[2] - sites[i].x,
+                       sites[i].y - extent[1], extent[3] - sites[i].y) <= spacing]
+        for t in extra:
+            tx, ty = t % nx, t // nx
+            if tx in (0, nx - 1) or ty in (0, ny - 1):
+                extra[t].extend(band)
+
+        def task(t, margin):
+            tx, ty = t % nx, t // nx
+            region = (extent[0] + tx * tile_w - margin, extent[1] + ty * tile_h - margin,
+                      extent[0] + (tx + 1) * tile_w + margin, extent[1] + (ty + 1) * tile_h + margin)
+            mine = set(owned[t])
+            halo = self.sites_in(owned, nx, ny, extent, tile_w, tile_h, region)
+            halo = [i for i in dict.fromkeys(halo + hull + extra[t]) if i not in mine]
+            ids = owned[t] + halo + [0, 1, 2]
+            return {"tile": t, "ids": ids, "sites": [(sites[i].x, sites[i].y) for i in ids],
+                    "owned": len(owned[t]), "region": region, "extent": extent, "frame": frame_box}
+
+        margins = {t: self.margin * spacing for t in range(nx * ny) if owned[t]}
+        accepted = []
+        pending = list(margins)
+        self.rebuilt_tiles = 0
+        while pending:
+            tasks = {t: task(t, margins[t]) for t in pending}
+            results = self.run(list(tasks.values()))
+            pending = []
+            for result in results:
+                t = result["tile"]
+                if not result["valid"]:
+                    if margins[t] > max(width, height):
+                        # tile sudah melihat semua site, sweep-nya sendiri tidak konsisten
+                        raise RuntimeError(f"Tile {t} could not be built consistently")
+                    margins[t] *= 2
+                    pending.append(t)
+                    self.rebuilt_tiles += 1
+                    continue
+
+                # site yang berada di lingkaran kosong vertex tile ini ikut di run berikutnya
+                # (site yang sudah ikut di sweep tile ini hanya cocircular, bukan pelanggaran)
+                missing = set()
+                for key, (cx, cy, r) in result["uncertain"].items():
+                    missing.update(grid.conflicts(cx, cy, r, key))
+                missing.difference_update(tasks[t]["ids"])
+                if missing:
+                    extra[t].extend(missing)
+                    pending.append(t)
+                    self.rebuilt_tiles += 1
+                else:
+                    accepted.append(result)
+
+        return self.collect(accepted)
+
+    def sites_in(self, owned, nx, ny, extent, tile_w, tile_h, region) -> list[int]:
+        """Mengembalikan indeks semua site di dalam 'region' (lewat tile yang beririsan)."""
+        x0, y0, x1, y1 = region
+        tx0 = min(max(int((x0 - extent[0]) / tile_w), 0), nx - 1)
+        tx1 = min(max(int((x1 - extent[0]) / tile_w), 0), nx - 1)
+        ty0 = min(max(int((y0 - extent[1]) / tile_h), 0), ny - 1)
+        ty1 = min(max(int((y1 - extent[1]) / tile_h), 0), ny - 1)
+        result = []
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                for i in owned[ty * nx + tx]:
+                    p = self.sites[i]
+                    if x0 <= p.x <= x1 and y0 <= p.y <= y1:
+                        result.append(i)
+        return result
+
+    def run(self, tasks: list[dict]) -> list[dict]:
+        """Menjalankan build_tile untuk semua task, paralel jika workers > 1."""
+        if self.workers <= 1 or len(tasks) <= 1:
+            return [build_tile(t) for t in tasks]
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(tasks))) as pool:
+            return list(pool.map(build_tile, tasks))
+
+    def plain_edges(self, segments) -> list[tuple]:
+        """Mengubah segmen FortuneSweep tanpa tile menjadi format edge hasil build_tile."""
+        incident = {}
+        for a, b, start, end in segments:
+            incident.setdefault(id(start), set()).update((a, b))
+            incident.setdefault(id(end), set()).update((a, b))
+        return [(a, b, tuple(sorted(incident[id(start)])), (start.x, start.y),
+                 tuple(sorted(incident[id(end)])), (end.x, end.y)) for a, b, start, end in segments]
+
+    def collect(self, results: list[dict]) -> tuple[list, list]:
+        """Menyambung edge dari semua tile: setiap pasangan site dan setiap vertex disimpan sekali."""
+        vertex_index = {}
+        vertices = []
+        segments = []
+        seen = set()
+        for result in results:
+            for a, b, key_start, start, key_end, end in result["edges"]:
+                pair = (min(a, b), max(a, b))
+                if pair in seen:
+                    continue
+                seen.add(pair)
+
+                for key, xy in ((key_start, start), (key_end, end)):
+                    if key not in vertex_index:
+                        vertex_index[key] = len(vertices)
+                        vertices.append(xy)
+                segments.append((vertex_index[key_start], vertex_index[key_end], a, b))
+        return vertices, segments
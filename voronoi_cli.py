@@ -0,0 +1,263 @@
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from point_io import iter_point_chunks, read_points
+from voronoi_diagram import VoronoiDiagram
+
+FORMATS = {"json": ".json", "geojson": ".geojson", "binary": ".vor"}
+BINARY_MAGIC = b"VORB"
+BINARY_VERSION = 2
+
+def diagram_edges(diagram: VoronoiDiagram) -> list[tuple[int, int, int, int]]:
+    """Mengembalikan setiap edge voronoi satu kali sebagai (vertex awal, vertex akhir, cell, tetangga/-1)."""
+    mesh = diagram.mesh
+    edges = []
+    for h, cell_id in enumerate(mesh.face):
+        t = mesh.twin[h]
+        if cell_id >= 0 and (t < 0 or h < t):
+            edges.append((mesh.origin[h], mesh.end(h), cell_id, mesh.face[t] if t >= 0 else -1))
+    return edges
+
+def clipped_edges(diagram: VoronoiDiagram) -> list[tuple[float, float, float, float, int, int]]:
+    """Mengembalikan edge voronoi yang dipotong boundary (seperti cell_polygon) sebagai
+    (x0, y0, x1, y1, cell, tetangga/-1); edge di luar boundary dan edge antar cell super triangle dibuang."""
+    import numpy as np
+
+    mesh = diagram.mesh
+    edges = [edge for edge in diagram_edges(diagram) if edge[2] >= 3 or edge[3] >= 3]
+    xy = mesh.vertex_xy
+    segments = np.array([(xy[2 * va], xy[2 * va + 1], xy[2 * vb], xy[2 * vb + 1]) for va, vb, _, _ in edges],
+                        dtype=np.float64).reshape(-1, 4)
+    segments, keep = diagram.boundary.clip_segments(segments)
+    cells = [edge[2:] for edge, kept in zip(edges, keep.tolist()) if kept]
+    return [(*segment, cell_id, neighbor) for segment, (cell_id, neighbor) in zip(segments.tolist(), cells)]
+
+def cell_polygon(diagram: VoronoiDiagram, cell_id: int) -> list[list[float]]:
+    """Mengembalikan vertex ring cell yang dipotong boundary (seperti centroids) sebagai list [x, y]
+    (berorientasi positif)."""
+    mesh = diagram.mesh
+    ring = [(mesh.vertex_xy[2 * mesh.origin[h]], mesh.vertex_xy[2 * mesh.origin[h] + 1]) for h in mesh.ring(cell_id)]
+    return [[x, y] for x, y in diagram.boundary.clip_polygon(ring)]
+
+def circle_record(circle: dict) -> dict:
+    """Mengubah lingkaran kosong menjadi dict yang bisa ditulis sebagai JSON."""
+    return {
+        "center": [circle["center"].x, circle["center"].y],
+        "radius": circle["radius"],
+        "points": [[p.x, p.y] for p in circle["points"]],
+    }
+
+def to_json(diagram: VoronoiDiagram) -> dict:
+    """Mengubah diagram menjadi dict: cell (tanpa super triangle), edge, dan lingkaran kosong terbesar."""
+    mesh = diagram.mesh
+    cells = []
+    for cell in sorted(diagram.get_cells()[3:], key=lambda c: c.id):
+        cells.append({
+            "id": cell.id,
+            "site": [cell.site.x, cell.site.y],
+            "polygon": cell_polygon(diagram, cell.id),
+            "neighbors": [n.id for n in mesh.neighbors(cell.id) if n.id >= 3],
+        })
+
+    edges = []
+    for x0, y0, x1, y1, cell_id, neighbor in clipped_edges(diagram):
+        edges.append({"start": [x0, y0], "end": [x1, y1], "cells": [cell_id, neighbor]})
+
+    return {
+        "cells": cells,
+        "edges": edges,
+        "largest_empty_circles": [circle_record(c) for c in diagram.largest_empty_circles()],
+    }
+
+def to_geojson(diagram: VoronoiDiagram) -> dict:
+    """Mengubah diagram menjadi GeoJSON FeatureCollection: polygon per cell, edge sebagai LineString,
+    dan titik pusat lingkaran kosong."""
+    data = to_json(diagram)
+    features = []
+    for cell in data["cells"]:
+        ring = cell["polygon"] + cell["polygon"][:1]
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+            "properties": {"kind": "cell", "id": cell["id"], "site": cell["site"], "neighbors": cell["neighbors"]},
+        })
+    for edge in data["edges"]:
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": [edge["start"], edge["end"]]},
+            "properties": {"kind": "edge", "cells": edge["cells"]},
+        })
+    for circle in data["largest_empty_circles"]:
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": circle["center"]},
+            "properties": {"kind": "largest_empty_circle", "radius": circle["radius"], "points": circle["points"]},
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+def write_binary(diagram: VoronoiDiagram, file):
+    """Menulis diagram dalam format biner little-endian.
+
+    Header: magic "VORB", versi, jumlah site, edge, dan lingkaran (uint32).
+    Isi: site_xy float64 (diindeks id cell, NaN untuk id kosong), edge yang dipotong boundary
+    float64 (x0, y0, x1, y1), cell edge int32 (cell, tetangga/-1), lingkaran float64 (x, y, r)."""
+    mesh = diagram.mesh
+    edges = clipped_edges(diagram)
+    circles = diagram.largest_empty_circles()
+
+    columns = [
+        array("d", mesh.site_xy),
+        array("d", [value for edge in edges for value in edge[:4]]),
+        array("i", [value for edge in edges for value in edge[4:]]),
+        array("d", [value for c in circles for value in (c["center"].x, c["center"].y, c["radius"])]),
+    ]
+    file.write(BINARY_MAGIC)
+    file.write(struct.pack("<4I", BINARY_VERSION, len(mesh.site_xy) // 2, len(edges), len(circles)))
+    for column in columns:
+        if sys.byteorder == "big":
+            column.byteswap()
+        column.tofile(file)
+
+class TimedStream:
+    """Iterable titik dari chunk-chunk file yang mencatat jumlah titik dan waktu baca chunk."""
+
+    def __init__(self, chunks):
+        """Konstruktor untuk iterable chunk (misalnya point_io.iter_point_chunks)."""
+        self.chunks = chunks
+        self.count = 0
+        self.seconds = 0.0
+
+    def __iter__(self):
+        """Menghasilkan titik satu per satu; hanya waktu membaca chunk yang dihitung."""
+        chunks = iter(self.chunks)
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            self.seconds += time.perf_counter() - started
+            if chunk is None:
+                return
+            self.count += len(chunk)
+            yield from chunk
+
+def output_path(input_path: str, output_dir: str, output_format: str) -> str:
+    """Menentukan path file output untuk file input tertentu."""
+    name = os.path.splitext(os.path.basename(input_path))[0] + FORMATS[output_format]
+    return os.path.join(output_dir or os.path.dirname(input_path), name)
+
+def process_file(input_path: str, options: dict) -> dict:
+    """Membangun diagram dari satu file titik dan menulis hasilnya; mengembalikan catatan waktu."""
+    started = time.perf_counter()
+    if options["size"] is not None:
+        # ukuran sudah diketahui: seluruh stream titik dimasukkan sekali (add_point_stream membagi
+        # per batch untuk backend incremental, backend lain membangun sekali); waktu baca diukur per chunk
+        diagram = VoronoiDiagram(options["size"], backend=options["backend"])
+        stream = TimedStream(iter_point_chunks(input_path))
+        diagram.add_point_stream(stream, order=options["order"])
+        count = stream.count
+        read_time = started + stream.seconds
+        build_time = time.perf_counter()
+    else:
+        points = read_points(input_path)
+        count = len(points)
+        read_time = time.perf_counter()
+        diagram = VoronoiDiagram.from_points(points, order=options["order"], backend=options["backend"])
+        build_time = time.perf_counter()
+
+    path = output_path(input_path, options["output_dir"], options["format"])
+    if options["format"] == "binary":
+        with open(path, "wb") as file:
+            write_binary(diagram, file)
+    else:
+        data = to_geojson(diagram) if options["format"] == "geojson" else to_json(diagram)
+        with open(path, "w") as file:
+            json.dump(data, file)
+    finished = time.perf_counter()
+
+    return {
+        "file": input_path,
+        "output": path,
+        "points": count,
+        "sites": len(diagram.get_cells()) - 3,
+        "read_seconds": read_time - started,
+        "build_seconds": build_time - read_time,
+        "write_seconds": finished - build_time,
+        "total_seconds": finished - started,
+    }
+
+def collect_inputs(paths: list[str], pattern_ext: str = ".txt") -> list[str]:
+    """Mengumpulkan file input; direktori diganti dengan semua file *.txt di dalamnya."""
+    result = []
+    for path in paths:
+        if os.path.isdir(path):
+            result.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                          if name.endswith(pattern_ext))
+        else:
+            result.append(path)
+    return result
+
+def run_batch(inputs: list[str], options: dict, workers: int = 1) -> list[dict]:
+    """Memproses semua file input, paralel dengan process pool jika workers > 1.
+
+    File yang gagal diproses dicatat dengan field 'error' tanpa menghentikan batch."""
+    def failed(path, error):
+        return {"file": path, "error": f"{type(error).__name__}: {error}"}
+
+    if workers <= 1:
+        results = []
+        for path in inputs:
+            try:
+                results.append(process_file(path, options))
+            except Exception as e:
+                results.append(failed(path, e))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(path, pool.submit(process_file, path, options)) for path in inputs]
+        results = []
+        for path, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(failed(path, e))
+        return results
+
+def parse_args(argv=None):
+    """Membaca argumen command line."""
+    parser = argparse.ArgumentParser(description="Membangun diagram voronoi dari file titik tanpa GUI.")
+    parser.add_argument("inputs", nargs="+", help="file titik (teks (x, y), .npy, atau biner float64) atau direktori berisi *.txt")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="json")
+    parser.add_argument("--output-dir", help="direktori output (default: di samping file input)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="jumlah proses worker")
+    parser.add_argument("--size", type=float, help="ukuran boundary (default: koordinat terbesar)")
+    parser.add_argument("--backend", choices=VoronoiDiagram.BACKENDS, default="incremental")
+    parser.add_argument("--order", choices=("brio", "hilbert", "input"), default="brio")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fungsi utama CLI: memproses semua file dan mencetak waktu per file sebagai JSON."""
+    args = parse_args(argv)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    options = {
+        "format": args.format,
+        "output_dir": args.output_dir,
+        "size": args.size,
+        "backend": args.backend,
+        "order": args.order,
+    }
+    inputs = collect_inputs(args.inputs)
+
+    started = time.perf_counter()
+    results = run_batch(inputs, options, min(args.workers, max(len(inputs), 1)))
+    report = {"files": results, "total_seconds": time.perf_counter() - started}
+    print(json.dumps(report, indent=2))
+    return 1 if any("error" in r for r in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
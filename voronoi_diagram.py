@@ -1,18 +1,69 @@
+import heapq
+import itertools
+import math
+import mmap
+import struct
+import sys
+import time
+from array import array
 from geometry import Geometry
 from bounding_box import BoundingBox
 from cell import Cell
-from line import Line
+from cell_metrics import CellMetrics
+from dcel import HalfEdgeMesh
+from delaunay_cache import DelaunayCache
+from edge_index import EdgeIndex
+from fortune import FortuneSweep
 from point import Point
+from point_locator import LastCellLocator, LocateCache
+from spatial_sort import spatial_sort
+from tile_builder import TileBuilder
 
 class VoronoiDiagram:
     """Kelas untuk konstruksi diagram voronoi dengan menggunakan voronoi cell dan garis bisector."""
 
-    def __init__(self, max_dimension):
-        """Constructor diagram Voronoi dengan ukuran maksimum tertentu."""
+    BACKENDS = ("incremental", "fortune", "parallel")
+
+    # toleransi relatif insert_cell: vertex sedekat ini dengan bisector diputuskan dengan predikat eksak
+    CONFLICT_TOLERANCE = 1e-9
+
+    # format snapshot (lihat save): header lalu kolom little-endian berurutan
+    SNAPSHOT_MAGIC = b"VORS"
+    SNAPSHOT_VERSION = 1
+    SNAPSHOT_HEADER = struct.Struct("<4sIId7q4x") # magic, versi, flag, ukuran, id_cell, 6 panjang kolom
+    SNAPSHOT_COLUMNS = (("vertex_xy", "d"), ("site_xy", "d"), ("origin", "i"), ("twin", "i"), ("next", "i"),
+                        ("face", "i"), ("cell_edge", "i"), ("order", "i"), ("free_vertices", "i"), ("free_edges", "i"))
+
+    def __init__(self, max_dimension, locator=None, backend="incremental", storage="list", stats=None, workers=None):
+        """Constructor diagram Voronoi dengan ukuran maksimum tertentu.
+
+        'locator' adalah PointLocator yang memilih cell awal untuk find_cell,
+        default-nya LastCellLocator (walk dari cell yang terakhir ditambahkan).
+        'backend' menentukan engine untuk add_points: "incremental" (add_point satu
+        per satu), "fortune" (sweep line, membangun ulang seluruh diagram), atau "parallel"
+        (sweep line per tile di 'workers' proses, lihat TileBuilder).
+        'storage' menentukan penyimpanan mesh: "list" atau "compact" (array float64/int32
+        yang bisa dibaca sebagai view NumPy, lihat sites_array dan edges_array).
+        'stats' adalah DiagramStats opsional untuk mencatat counter dan timer insert."""
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
         self.boundary = BoundingBox(0.0, 0.0, max_dimension, max_dimension)
+        self.backend = backend
+        self.storage = storage
         self.cells = []
+        self.positions = {} # id cell -> indeks di self.cells
+        self.changed_cells = set() # id cell yang berubah pada operasi terakhir
         self.id_cell = 0
+        self.stats = stats
+        self.workers = workers
+        self.locate_cache = None # LocateCache opsional untuk locate_many
+        self.locate_arrays = None # array locate_many (lihat locate_index), None jika diagram berubah
+        self.metrics = None # CellMetrics opsional (lihat enable_metrics)
+        self.delaunay = None # DelaunayCache, dibuat saat delaunay_triangles/delaunay_edges pertama kali dipanggil
+        self.edge_index = None # EdgeIndex opsional untuk query viewport (lihat enable_edge_index)
+        self.locator = locator if locator is not None else LastCellLocator()
         self.setup()
+        self.locator.attach(self)
 
     def setup(self):
         """Membentuk cell awal di luar area bounding box."""
@@ -25,19 +76,13 @@ class VoronoiDiagram:
         # perbesar area untuk super triangle
         x_super, y_super = x_range * 4, y_range * 4
 
-        # membuat bounding box yang lebih besar untuk garis bisector
-        x_min_bisect = x_min - x_super * 3
-        y_min_bisect = y_min - y_super * 3
-        x_max_bisect = x_max + x_super * 3
-        y_max_bisect = y_max + y_super * 3
-        self.bisector_bound = BoundingBox(x_min_bisect, y_min_bisect, x_max_bisect, y_max_bisect)
-
-        # initialize bounding box awal
+        # initialize bounding box awal (frame mesh, hanya disentuh oleh cell super triangle)
         x_min_init = x_min - x_super * 4
         y_min_init = y_min - y_super * 4
         x_max_init = x_max + x_super * 4
         y_max_init = y_max + y_super * 4
         init_bound = BoundingBox(x_min_init, y_min_init, x_max_init, y_max_init)
+        self.init_bound = init_bound
 
         # tiga titik yang membentuk super triangle
         p1 = Point(x_min + x_range / 2, y_min - y_super + y_range / 2) # atas tengah dari bounding box super
@@ -52,128 +97,1108 @@ class VoronoiDiagram:
         c3 = Cell(p3, self.id_cell)
         self.id_cell += 1
 
-        # buat bisector untuk pasangan setiap titik
-        l1 = Line(p1, p2).bisector(init_bound)
-        l2 = Line(p2, p3).bisector(init_bound)
-        l3 = Line(p1, p3).bisector(init_bound)
-
-        # titik potong antara bisector
-        i1 = l1.intersection(l2)
-        i2 = l2.intersection(l3)
-        i3 = l1.intersection(l3)
-
-        # garis untuk setiap cell
-        c1.borders.append(Line(l1.start, i1, c2))
-        c2.borders.append(Line(l1.start, i1, c1))
-        c2.borders.append(Line(i2, l2.end, c3))
-        c3.borders.append(Line(i2, l2.end, c2))
-        c1.borders.append(Line(l3.start, i3, c3))
-        c3.borders.append(Line(l3.start, i3, c1))
-
-        # simpan voronoi cell
+        # topologi awal: tiga edge dari pusat lingkaran luar ketiga site ke tepi bounding box awal
+        self.mesh = HalfEdgeMesh(init_bound, self.storage)
         self.add_cell(c1)
         self.add_cell(c2)
         self.add_cell(c3)
 
+        cx, cy = Geometry.circumcenter(p1, p2, p3)
+        center = self.mesh.add_vertex(cx, cy)
+        segments = []
+        for a, b, other in ((c1, c2, c3), (c2, c3, c1), (c1, c3, c2)):
+            # edge a-b tegak lurus terhadap a -> b, menjauhi site ketiga
+            dx, dy = a.site.y - b.site.y, b.site.x - a.site.x
+            if dx * (other.site.x - a.site.x) + dy * (other.site.y - a.site.y) > 0:
+                dx, dy = -dx, -dy
+            length = math.hypot(dx, dy)
+            end = init_bound.ray_exit(cx, cy, dx / length, dy / length)
+            segments.append((center, self.mesh.add_vertex(end.x, end.y), a.id, b.id))
+        self.mesh.build(segments)
+
+    @classmethod
+    def from_points(cls, points, max_dimension=None, order="brio", **kwargs):
+        """Membangun diagram Voronoi dari kumpulan titik sekaligus.
+
+        Jika 'max_dimension' tidak diberikan, ukuran diambil dari koordinat terbesar."""
+        points = list(points)
+        if max_dimension is None:
+            max_dimension = max((max(p.x, p.y) for p in points), default=0) or 1
+        diagram = cls(max_dimension, **kwargs)
+        diagram.add_points(points, order)
+        return diagram
+
+    def add_points(self, points, order="brio"):
+        """Menambahkan banyak titik sekaligus dengan urutan insert yang berdekatan secara spasial.
+
+        Titik diurutkan dulu (lihat spatial_sort) sehingga walk find_cell untuk setiap
+        insert dimulai dari cell di dekat site baru. Dengan backend "fortune", seluruh
+        diagram dibangun ulang dengan sweep line. Mengembalikan jumlah titik yang berhasil."""
+        if self.backend == "fortune":
+            return self.build_fortune(points)
+        elif self.backend == "parallel":
+            return self.build_parallel(points)
+
+        added = 0
+        changed = set()
+        for p in spatial_sort(list(points), self.boundary, order):
+            if self.add_point(p):
+                added += 1
+                changed |= self.changed_cells
+        self.changed_cells = changed
+        return added
+
+    def add_point_stream(self, points, batch_size=65536, order="brio"):
+        """Menambahkan titik dari iterable/generator (misalnya point_io.iter_points) per batch.
+
+        Setiap batch berisi paling banyak 'batch_size' titik dan dimasukkan dengan add_points,
+        sehingga titik yang belum dibaca tidak pernah disimpan sekaligus di memori. Backend
+        "fortune" dan "parallel" membangun ulang seluruh diagram, jadi semua titik dikumpulkan dulu.
+        Mengembalikan jumlah titik yang berhasil ditambahkan."""
+        if self.backend != "incremental":
+            return self.add_points(list(points), order)
+
+        added = 0
+        changed = set()
+        points = iter(points)
+        while True:
+            batch = list(itertools.islice(points, batch_size))
+            if not batch:
+                break
+            added += self.add_points(batch, order)
+            changed |= self.changed_cells
+        self.changed_cells = changed
+        return added
+
+    def build_fortune(self, points):
+        """Membangun ulang diagram dari site yang sudah ada ditambah 'points' dengan sweep line Fortune.
+
+        Hasilnya ditulis ke HalfEdgeMesh yang sama dengan jalur incremental.
+        Mengembalikan jumlah titik baru yang berhasil ditambahkan."""
+        old_count = self.reset_cells(points)
+
+        # vertex hasil sweep dipakai bersama oleh semua segmen yang bertemu di sana
+        sweep = FortuneSweep([cell.site for cell in self.cells])
+        sweep.run()
+        vertices = {}
+        segments = []
+        for a, b, start, end in sweep.segments(self.init_bound):
+            for p in (start, end):
+                if id(p) not in vertices:
+                    vertices[id(p)] = self.mesh.add_vertex(p.x, p.y)
+            segments.append((vertices[id(start)], vertices[id(end)], self.cells[a].id, self.cells[b].id))
+        self.mesh.build(segments)
+
+        self.locator.attach(self)
+        self.changed_cells = {cell.id for cell in self.cells}
+        self.invalidate_caches()
+        return len(self.cells) - 3 - old_count
+
+    def build_parallel(self, points):
+        """Seperti build_fortune, tetapi sweep line dijalankan per tile secara paralel (lihat TileBuilder)."""
+        builder = TileBuilder(self.workers)
+        if builder.tiles == 1:
+            return self.build_fortune(points)
+        old_count = self.reset_cells(points)
+
+        vertices, segments = builder.build([cell.site for cell in self.cells], self.init_bound)
+        index = [self.mesh.add_vertex(x, y) for x, y in vertices]
+        self.mesh.build([(index[va], index[vb], self.cells[a].id, self.cells[b].id)
+                         for va, vb, a, b in segments])
+
+        self.locator.attach(self)
+        self.changed_cells = {cell.id for cell in self.cells}
+        self.invalidate_caches()
+        return len(self.cells) - 3 - old_count
+
+    def reset_cells(self, points):
+        """Mengosongkan diagram lalu membuat cell (tanpa ring) untuk site lama ditambah 'points'.
+
+        Titik duplikat dibuang. Urutan self.cells sama dengan urutan id cell. Mengembalikan
+        jumlah site lama."""
+        old_sites = [cell.site for cell in self.cells[3:]]
+        self.cells = []
+        self.positions = {} # id cell -> indeks di self.cells
+        self.id_cell = 0
+        self.setup()
+        self.mesh = HalfEdgeMesh(self.init_bound, self.storage)
+        for cell in self.cells:
+            self.mesh.add_cell(cell)
+
+        # buang titik duplikat (lihat Point.__eq__): duplikat pasti berada di sel grid
+        # selebar EPSILON yang sama atau bersebelahan
+        eps = Point.EPSILON
+        grid = {}
+        cells = list(self.cells)
+        for k, p in enumerate([cell.site for cell in self.cells] + old_sites + list(points)):
+            i, j = math.floor(p.x / eps), math.floor(p.y / eps)
+            if any(p == q for di in (-1, 0, 1) for dj in (-1, 0, 1) for q in grid.get((i + di, j + dj), ())):
+                continue
+            grid.setdefault((i, j), []).append(p)
+            if k >= 3:
+                cells.append(Cell(p, self.id_cell))
+                self.id_cell += 1
+
+        for cell in cells[3:]:
+            self.add_cell(cell)
+        return len(old_sites)
+
     def add_cell(self, c):
         """Menambahkan cell ke dalam list of Voronoi cell."""
+        self.positions[c.id] = len(self.cells)
         self.cells.append(c)
+        self.mesh.add_cell(c)
+
+    def discard_cell(self, c):
+        """Mengeluarkan cell dari list of Voronoi cell (cell terakhir mengisi posisinya)."""
+        position = self.positions.pop(c.id)
+        last = self.cells.pop()
+        if last is not c:
+            self.cells[position] = last
+            self.positions[last.id] = position
+        self.mesh.remove_cell(c.id)
 
     def add_point(self, p):
-        """Menambahkan titik baru ke diagram Voronoi dan membentuk cell baru."""
+        """Menambahkan titik baru ke diagram Voronoi dan membentuk cell baru.
+
+        Proses dibagi dua tahap: pertama semua cell yang terpengaruh diperiksa tanpa
+        mengubah mesh, lalu (jika semuanya valid) mesh diperbarui sekaligus. Dengan begitu
+        insert yang gagal tidak perlu mengembalikan perubahan apa pun.
+
+        Setelah insert berhasil, 'changed_cells' berisi id cell baru dan id semua cell
+        yang terpotong olehnya (dipakai GUI untuk menggambar ulang sebagian saja).
+
+        Site di dalam boundary selalu berhasil kecuali duplikat, termasuk site sebaris dan
+        cocircular (vertex di dekat bisector diputuskan eksak, lihat vertex_conflict). Site di
+        luar boundary ditolak jika cell barunya mencapai frame mesh ("frame" di DiagramStats)
+        atau site berada di luar frame ("intersections"). Alasan lain ("revisit",
+        "degenerate_circumcenter", "topology") hanya pengaman untuk mesh yang tidak konsisten."""
         new_cell = Cell(p, self.id_cell)
         self.id_cell += 1
+        return self.insert_cell(new_cell)
+
+    def insert_cell(self, new_cell):
+        """Menyisipkan cell yang id-nya sudah ditentukan (lihat add_point; dipakai juga oleh move_cell)."""
+        self.changed_cells = set()
+        stats = self.stats
+        p = new_cell.site
         first = self.find_cell(p)
         
         # jika titik sudah ada
         if p == first.site:
+            if stats is not None:
+                stats.record_insert(p, "duplicate", 0, 0, 0.0)
             return False
 
-        visited = {}
+        if stats is not None:
+            started = time.perf_counter()
+
+        mesh = self.mesh
+        origin, vertex_xy = mesh.origin, mesh.vertex_xy
+        tolerance = self.CONFLICT_TOLERANCE
+        steps = [] # (cell, edge keluar, edge masuk, titik potong di edge keluar)
+        visited = set()
+        conflicts = {} # vertex -> True jika vertex masuk ke cell baru (diputuskan sekali per vertex)
         current_cell = first
 
-        # membagi cell-cell yang terpengaruh oleh site/titik baru
+        # cari cell-cell yang terpengaruh oleh site/titik baru
         while True:
-            hp = Line(p, current_cell.site).bisector(self.bisector_bound) # membentuk garis bisector baru antara titik baru dan generator dari cell yang sedang diproses
-            i1 = None
-            l1 = None
-            new_border = []
-            num_intersections = 0
-            next_cell = None
-
-            # cari intersection antara bisector baru dengan garis batas cell
-            for current_line in current_cell.borders:
-                intersection = hp.intersection(current_line)
-                if intersection:
-                    num_intersections += 1
-                    
-                    if i1 is None:
-                        i1 = intersection
-                        l1 = current_line
-                    
+            site = current_cell.site
+            ring = mesh.ring(current_cell.id)
+
+            # clip ring dengan half-plane titik baru: vertex v masuk ke cell baru jika (v - m) . d > 0,
+            # dengan m titik tengah site dan p, d = p - site
+            dx, dy = p.x - site.x, p.y - site.y
+            mx, my = (p.x + site.x) / 2, (p.y + site.y) / 2
+            scale = tolerance * (abs(dx) + abs(dy))
+            keep = [] # vertex yang tetap milik cell ini
+            for i, h in enumerate(ring):
+                v = origin[h]
+                conflict = conflicts.get(v)
+                if conflict is None:
+                    ex, ey = vertex_xy[2 * v] - mx, vertex_xy[2 * v + 1] - my
+                    side = ex * dx + ey * dy
+                    if abs(side) > scale * (abs(ex) + abs(ey) + abs(dx) + abs(dy)):
+                        conflict = side > 0
                     else:
-                        # tentukan arah dan neighbor dari garis baru yang terbentuk
-                        if Geometry.cross_product(i1, intersection, p) > 0:
-                            new_cell.borders.append(Line(i1, intersection, current_cell))
-                            new_border.append(Line(i1, intersection, new_cell))
-                            next_cell = current_line.neighbor
-                        else:
-                            new_cell.borders.append(Line(intersection, i1, current_cell))
-                            new_border.append(Line(intersection, i1, new_cell))
-                            next_cell = l1.neighbor
-
-                        tmp = current_line.start if Geometry.closer_to(current_line.start, p, current_cell.site) == current_cell.site else current_line.end
-                        new_border.append(Line(intersection, tmp, current_line.neighbor))
-                        tmp = l1.start if Geometry.closer_to(l1.start, p, current_cell.site) == current_cell.site else l1.end
-                        new_border.append(Line(i1, tmp, l1.neighbor))
-
-                # tambahkan garis boundary yang tidak terpengaruh
-                if (Geometry.closer_to(current_line.start, current_cell.site, p) == current_cell.site
-                    and Geometry.closer_to(current_line.end, current_cell.site, p) == current_cell.site):
-                    new_border.append(current_line)
+                        conflict = self.vertex_conflict(p, site, ring[i - 1], h)
+                    conflicts[v] = conflict
+                keep.append(not conflict)
+
+            # edge di mana ring keluar (keep -> buang) dan masuk kembali (buang -> keep)
+            exits = [i for i in range(len(ring)) if keep[i] and not keep[(i + 1) % len(ring)]]
+            entries = [i for i in range(len(ring)) if not keep[i] and keep[(i + 1) % len(ring)]]
 
             # validasi jumlah intersection (harusnya ada 2)
-            if num_intersections != 2:
-                for k, borders in visited.items():
-                    k.borders = borders
+            if len(exits) != 1 or len(entries) != 1 or current_cell in visited:
+                if stats is not None:
+                    reason = "revisit" if current_cell in visited else "intersections"
+                    stats.record_insert(p, reason, len(visited), len(steps), time.perf_counter() - started)
                 return False
-            elif current_cell in visited:
-                for k, borders in visited.items():
-                    k.borders = borders
+
+            exit_edge = ring[exits[0]]
+            entry_edge = ring[entries[0]]
+            next_edge = mesh.twin[exit_edge]
+
+            # edge keluar di frame mesh: cell baru akan menyentuh frame (hanya untuk site di luar boundary)
+            if next_edge < 0:
+                if stats is not None:
+                    stats.record_insert(p, "frame", len(visited), len(steps) + 1, time.perf_counter() - started)
                 return False
 
-            # simpan cell yang sudah diproses
-            visited[current_cell] = current_cell.borders
-            current_cell.borders = new_border
-            current_cell = next_cell
+            # vertex baru di edge keluar: pusat lingkaran luar titik baru, site ini, dan tetangganya
+            intersection = Geometry.circumcenter(p, site, mesh.cells[mesh.face[next_edge]].site)
+
+            # edge masuk harus merupakan twin dari edge keluar pada cell sebelumnya
+            if intersection is None or (steps and mesh.twin[steps[-1][1]] != entry_edge):
+                if stats is not None:
+                    reason = "degenerate_circumcenter" if intersection is None else "topology"
+                    stats.record_insert(p, reason, len(visited), len(steps) + 1, time.perf_counter() - started)
+                return False
+
+            # half-edge yang seluruhnya berada di dalam cell baru
+            dropped = []
+            i = (exits[0] + 1) % len(ring)
+            while ring[i] != entry_edge:
+                dropped.append(ring[i])
+                i = (i + 1) % len(ring)
+
+            visited.add(current_cell)
+            steps.append((current_cell, exit_edge, entry_edge, dropped, intersection))
+            current_cell = mesh.cells[mesh.face[next_edge]]
 
             if current_cell == first:
                 break
 
+        if mesh.twin[steps[-1][1]] != steps[0][2]:
+            if stats is not None:
+                stats.record_insert(p, "topology", len(visited), len(steps), time.perf_counter() - started)
+            return False
+
+        if stats is not None:
+            rebuild_started = time.perf_counter()
+        mesh.make_writable()
         self.add_cell(new_cell)
+
+        # vertex baru di setiap titik potong, dipakai bersama oleh kedua cell di sisi edge tsb
+        vertices = [mesh.add_vertex(*step[4]) for step in steps]
+        removed_vertices = set()
+        new_edges = []
+
+        # potong ring setiap cell: exit_edge -> edge baru -> entry_edge
+        for k, (cell, exit_edge, entry_edge, dropped, _) in enumerate(steps):
+            for h in dropped:
+                removed_vertices.add(mesh.origin[h])
+                mesh.remove_edge(h)
+            removed_vertices.add(mesh.origin[entry_edge])
+
+            border = mesh.add_edge(vertices[k], cell.id)
+            new_border = mesh.add_edge(vertices[k - 1], new_cell.id)
+            mesh.twin[border] = new_border
+            mesh.twin[new_border] = border
+            mesh.next[exit_edge] = border
+            mesh.next[border] = entry_edge
+            mesh.origin[entry_edge] = vertices[k - 1]
+            mesh.cell_edge[cell.id] = exit_edge
+            new_edges.append(new_border)
+
+        # ring cell baru tersusun dari twin edge-edge baru
+        for h, h_next in zip(new_edges, new_edges[1:] + new_edges[:1]):
+            mesh.next[h] = h_next
+        mesh.cell_edge[new_cell.id] = new_edges[0]
+
+        for v in removed_vertices:
+            mesh.remove_vertex(v)
+
+        self.locator.insert(new_cell)
+        self.changed_cells = {cell.id for cell in visited}
+        self.changed_cells.add(new_cell.id)
+        self.invalidate_caches(self.changed_cells)
+
+        if stats is not None:
+            finished = time.perf_counter()
+            stats.record_insert(p, None, len(visited), len(steps),
+                                rebuild_started - started, finished - rebuild_started)
         return True
     
-    def find_cell(self, p):
-        """Mencari cell yang paling dekat dengan titik yang diberikan."""
-        current_cell = self.cells[-1]
+    def vertex_conflict(self, p, site, before, h):
+        """Keputusan eksak apakah vertex awal half-edge h di ring cell 'site' masuk ke cell titik baru p.
+
+        Dipakai add_point jika vertex terlalu dekat dengan bisector untuk dipercaya (koordinat
+        vertex hanya pendekatan). Keputusan diambil dari site-site yang bertemu di vertex tsb
+        (site, tetangga di seberang half-edge 'before' dan h): vertex masuk ke cell baru jika
+        p berada di dalam lingkaran luar ketiga site. Titik tepat di lingkaran tidak mengubah vertex."""
+        mesh = self.mesh
+        t_before, t_after = mesh.twin[before], mesh.twin[h]
+        if t_before >= 0 and t_after >= 0:
+            a = mesh.cells[mesh.face[t_before]].site
+            b = mesh.cells[mesh.face[t_after]].site
+            orientation = Geometry.orientation(site, a, b)
+            if orientation != 0:
+                return Geometry.incircle(site, a, b, p) * orientation > 0
+
+        # vertex di frame (hanya dimiliki dua cell): bandingkan jarak vertex ke p dan ke site
+        vertex = mesh.vertex_point(mesh.origin[h])
+        return Geometry.dist_squared(vertex, p) < Geometry.dist_squared(vertex, site)
+
+    def remove_point(self, p):
+        """Menghapus site p dari diagram Voronoi (lihat remove_cell)."""
+        cell = self.find_cell(p)
+        if not p == cell.site:
+            return False
+        return self.remove_cell(cell.id)
+
+    def remove_cell(self, cell_id):
+        """Menghapus cell dan membagi area-nya ke cell-cell tetangganya.
+
+        Hanya cell tetangga yang diperbarui: lubang yang ditinggalkan cell (poligon site
+        tetangga) ditriangulasi ulang secara Delaunay, lalu setiap segitiga menjadi vertex
+        voronoi baru dan setiap diagonal menjadi edge voronoi baru. Cell super triangle
+        tidak bisa dihapus. Mengembalikan True jika berhasil; 'changed_cells' lalu berisi
+        id cell yang dihapus dan id semua tetangganya."""
+        self.changed_cells = set()
+        mesh = self.mesh
+        if cell_id < 3 or cell_id >= len(mesh.cells) or mesh.cells[cell_id] is None:
+            return False
+
+        cell = mesh.cells[cell_id]
+        ring = mesh.ring(cell_id)
+        twins = [mesh.twin[h] for h in ring]
+        neighbors = [mesh.cells[mesh.face[t]] for t in twins]
+        if len(set(neighbors)) != len(neighbors):
+            return False
+
+        triangles = self.triangulate_hole([n.site for n in neighbors], cell.site)
+        if triangles is None:
+            return False
+
+        # half-edge tetangga sebelum dan sesudah twin dari ring cell yang dihapus
+        k = len(neighbors)
+        after = [mesh.next[t] for t in twins]
+        before = [mesh.twin[after[(i + 1) % k]] for i in range(k)]
+
+        # setiap vertex ring harus dimiliki tepat tiga cell (lihat HalfEdgeMesh.split_vertices)
+        if any(h < 0 or mesh.face[h] != n.id for h, n in zip(before, neighbors)):
+            return False
+
+        # segitiga di sisi kiri setiap edge berarah (i, j) dari triangulasi lubang
+        triangle_of = {}
+        vertices = []
+        mesh.make_writable()
+        for t, (a, b, c) in enumerate(triangles):
+            triangle_of[(a, b)] = triangle_of[(b, c)] = triangle_of[(c, a)] = t
+            vertices.append(mesh.add_vertex(*Geometry.circumcenter(neighbors[a].site, neighbors[b].site, neighbors[c].site)))
+
+        # rantai edge baru setiap tetangga: kipas segitiga di sekitar site tetangga tsb
+        diagonal = {} # (i, x) -> half-edge milik tetangga i di diagonal (i, x)
+        chains = []
+        for i in range(k):
+            chain = []
+            t = triangle_of[(i, (i + 1) % k)]
+            while True:
+                # vertex sebelum i pada segitiga t (edge x -> i): diagonal berikutnya
+                x = triangles[t][(triangles[t].index(i) + 2) % 3]
+                if x == (i - 1) % k:
+                    break
+                h = mesh.add_edge(vertices[t], neighbors[i].id)
+                diagonal[(i, x)] = h
+                chain.append(h)
+                t = triangle_of[(i, x)]
+            chains.append((chain, t))
+
+        # sambungkan rantai baru ke ring setiap tetangga
+        for i, (chain, last) in enumerate(chains):
+            for h, h_next in zip(chain, chain[1:]):
+                mesh.next[h] = h_next
+            mesh.next[before[i]] = chain[0] if chain else after[i]
+            if chain:
+                mesh.next[chain[-1]] = after[i]
+            mesh.origin[after[i]] = vertices[last]
+            mesh.cell_edge[neighbors[i].id] = after[i]
+        for (i, x), h in diagonal.items():
+            mesh.twin[h] = diagonal[(x, i)]
+
+        # hapus ring cell lama beserta vertex-vertexnya
+        for h, t in zip(ring, twins):
+            mesh.remove_vertex(mesh.origin[h])
+            mesh.remove_edge(h)
+            mesh.remove_edge(t)
+
+        self.discard_cell(cell)
+        self.locator.remove(cell)
+        self.changed_cells = {n.id for n in neighbors}
+        self.changed_cells.add(cell_id)
+        self.invalidate_caches(self.changed_cells)
+        return True
+
+    def triangulate_hole(self, polygon, site):
+        """Triangulasi Delaunay dari poligon site tetangga di sekitar 'site' yang dihapus.
+
+        Poligon berorientasi positif. Setiap langkah memotong ear (segitiga tiga titik
+        berurutan yang konveks) dengan nilai r^2 - |pusat - site|^2 terkecil terhadap lingkaran
+        luarnya; ear tersebut selalu Delaunay. Karena nilai tsb dihitung dengan floating point,
+        ear terpilih diperiksa lagi dengan Geometry.incircle (tidak ada titik poligon lain di
+        dalam lingkaran luarnya); jika gagal, ear berikutnya yang dicoba. Mengembalikan list
+        segitiga (indeks poligon)."""
+        remaining = list(range(len(polygon)))
+        triangles = []
+
+        while len(remaining) > 3:
+            candidates = []
+            for j in range(len(remaining)):
+                a, b, c = remaining[j - 1], remaining[j], remaining[(j + 1) % len(remaining)]
+                if Geometry.orientation(polygon[a], polygon[b], polygon[c]) <= 0:
+                    continue
+                center = Geometry.circumcenter(polygon[a], polygon[b], polygon[c])
+                if center is None:
+                    continue
+                center = Point(*center)
+                power = Geometry.dist_squared(center, polygon[a]) - Geometry.dist_squared(center, site)
+                candidates.append((power, j))
+
+            best = None
+            for power, j in sorted(candidates):
+                a, b, c = remaining[j - 1], remaining[j], remaining[(j + 1) % len(remaining)]
+                if all(Geometry.incircle(polygon[a], polygon[b], polygon[c], polygon[q]) <= 0
+                       for q in remaining if q not in (a, b, c)):
+                    best = j
+                    break
+
+            if best is None:
+                return None
+            a, b, c = remaining[best - 1], remaining[best], remaining[(best + 1) % len(remaining)]
+            triangles.append((a, b, c))
+            remaining.pop(best)
+
+        if Geometry.orientation(*(polygon[i] for i in remaining)) <= 0:
+            return None
+        triangles.append(tuple(remaining))
+        return triangles
+
+    def move_point(self, p, q):
+        """Memindahkan site p ke posisi q (lihat move_cell)."""
+        cell = self.find_cell(p)
+        if not p == cell.site:
+            return False
+        return self.move_cell(cell.id, q)
+
+    def move_cell(self, cell_id, q):
+        """Memindahkan site cell ke titik q dengan id cell yang tetap.
+
+        Jika triangulasi Delaunay tetap valid setelah site berpindah (tetangga tidak berubah),
+        hanya vertex ring cell yang dihitung ulang sebagai pusat lingkaran luar baru; vertex
+        tsb dipakai bersama tetangganya sehingga tidak ada edge yang dibuat ulang. Jika tidak,
+        cell dihapus lalu disisipkan lagi di q. Cell super triangle tidak bisa dipindahkan.
+        Mengembalikan True jika berhasil; 'changed_cells' berisi cell yang berubah."""
+        self.changed_cells = set()
+        mesh = self.mesh
+        if cell_id < 3 or self.get_cell(cell_id) is None:
+            return False
+
+        cell = mesh.cells[cell_id]
+        ring = mesh.ring(cell_id)
+        neighbors = [mesh.cells[mesh.face[mesh.twin[h]]] for h in ring]
+        if self.keeps_topology(ring, q):
+            mesh.make_writable()
+            self.locator.remove(cell)
+            cell.site = q
+            mesh.site_xy[2 * cell_id] = q.x
+            mesh.site_xy[2 * cell_id + 1] = q.y
+            for i, h in enumerate(ring):
+                v = mesh.origin[mesh.next[h]]
+                x, y = Geometry.circumcenter(q, neighbors[i].site, neighbors[(i + 1) % len(ring)].site)
+                mesh.vertex_xy[2 * v] = x
+                mesh.vertex_xy[2 * v + 1] = y
+            self.locator.insert(cell)
+            self.changed_cells = {n.id for n in neighbors}
+            self.changed_cells.add(cell_id)
+            self.invalidate_caches(self.changed_cells)
+            return True
+
+        # topologi berubah: hapus lalu sisipkan lagi dengan id yang sama
+        nearest = self.find_cell(q)
+        if nearest is not cell and q == nearest.site:
+            return False
+        old_site = cell.site
+        if not self.remove_cell(cell_id):
+            return False
+        changed = self.changed_cells
+        if not self.insert_cell(Cell(q, cell_id)):
+            self.insert_cell(Cell(old_site, cell_id))
+            self.changed_cells |= changed
+            return False
+        self.changed_cells |= changed
+        self.invalidate_caches(self.changed_cells)
+        return True
+
+    def keeps_topology(self, ring, q):
+        """Memeriksa apakah site cell dengan 'ring' bisa dipindah ke q tanpa mengubah triangulasi Delaunay.
+
+        Untuk setiap vertex ring (segitiga q, a_i, a_i+1 dengan a_i tetangga di seberang
+        half-edge ke-i): segitiga tsb harus tetap berorientasi positif, dan lingkaran luarnya
+        tidak boleh memuat a_i-1 (edge q-a_i) maupun site x_i di seberang edge a_i-a_i+1."""
+        mesh = self.mesh
+        k = len(ring)
+        neighbors = [mesh.cells[mesh.face[mesh.twin[h]]] for h in ring]
+        for i, h in enumerate(ring):
+            a, b = neighbors[i], neighbors[(i + 1) % k]
+            if Geometry.orientation(q, a.site, b.site) <= 0:
+                return False
+            if Geometry.incircle(q, a.site, b.site, neighbors[i - 1].site) > 0:
+                return False
+
+            # edge a_i+1 -> a_i yang keluar dari vertex ini, lalu site ketiga di ujung lainnya
+            g = mesh.next[mesh.twin[ring[(i + 1) % k]]]
+            if mesh.twin[g] < 0 or mesh.face[mesh.twin[g]] != a.id:
+                return False # vertex dimiliki lebih dari tiga cell
+            t = mesh.twin[mesh.next[g]]
+            if t >= 0 and Geometry.incircle(q, a.site, b.site, mesh.cells[mesh.face[t]].site) > 0:
+                return False
+        return True
+
+    def move_many(self, cell_ids, xs, ys):
+        """Memindahkan banyak site sekaligus: site cell_ids[k] pindah ke (xs[k], ys[k]).
+
+        Triangulasi Delaunay setelah semua perpindahan diperiksa sekaligus dengan predikat
+        vektor (orientasi setiap segitiga dan uji incircle setiap edge). Site yang terlibat di
+        segitiga atau edge yang tidak valid ditunda dan pemeriksaan diulang tanpa site tsb;
+        site lain dipindah sekaligus dengan menghitung ulang vertex di sekitarnya. Site yang
+        ditunda lalu dipindah satu per satu dengan move_cell. Target NaN dilewati.
+        Mengembalikan jumlah site yang berhasil dipindah."""
+        import numpy as np
+
+        mesh = self.mesh
+        targets = {}
+        for cell_id, x, y in zip(np.asarray(cell_ids).tolist(), np.asarray(xs, dtype=np.float64).tolist(),
+                                 np.asarray(ys, dtype=np.float64).tolist()):
+            cell = self.get_cell(cell_id)
+            if cell_id >= 3 and cell is not None and x == x and y == y and (x, y) != (cell.site.x, cell.site.y):
+                targets[cell_id] = (x, y)
+        self.changed_cells = set()
+        if not targets:
+            return 0
+
+        arrays = mesh.arrays()
+        origin, twin, next_edge, face = arrays["origin"], arrays["twin"], arrays["next"], arrays["face"]
+        sites = arrays["site_xy"].copy()
+
+        # setiap half-edge h (cell A, tetangga B) beserta site ketiga C di vertex akhir dan D di vertex awal
+        h = np.flatnonzero((face >= 0) & (twin >= 0))
+        h = h[(twin[next_edge[h]] >= 0) & (twin[next_edge[twin[h]]] >= 0)]
+        a, b = face[h], face[twin[h]]
+        c = face[twin[next_edge[h]]]
+        d = face[twin[next_edge[twin[h]]]]
+        end = origin[next_edge[h]]
+        degree = np.bincount(origin[face >= 0], minlength=len(arrays["vertex_xy"]))
+
+        ids = np.fromiter(targets, dtype=np.int64, count=len(targets))
+        points = np.array(list(targets.values()), dtype=np.float64)
+        shift = np.zeros(len(sites))
+        shift[ids] = np.hypot(*(points - sites[ids]).T)
+        deferred = np.zeros(len(sites), dtype=bool)
+        while True:
+            moving = np.zeros(len(sites), dtype=bool)
+            moving[ids] = True
+            moving &= ~deferred
+            moved = sites.copy()
+            moved[ids[~deferred[ids]]] = points[~deferred[ids]]
+
+            involved = moving[a] | moving[b] | moving[c] | moving[d]
+            rows = np.flatnonzero(involved)
+            pa, pb, pc, pd = moved[a[rows]], moved[b[rows]], moved[c[rows]], moved[d[rows]]
+            orientation = Geometry.orientation_many(pa[:, 0], pa[:, 1], pb[:, 0], pb[:, 1], pc[:, 0], pc[:, 1])
+            incircle = Geometry.incircle_many(pa[:, 0], pa[:, 1], pb[:, 0], pb[:, 1], pc[:, 0], pc[:, 1],
+                                              pd[:, 0], pd[:, 1])
+            bad = rows[(orientation <= 0) | (incircle > 0) | (degree[end[rows]] != 3)]
+            if len(bad) == 0:
+                break
+            # dari setiap segitiga/edge yang tidak valid, tunda site bergerak dengan perpindahan terbesar
+            candidates = np.stack((a[bad], b[bad], c[bad], d[bad]))
+            weight = np.where(moving[candidates], shift[candidates], -1.0)
+            deferred[candidates[weight.argmax(axis=0), np.arange(len(bad))]] = True
+
+        # pindahkan semua site yang tidak ditunda, vertex di sekitarnya dihitung ulang
+        mesh.make_writable()
+        changed = set()
+        for cell_id, (x, y) in targets.items():
+            if not deferred[cell_id]:
+                cell = mesh.cells[cell_id]
+                self.locator.remove(cell)
+                cell.site = Point(x, y)
+                mesh.site_xy[2 * cell_id] = x
+                mesh.site_xy[2 * cell_id + 1] = y
+                self.locator.insert(cell)
+
+        rows = np.flatnonzero(moving[a])
+        vertices, first = np.unique(end[rows], return_index=True)
+        rows = rows[first]
+        centers = self.circumcenters(moved[a[rows]], moved[b[rows]], moved[c[rows]])
+        vertex_xy = mesh.vertex_xy
+        for v, (x, y) in zip(vertices.tolist(), centers.tolist()):
+            vertex_xy[2 * v] = x
+            vertex_xy[2 * v + 1] = y
+        changed.update(np.unique(np.concatenate((a[rows], b[rows], c[rows]))).tolist())
+        count = int(moving.sum())
+
+        for cell_id in np.flatnonzero(deferred).tolist():
+            if self.move_cell(cell_id, Point(*targets[cell_id])):
+                count += 1
+            changed |= self.changed_cells
+        self.changed_cells = changed
+        self.invalidate_caches(changed)
+        return count
+
+    @staticmethod
+    def circumcenters(a, b, c):
+        """Versi vektor dari Geometry.circumcenter untuk array NumPy (n, 2); hasilnya array (n, 2)."""
+        import numpy as np
+
+        bx, by = (b - a).T
+        cx, cy = (c - a).T
+        d = 2 * (bx * cy - by * cx)
+        b2 = bx * bx + by * by
+        c2 = cx * cx + cy * cy
+        return a + np.column_stack((cy * b2 - by * c2, bx * c2 - cx * b2)) / d[:, None]
+
+    def relax(self, iterations=1):
+        """Menjalankan 'iterations' langkah relaksasi Lloyd: setiap site dipindah ke centroid cell-nya
+        (dipotong dengan boundary, lihat centroids) dengan move_many.
+
+        Mengembalikan perpindahan site terbesar pada langkah terakhir."""
+        import numpy as np
+
+        shift = 0.0
+        for _ in range(iterations):
+            centroids = self.centroids()
+            ids = np.array([cell.id for cell in self.cells[3:]], dtype=np.int64)
+            sites = self.sites_array()[ids]
+            target = centroids[ids]
+            valid = np.isfinite(target[:, 0])
+            ids, sites, target = ids[valid], sites[valid], target[valid]
+            shift = float(np.hypot(*(target - sites).T).max()) if len(ids) else 0.0
+            self.move_many(ids, target[:, 0], target[:, 1])
+        return shift
+
+    def centroids(self):
+        """Mengembalikan centroid setiap cell sebagai array NumPy (n, 2), baris ke-i untuk cell dengan id i.
+
+        Cell dipotong dengan boundary: centroid cell di dalam boundary dihitung sekaligus
+        (rumus shoelace per half-edge), cell yang keluar boundary dipotong satu per satu.
+        Cell super triangle, id kosong, dan cell tanpa area di dalam boundary berisi NaN."""
+        import numpy as np
+
+        arrays = self.mesh.arrays()
+        xy, origin, next_edge, face = arrays["vertex_xy"], arrays["origin"], arrays["next"], arrays["face"]
+        n = len(arrays["cell_edge"])
+
+        h = np.flatnonzero(face >= 3)
+        x0, y0 = xy[origin[h], 0], xy[origin[h], 1]
+        x1, y1 = xy[origin[next_edge[h]], 0], xy[origin[next_edge[h]], 1]
+        cross = x0 * y1 - x1 * y0
+        area = np.bincount(face[h], cross, n)
+        result = np.full((n, 2), np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[:, 0] = np.bincount(face[h], (x0 + x1) * cross, n) / (3 * area)
+            result[:, 1] = np.bincount(face[h], (y0 + y1) * cross, n) / (3 * area)
+
+        # cell yang punya vertex di luar boundary
+        box = self.boundary
+        outside = (x0 < box.x_min) | (x0 > box.x_max) | (y0 < box.y_min) | (y0 > box.y_max)
+        for cell_id in np.unique(face[h][outside]).tolist():
+            polygon = box.clip_polygon([(xy[origin[g], 0], xy[origin[g], 1]) for g in self.mesh.ring(cell_id)])
+            result[cell_id] = Geometry.polygon_centroid(polygon)
+        result[:3] = np.nan
+        return result
+
+    def find_cell(self, p, start=None):
+        """Mencari cell yang paling dekat dengan titik yang diberikan.
+
+        Walk dimulai dari 'start' jika diberikan, jika tidak dari cell yang dipilih locator."""
+        current_cell = start if start is not None else self.locator.start_cell(p)
         best = Geometry.dist_squared(current_cell.site, p)
         old = float('inf')
+        steps = 0
 
         # loop sampai tidak ditemukan cell yang lebih dekat
         while old > best:
             old = best
-            for vl in current_cell.borders:
-                dist = Geometry.dist_squared(vl.neighbor.site, p)
+            for neighbor in self.mesh.neighbors(current_cell.id):
+                dist = Geometry.dist_squared(neighbor.site, p)
                 if dist < best:
-                    current_cell = vl.neighbor
+                    current_cell = neighbor
                     best = dist
+                    steps += 1
 
+        self.locator.record(steps)
+        if self.stats is not None:
+            self.stats.record_walk(steps)
         return current_cell
 
+    def iter_nearest(self, p):
+        """Generator (jarak kuadrat, cell) berurutan dari site terdekat ke titik p.
+
+        Pencarian best-first dimulai dari find_cell(p) dan hanya melebar lewat tetangga cell:
+        site terdekat ke-(i+1) selalu bertetangga (di triangulasi Delaunay) dengan salah satu
+        dari i site terdekat sebelumnya, sehingga cell yang keluar dari heap sudah pasti urut.
+        Cell super triangle ikut dilewati tetapi tidak dihasilkan."""
+        start = self.find_cell(p)
+        heap = [(Geometry.dist_squared(start.site, p), start.id, start)]
+        seen = {start.id}
+        while heap:
+            dist, _, cell = heapq.heappop(heap)
+            if cell.id >= 3:
+                yield dist, cell
+            for neighbor in self.mesh.neighbors(cell.id):
+                if neighbor.id not in seen:
+                    seen.add(neighbor.id)
+                    heapq.heappush(heap, (Geometry.dist_squared(neighbor.site, p), neighbor.id, neighbor))
+
+    def sites_within(self, q, r):
+        """Mengembalikan semua cell yang site-nya berjarak paling jauh r dari titik q, terurut dari yang terdekat.
+
+        Biayanya sebanding dengan jumlah hasil (lihat iter_nearest), bukan jumlah seluruh site."""
+        if r < 0:
+            return []
+        limit = r * r
+        return [cell for _, cell in itertools.takewhile(lambda item: item[0] <= limit, self.iter_nearest(q))]
+
+    def k_nearest(self, q, k):
+        """Mengembalikan paling banyak k cell dengan site terdekat ke titik q, terurut dari yang terdekat."""
+        if k <= 0:
+            return []
+        return [cell for _, cell in itertools.islice(self.iter_nearest(q), k)]
+
+    def locate_many(self, xs, ys):
+        """Mencari cell terdekat untuk banyak titik query sekaligus.
+
+        'xs' dan 'ys' adalah array NumPy (atau sequence) dengan panjang sama; hasilnya array
+        int32 berisi id cell dengan bentuk yang sama dengan 'xs'. Semua langkah dijalankan
+        untuk seluruh array sekaligus dengan NumPy: cell awal diambil dari bucket grid site
+        (lihat locate_index) atau dari isi locate_cache jika cache aktif (lihat
+        enable_locate_cache), lalu setiap walk yang belum selesai pindah ke tetangga terdekat
+        sampai tidak ada tetangga yang lebih dekat."""
+        import numpy as np
+
+        shape = np.shape(xs)
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        ys = np.asarray(ys, dtype=np.float64).ravel()
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length")
+
+        index = self.locate_index()
+        sites, indptr, indices = index["sites"], index["indptr"], index["indices"]
+        n, x0, y0, width, height = index["grid"]
+        i = np.clip(((xs - x0) * (n / width)).astype(np.int64), 0, n - 1)
+        j = np.clip(((ys - y0) * (n / height)).astype(np.int64), 0, n - 1)
+        current = index["seeds"][j * n + i]
+
+        cache = self.locate_cache
+        if cache is not None:
+            # setiap key kuantisasi dibaca dari cache sekali per batch
+            quantized = np.column_stack((np.floor(xs / cache.quantum), np.floor(ys / cache.quantum))).astype(np.int64)
+            keys, inverse = np.unique(quantized, axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            keys = [tuple(key) for key in keys.tolist()]
+            cached = np.array([cache.get(key) for key in keys], dtype=object)
+            hit = np.array([cell_id is not None for cell_id in cached], dtype=bool)[inverse]
+            current[hit] = cached[inverse[hit]].astype(np.int64)
+
+        best = (sites[current, 0] - xs) ** 2 + (sites[current, 1] - ys) ** 2
+        active = np.arange(len(xs))
+        steps = 0
+        while len(active):
+            # semua tetangga cell saat ini dari setiap walk aktif, berurutan per walk
+            cells = current[active]
+            counts = indptr[cells + 1] - indptr[cells]
+            rows = np.repeat(np.arange(len(active)), counts)
+            offsets = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+            neighbors = indices[indptr[cells][rows] + offsets]
+            q = active[rows]
+            dist = (sites[neighbors, 0] - xs[q]) ** 2 + (sites[neighbors, 1] - ys[q]) ** 2
+
+            # tetangga terdekat per walk: elemen pertama setiap walk setelah diurutkan (walk, jarak)
+            order = np.lexsort((dist, rows))
+            first = order[np.cumsum(counts) - counts]
+            closer = dist[first] < best[active]
+            moved = active[closer]
+            current[moved] = neighbors[first[closer]]
+            best[moved] = dist[first[closer]]
+            steps += len(moved)
+            active = moved
+
+        self.locator.queries += len(xs)
+        self.locator.walk_steps += steps
+        if cache is not None:
+            answers = np.empty(len(keys), dtype=np.int64)
+            answers[inverse] = current # jawaban query terakhir untuk setiap key
+            for key, cell_id in zip(keys, answers.tolist()):
+                cache.put(key, cell_id)
+        return current.astype(np.int32).reshape(shape)
+
+    def locate_index(self):
+        """Array untuk locate_many: koordinat site, graf tetangga CSR (lihat neighbors_csr), dan
+        satu cell awal per bucket grid di atas boundary (sekitar dua site per bucket; bucket
+        kosong diisi dari bucket tetangganya). Disimpan sampai diagram berubah."""
+        import numpy as np
+
+        if self.locate_arrays is not None:
+            return self.locate_arrays
+
+        sites = self.sites_array().copy()
+        indptr, indices = self.neighbors_csr()
+        ids = np.array([cell.id for cell in self.cells[3:]] or [self.cells[-1].id], dtype=np.int64)
+        boundary = self.boundary
+        x0, y0 = boundary.x_min, boundary.y_min
+        width, height = boundary.x_max - x0, boundary.y_max - y0
+        n = max(1, int(math.sqrt(len(ids) / 2)))
+
+        i = np.clip(((sites[ids, 0] - x0) * (n / width)).astype(np.int64), 0, n - 1)
+        j = np.clip(((sites[ids, 1] - y0) * (n / height)).astype(np.int64), 0, n - 1)
+        seeds = np.full((n, n), -1, dtype=np.int64)
+        seeds[j, i] = ids
+        while (seeds < 0).any():
+            for shifted in (np.roll(seeds, 1, 0), np.roll(seeds, -1, 0), np.roll(seeds, 1, 1), np.roll(seeds, -1, 1)):
+                seeds = np.where(seeds < 0, shifted, seeds)
+
+        self.locate_arrays = {"sites": sites, "indptr": indptr, "indices": indices.astype(np.int64),
+                              "seeds": seeds.ravel(), "grid": (n, x0, y0, width, height)}
+        return self.locate_arrays
+
+    def enable_locate_cache(self, capacity=65536, quantum=None):
+        """Mengaktifkan cache LRU untuk locate_many (kuantisasi default: 1/4096 lebar boundary)."""
+        if quantum is None:
+            quantum = (self.boundary.x_max - self.boundary.x_min) / 4096
+        self.locate_cache = LocateCache(capacity, quantum)
+        return self.locate_cache
+
+    def enable_metrics(self):
+        """Mengaktifkan cache metrik cell (luas, centroid, keliling, tetangga; lihat CellMetrics)."""
+        if self.metrics is None:
+            self.metrics = CellMetrics(self)
+        return self.metrics
+
+    def enable_edge_index(self):
+        """Mengaktifkan indeks spasial edge yang dipotong ke boundary (untuk query viewport, lihat EdgeIndex)."""
+        if self.edge_index is None:
+            self.edge_index = EdgeIndex(self)
+        return self.edge_index
+
+    def invalidate_caches(self, cell_ids=None):
+        """Membuang isi locate_cache dan menandai metrik, segitiga Delaunay, dan edge index cell yang
+        berubah sebagai dirty (semuanya jika 'cell_ids' None, misalnya setelah diagram dibangun ulang)."""
+        self.locate_arrays = None
+        if self.locate_cache is not None:
+            if cell_ids is None:
+                self.locate_cache.clear()
+            else:
+                self.locate_cache.invalidate(cell_ids)
+        if self.metrics is not None:
+            if cell_ids is None:
+                self.metrics.reset()
+            else:
+                self.metrics.mark_dirty(cell_ids)
+        if self.delaunay is not None:
+            if cell_ids is None:
+                self.delaunay.reset()
+            else:
+                self.delaunay.mark_dirty(cell_ids)
+        if self.edge_index is not None:
+            if cell_ids is None:
+                self.edge_index.reset()
+            else:
+                self.edge_index.mark_dirty(cell_ids)
+
+    def empty_circles(self):
+        """Mengembalikan lingkaran kosong dari setiap vertex voronoi di dalam boundary.
+
+        Setiap vertex voronoi adalah pusat lingkaran luar dari site-site cell yang
+        bertemu di vertex tersebut, sehingga lingkarannya pasti kosong."""
+        mesh = self.mesh
+
+        # cell-cell yang bertemu di setiap vertex
+        incident = {}
+        for h, cell_id in enumerate(mesh.face):
+            if cell_id >= 0:
+                incident.setdefault(mesh.origin[h], []).append(cell_id)
+
+        circles = []
+        centers = set()
+        for cell_ids in incident.values():
+            # exclude super triangle (3 cell pertama)
+            if len(cell_ids) < 3 or min(cell_ids) < 3:
+                continue
+
+            sites = [mesh.cells[i].site for i in sorted(cell_ids)[:3]]
+            circle = Geometry.circumcircle(*sites)
+            if circle is None or not self.boundary.contains(circle['center']):
+                continue
+
+            # site cocircular menghasilkan beberapa vertex di pusat yang sama (edge panjang nol)
+            key = (round(circle['center'].x, 6), round(circle['center'].y, 6))
+            if key not in centers:
+                centers.add(key)
+                circles.append(circle)
+
+        return circles
+
+    def largest_empty_circles(self):
+        """Mencari lingkaran kosong terbesar (tidak mengandung site lain) dari vertex voronoi."""
+        circles = self.empty_circles()
+        if not circles:
+            return []
+
+        # ambil semua circle dengan radius terbesar
+        max_radius = max(circle['radius'] for circle in circles)
+        return [circle for circle in circles if abs(circle['radius'] - max_radius) < Point.EPSILON]
+
+    def sites_array(self):
+        """Mengembalikan koordinat site sebagai array NumPy (n, 2), baris ke-i untuk cell dengan id i.
+
+        Id yang tidak terpakai berisi NaN. Untuk storage "compact" hasilnya view tanpa copy."""
+        import numpy as np
+
+        return self.mesh.as_numpy(self.mesh.site_xy, np.float64).reshape(-1, 2)
+
+    def vertices_array(self):
+        """Mengembalikan koordinat vertex sebagai array NumPy (m, 2) (view untuk storage "compact")."""
+        return self.mesh.arrays()["vertex_xy"]
+
+    def edges_array(self):
+        """Mengembalikan setiap edge voronoi satu kali sebagai array NumPy int32 (k, 4).
+
+        Kolomnya: vertex awal, vertex akhir, id cell, id cell tetangga (-1 untuk edge frame)."""
+        import numpy as np
+
+        arrays = self.mesh.arrays()
+        origin, twin, next_edge, face = arrays["origin"], arrays["twin"], arrays["next"], arrays["face"]
+
+        # satu half-edge per pasangan twin, edge frame selalu diambil
+        h = np.flatnonzero((face >= 0) & ((twin < 0) | (np.arange(len(face)) < twin)))
+        neighbor = np.where(twin[h] >= 0, face[np.maximum(twin[h], 0)], -1)
+        return np.column_stack((origin[h], origin[next_edge[h]], face[h], neighbor)).astype(np.int32)
+
+    def delaunay_triangles(self):
+        """Mengembalikan triangulasi Delaunay sebagai array NumPy int32 (t, 3) berisi id cell (CCW).
+
+        Segitiga yang menyentuh cell super triangle tidak disertakan. Hasilnya di-cache dan
+        setelah diagram berubah hanya cell di changed_cells yang dibaca ulang (lihat DelaunayCache)."""
+        if self.delaunay is None:
+            self.delaunay = DelaunayCache(self)
+        return self.delaunay.delaunay_triangles()
+
+    def delaunay_edges(self):
+        """Mengembalikan edge Delaunay sebagai array NumPy int32 (e, 2) berisi pasangan id cell (i < j)."""
+        if self.delaunay is None:
+            self.delaunay = DelaunayCache(self)
+        return self.delaunay.delaunay_edges()
+
+    def neighbors_csr(self):
+        """Mengembalikan graf ketetanggaan cell dalam format CSR (indptr, indices), urut sesuai ring.
+
+        Tetangga cell dengan id i adalah indices[indptr[i]:indptr[i + 1]]. Graf diambil dari
+        CellMetrics (diaktifkan jika belum, lihat enable_metrics), sehingga setelah diagram
+        berubah hanya baris cell yang berubah yang dihitung ulang."""
+        return self.enable_metrics().neighbors_csr()
+
+    def save(self, path):
+        """Menyimpan diagram ke file snapshot biner supaya bisa dimuat tanpa membangun ulang.
+
+        Isi file: header SNAPSHOT_HEADER (magic "VORS", versi, flag, ukuran boundary, id_cell,
+        jumlah vertex, half-edge, slot cell, cell aktif, dan slot kosong), lalu kolom-kolom
+        SNAPSHOT_COLUMNS berurutan tanpa jarak: vertex_xy dan site_xy float64, kolom half-edge,
+        cell_edge, urutan id cell aktif, dan daftar slot kosong int32. Semua little-endian."""
+        mesh = self.mesh
+        columns = {name: getattr(mesh, name) for name in mesh.COLUMNS}
+        columns["order"] = [cell.id for cell in self.cells]
+        columns["free_vertices"] = mesh.free_vertices
+        columns["free_edges"] = mesh.free_edges
+
+        with open(path, "wb") as file:
+            file.write(self.SNAPSHOT_HEADER.pack(
+                self.SNAPSHOT_MAGIC, self.SNAPSHOT_VERSION, 0, self.boundary.x_max, self.id_cell,
+                len(mesh.vertex_xy) // 2, len(mesh.origin), len(mesh.cells), len(self.cells),
+                len(mesh.free_vertices), len(mesh.free_edges)))
+            for name, typecode in self.SNAPSHOT_COLUMNS:
+                column = array(typecode, columns[name])
+                if sys.byteorder == "big":
+                    column.byteswap()
+                column.tofile(file)
+
+    @classmethod
+    def load(cls, path, use_mmap=True, **kwargs):
+        """Memuat diagram dari file snapshot (lihat save) tanpa menghitung ulang bisector.
+
+        Dengan 'use_mmap', kolom mesh dibaca langsung dari memory map file (read-only) sehingga
+        diagram langsung bisa dipakai untuk query; kolom baru disalin saat diagram pertama
+        kali diubah. Storage hasilnya selalu "compact"; argumen lain diteruskan ke konstruktor."""
+        kwargs["storage"] = "compact"
+        with open(path, "rb") as file:
+            mapped = use_mmap and sys.byteorder == "little"
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if mapped else file.read()
+
+        view = memoryview(data)
+        if len(view) < cls.SNAPSHOT_HEADER.size:
+            raise ValueError(f"{path} is not a voronoi snapshot")
+        magic, version, flags, size, id_cell, *counts = cls.SNAPSHOT_HEADER.unpack_from(view)
+        if magic != cls.SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a voronoi snapshot")
+        if version != cls.SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        n_vertices, n_edges, n_slots, n_cells, n_free_vertices, n_free_edges = counts
+        lengths = (2 * n_vertices, 2 * n_slots, n_edges, n_edges, n_edges, n_edges, n_slots,
+                   n_cells, n_free_vertices, n_free_edges)
+        columns = {}
+        offset = cls.SNAPSHOT_HEADER.size
+        for (name, typecode), length in zip(cls.SNAPSHOT_COLUMNS, lengths):
+            end = offset + length * (8 if typecode == "d" else 4)
+            if end > len(view):
+                raise ValueError(f"Truncated voronoi snapshot: {path}")
+            if mapped:
+                columns[name] = view[offset:end].cast(typecode)
+            else:
+                columns[name] = array(typecode)
+                columns[name].frombytes(view[offset:end])
+                if sys.byteorder == "big":
+                    columns[name].byteswap()
+            offset = end
+
+        diagram = cls(size, **kwargs)
+        mesh = HalfEdgeMesh(diagram.init_bound, "compact")
+        for name in mesh.COLUMNS:
+            setattr(mesh, name, columns[name])
+        mesh.free_vertices = columns["free_vertices"].tolist()
+        mesh.free_edges = columns["free_edges"].tolist()
+        mesh.source = data if mapped else None
+
+        # objek Cell hanya untuk slot yang terpakai (slot kosong berisi NaN)
+        mesh.cells = [None] * n_slots
+        sites = columns["site_xy"].tolist()
+        for cell_id in range(n_slots):
+            x, y = sites[2 * cell_id], sites[2 * cell_id + 1]
+            if x == x:
+                cell = Cell(Point(x, y), cell_id)
+                cell.mesh = mesh
+                mesh.cells[cell_id] = cell
+
+        diagram.mesh = mesh
+        diagram.cells = [mesh.cells[cell_id] for cell_id in columns["order"].tolist()]
+        diagram.positions = {cell.id: k for k, cell in enumerate(diagram.cells)}
+        diagram.id_cell = id_cell
+        diagram.changed_cells = {cell.id for cell in diagram.cells}
+        diagram.locator.attach(diagram)
+        return diagram
+
     def get_cells(self):
         """Mengembalikan semua cell yang ada di diagram Voronoi."""
         return self.cells
 
+    def get_cell(self, cell_id):
+        """Mengembalikan cell dengan id tertentu, atau None jika cell tsb tidak ada."""
+        if 0 <= cell_id < len(self.mesh.cells):
+            return self.mesh.cells[cell_id]
+        return None
+
     def get_size(self):
         """Mendapatkan ukuran dari bounding box."""
         return self.boundary.x_max
@@ -181,5 +1206,9 @@ class VoronoiDiagram:
     def clear(self):
         """Menghapus semua cell yang ada dan menginisialisasi ulang diagram Voronoi."""
         self.cells = []
+        self.positions = {} # id cell -> indeks di self.cells
+        self.changed_cells = set()
         self.id_cell = 0
-        self.setup()
\ No newline at end of file
+        self.setup()
+        self.locator.attach(self)
+        self.invalidate_caches()
\ No newline at end of file